@@ -0,0 +1,124 @@
+import os
+import re
+import time
+import zlib
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is listed in requirements.txt
+    np = None
+
+from logging_config import get_logger, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Class order is part of the weights file format; append new labels at the end only
+DOCUMENT_CLASSES = ["resume", "offer_letter", "invoice", "transcript", "other"]
+NUM_HASH_FEATURES = 2 ** 14
+MAX_CLASSIFIER_CHARS = 5000
+CLASSIFIER_CONFIDENCE_THRESHOLD = 0.85  # accept a resume locally at or above this confidence
+CLASSIFIER_REJECT_THRESHOLD = 0.95  # rejecting a real resume costs more than an LLM call, so be surer
+CLASSIFIER_WEIGHTS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "document_classifier.npy"
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#.]*")
+
+# Loaded lazily; False means "tried and not available" so the file is only checked once
+_weights = None
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokenizer shared by training and inference"""
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text[:MAX_CLASSIFIER_CHARS].lower())
+
+
+def extract_features(text: str):
+    """
+    Turn a document into a hashed bag of unigrams and bigrams.
+
+    Uses crc32 rather than hash() so feature indices are stable across processes.
+    Returns a float32 vector of length NUM_HASH_FEATURES + 1 (last slot is the bias term).
+    """
+    tokens = tokenize(text)
+    features = np.zeros(NUM_HASH_FEATURES + 1, dtype=np.float32)
+
+    grams = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+    for gram in grams:
+        features[zlib.crc32(gram.encode("utf-8")) % NUM_HASH_FEATURES] += 1.0
+
+    # Sublinear term frequency, then L2 normalization so long documents don't dominate
+    np.log1p(features[:NUM_HASH_FEATURES], out=features[:NUM_HASH_FEATURES])
+    norm = np.linalg.norm(features[:NUM_HASH_FEATURES])
+    if norm > 0:
+        features[:NUM_HASH_FEATURES] /= norm
+    features[NUM_HASH_FEATURES] = 1.0
+    return features
+
+
+def softmax(scores):
+    """Numerically stable softmax over the last axis"""
+    shifted = scores - np.max(scores, axis=-1, keepdims=True)
+    exp_scores = np.exp(shifted)
+    return exp_scores / np.sum(exp_scores, axis=-1, keepdims=True)
+
+
+def load_weights(path: str = CLASSIFIER_WEIGHTS_PATH):
+    """Load classifier weights, returning None when numpy or the weights file is unavailable"""
+    global _weights
+
+    if _weights is not None:
+        return _weights if _weights is not False else None
+
+    if np is None:
+        logger.warning("NumPy not available, local document classifier disabled")
+        _weights = False
+        return None
+
+    if not os.path.exists(path):
+        logger.warning(f"Document classifier weights not found at {path}, local classification disabled")
+        _weights = False
+        return None
+
+    try:
+        weights = np.load(path, allow_pickle=False)
+        expected_shape = (len(DOCUMENT_CLASSES), NUM_HASH_FEATURES + 1)
+        if weights.shape != expected_shape:
+            logger.error(f"Document classifier weights have shape {weights.shape}, expected {expected_shape}")
+            _weights = False
+            return None
+
+        _weights = weights.astype(np.float32)
+        logger.info(f"Loaded document classifier weights from {path}")
+        return _weights
+
+    except Exception as e:
+        logger.error(f"Failed to load document classifier weights: {str(e)}", exc_info=True)
+        _weights = False
+        return None
+
+
+def classify_document(text: str) -> Optional[Tuple[str, float]]:
+    """
+    Classify a document locally.
+
+    Returns (document_type, confidence) or None when the classifier is unavailable.
+    """
+    weights = load_weights()
+    if weights is None or not text:
+        return None
+
+    start_time = time.time()
+    probabilities = softmax(weights @ extract_features(text))
+    best_index = int(np.argmax(probabilities))
+    document_type = DOCUMENT_CLASSES[best_index]
+    confidence = float(probabilities[best_index])
+
+    duration = time.time() - start_time
+    log_performance("Local document classification", duration, f"Predicted {document_type} with confidence {confidence:.3f}")
+
+    return document_type, confidence
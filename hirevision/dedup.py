@@ -0,0 +1,119 @@
+"""
+Deduplication of background task submissions.
+
+A double click, a browser retry or a resubmitted form used to create a second record
+and a second message, paying for the same LLM call twice. Views derive a key from the
+user and the submitted inputs and claim it with an atomic cache.add (SET NX on the
+Redis cache) before creating anything; a request that loses the claim gets the record
+the winner created instead.
+"""
+import hashlib
+import json
+import time
+from typing import Any, Optional
+
+from utils import hash_text
+from logging_config import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+SUBMISSION_DEDUP_WINDOW = 10 * 60  # identical submissions within this window share one record
+SUBMISSION_CLAIM_TTL = 30  # a claim whose request died before creating a record expires quickly
+SUBMISSION_CLAIM_WAIT = 2.0  # how long a duplicate waits for the winning request's record id
+JOB_CLAIM_TTL = 2 * 60  # a one-off background job is enqueued at most once per this window
+_CLAIM_PENDING = "__pending__"
+
+
+def file_digest(uploaded_file) -> str:
+    """SHA-256 of an uploaded file, leaving it rewound for saving"""
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    uploaded_file.seek(0)
+    return digest.hexdigest()
+
+
+def submission_key(kind: str, user_id: Any, *inputs: Any) -> str:
+    """Dedup key for a submission of `kind` by a user with the given inputs"""
+    parts = [inp if isinstance(inp, str) else json.dumps(inp, sort_keys=True, default=str) for inp in inputs]
+    return f"task_submission:{kind}:{user_id}:{hash_text(*parts)}"
+
+
+def claim_submission(key: str) -> Optional[str]:
+    """
+    Claim a submission key.
+
+    Returns None when this request owns the submission (or the cache is unavailable, in
+    which case dedup is skipped), otherwise the id of the record an earlier identical
+    submission created.
+    """
+    try:
+        from django.core.cache import cache
+
+        if cache.add(key, _CLAIM_PENDING, SUBMISSION_CLAIM_TTL):
+            logger.debug(f"Claimed submission key: {key}")
+            return None
+
+        # The winner may still be creating its record; wait briefly for the id
+        deadline = time.time() + SUBMISSION_CLAIM_WAIT
+        value = cache.get(key)
+        while value == _CLAIM_PENDING and time.time() < deadline:
+            time.sleep(0.1)
+            value = cache.get(key)
+        if value and value != _CLAIM_PENDING:
+            logger.info(f"Duplicate submission for key {key}, existing record: {value}")
+            return value
+        logger.warning(f"Submission key {key} still unresolved after {SUBMISSION_CLAIM_WAIT}s, submitting anyway")
+        return None
+    except Exception as e:
+        logger.warning(f"Submission dedup unavailable for key {key}: {str(e)}")
+        return None
+
+
+def record_submission(key: str, record_id: Any) -> None:
+    """Point a claimed key at the record created for it for the rest of the dedup window"""
+    try:
+        from django.core.cache import cache
+
+        cache.set(key, str(record_id), SUBMISSION_DEDUP_WINDOW)
+    except Exception as e:
+        logger.warning(f"Could not record submission {record_id} for key {key}: {str(e)}")
+
+
+def release_submission(key: str) -> None:
+    """Drop a claim whose submission failed so the user can retry straight away"""
+    try:
+        from django.core.cache import cache
+
+        cache.delete(key)
+    except Exception as e:
+        logger.warning(f"Could not release submission key {key}: {str(e)}")
+
+
+def find_duplicate_submission(key: str, model, user):
+    """
+    Claim `key` and return the user's existing record for it, if any.
+
+    Records that failed are not reused: the caller submits again and record_submission
+    repoints the key at the new record.
+    """
+    existing_id = claim_submission(key)
+    if not existing_id:
+        return None
+    return model.objects.filter(id=existing_id, user=user).exclude(task_status='failed').first()
+
+
+def claim_job(key: str, ttl: int = JOB_CLAIM_TTL) -> bool:
+    """
+    Claim a one-off background job (e.g. compiling a missing PDF) that is not tied to a new record.
+
+    Returns True when this request should enqueue it; repeated requests within `ttl` get False.
+    """
+    try:
+        from django.core.cache import cache
+
+        return cache.add(f"task_job:{key}", 1, ttl)
+    except Exception as e:
+        logger.warning(f"Job dedup unavailable for key {key}: {str(e)}")
+        return True
@@ -0,0 +1,204 @@
+import os
+import re
+from typing import Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+from logging_config import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    """The Range header asked for bytes beyond the end of the file"""
+
+
+def file_etag(stat_result: os.stat_result) -> str:
+    """Strong ETag from size and mtime; publishing a new file always changes the mtime"""
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def parse_range_header(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single 'bytes=start-end' range into an inclusive (start, end) pair.
+
+    Returns None for malformed or multi-range headers, which are answered with the full
+    file as RFC 9110 allows. Raises RangeNotSatisfiable for ranges past the end of the file.
+    """
+    match = _RANGE_PATTERN.match(header.strip())
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+
+    start, end = match.group(1), match.group(2)
+    if not start:
+        # Suffix range: the last N bytes
+        length = int(end)
+        if length == 0:
+            raise RangeNotSatisfiable(header)
+        return max(0, size - length), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    if end < start:
+        return None
+    return start, end
+
+
+def _if_range_matches(request, etag: str, last_modified: int) -> bool:
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    if_range_date = parse_http_date_safe(if_range)
+    return if_range_date is not None and if_range_date >= last_modified
+
+
+def _iter_file_range(path: str, start: int, length: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _sendfile_location(path: str) -> Optional[str]:
+    """Header value for SENDFILE_BACKEND, or None if the file cannot be offloaded"""
+    backend = getattr(settings, "SENDFILE_BACKEND", None)
+    if not backend:
+        return None
+
+    abs_path = os.path.abspath(path)
+    if backend == "x-sendfile":
+        return abs_path
+    if backend == "x-accel-redirect":
+        root = os.path.abspath(str(getattr(settings, "SENDFILE_ROOT", settings.BASE_DIR)))
+        if os.path.commonpath([root, abs_path]) != root:
+            logger.warning(f"Cannot offload {abs_path}: outside SENDFILE_ROOT {root}")
+            return None
+        prefix = getattr(settings, "SENDFILE_URL_PREFIX", "/protected/").rstrip("/")
+        return f"{prefix}/{os.path.relpath(abs_path, root).replace(os.sep, '/')}"
+
+    logger.warning(f"Unknown SENDFILE_BACKEND '{backend}', streaming instead")
+    return None
+
+
+def _requested_range(request, etag: str, last_modified: int, size: int) -> Tuple[Optional[Tuple[int, int]], Optional[HttpResponse]]:
+    """The byte range to send (None for the whole body), or a 416 response to return as is"""
+    range_header = request.META.get("HTTP_RANGE")
+    if not range_header or request.method not in ("GET", "HEAD") or not _if_range_matches(request, etag, last_modified):
+        return None, None
+    try:
+        return parse_range_header(range_header, size), None
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return None, response
+
+
+def _finish_response(response: HttpResponse, etag: str, mtime: float, public: bool, max_age: int) -> HttpResponse:
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(mtime)
+    if public:
+        patch_cache_control(response, public=True, max_age=max_age)
+    else:
+        # Revalidate on every use; unchanged files cost a 304 instead of a full transfer
+        patch_cache_control(response, private=True, no_cache=True, max_age=max_age)
+    return response
+
+
+def serve_file(
+    request,
+    path: str,
+    filename: str,
+    content_type: str = "application/pdf",
+    as_attachment: bool = False,
+    public: bool = False,
+    max_age: int = 0,
+) -> HttpResponse:
+    """
+    Serve a file from disk without reading it into memory.
+
+    Sends ETag/Last-Modified validators and answers conditional GETs with 304, honours
+    single byte ranges (206/416), and hands the transfer to the front-end server when
+    SENDFILE_BACKEND is configured. Raises OSError if the file cannot be opened.
+    """
+    stat_result = os.stat(path)
+    etag = file_etag(stat_result)
+    last_modified = int(stat_result.st_mtime)
+    size = stat_result.st_size
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        sendfile_location = _sendfile_location(path)
+        if sendfile_location:
+            # The web server streams the body and handles Range requests itself
+            response = HttpResponse(content_type=content_type)
+            header = "X-Accel-Redirect" if settings.SENDFILE_BACKEND == "x-accel-redirect" else "X-Sendfile"
+            response[header] = sendfile_location
+        else:
+            byte_range, error_response = _requested_range(request, etag, last_modified, size)
+            if error_response is not None:
+                return error_response
+
+            if byte_range:
+                start, end = byte_range
+                length = end - start + 1
+                response = StreamingHttpResponse(_iter_file_range(path, start, length), status=206, content_type=content_type)
+                response["Content-Range"] = f"bytes {start}-{end}/{size}"
+                response["Content-Length"] = str(length)
+            else:
+                response = FileResponse(open(path, "rb"), content_type=content_type)
+                response.block_size = DOWNLOAD_CHUNK_SIZE
+            response["Accept-Ranges"] = "bytes"
+
+        response["Content-Disposition"] = content_disposition_header(as_attachment, filename)
+
+    return _finish_response(response, etag, stat_result.st_mtime, public, max_age)
+
+
+def serve_bytes(
+    request,
+    content: bytes,
+    filename: str,
+    etag: str,
+    mtime: float,
+    content_type: str = "application/pdf",
+    as_attachment: bool = False,
+    public: bool = False,
+    max_age: int = 0,
+) -> HttpResponse:
+    """
+    Serve content already held in memory with the same validators, 304s, byte ranges and
+    cache headers as serve_file.
+    """
+    last_modified = int(mtime)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        byte_range, error_response = _requested_range(request, etag, last_modified, len(content))
+        if error_response is not None:
+            return error_response
+
+        if byte_range:
+            start, end = byte_range
+            response = HttpResponse(content[start:end + 1], status=206, content_type=content_type)
+            response["Content-Range"] = f"bytes {start}-{end}/{len(content)}"
+        else:
+            response = HttpResponse(content, content_type=content_type)
+        response["Accept-Ranges"] = "bytes"
+        response["Content-Disposition"] = content_disposition_header(as_attachment, filename)
+
+    return _finish_response(response, etag, mtime, public, max_age)
@@ -3,8 +3,9 @@ from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib.auth import authenticate
 from .models import ResumeAnalysis, LearningPath, ResumeBuilder, User, Thread, Comment, Message, Conversation
 import time
-import json
 from logging_config import get_logger, log_function_call, log_performance
+from latex_templates import DEFAULT_THEME
+from resume_ir import build_resume_ir, validate_resume_ir
 
 # Initialize logger for forms
 logger = get_logger('forms')
@@ -202,12 +203,23 @@ class LearningPathForm(forms.ModelForm):
 class ResumeBuilderForm(forms.ModelForm):
     """Form for resume builder with improved validation"""
     
+    # Expected Python type of each JSON section after JSONField parsing
+    JSON_FIELD_TYPES = [
+        ('education', list, 'a list'),
+        ('experience', list, 'a list'),
+        ('projects', list, 'a list'),
+        ('skills', dict, 'a dictionary'),
+        ('research_papers', list, 'a list'),
+        ('achievements', list, 'a list'),
+        ('others', list, 'a list'),
+    ]
+    
     class Meta:
         model = ResumeBuilder
         fields = [
             'name', 'email', 'phone', 'linkedin', 'github',
             'education', 'experience', 'projects', 'skills',
-            'research_papers', 'achievements', 'others'
+            'research_papers', 'achievements', 'others', 'theme'
         ]
         exclude = ['user']  # User will be set automatically
         widgets = {
@@ -237,7 +249,8 @@ class ResumeBuilderForm(forms.ModelForm):
             'skills': forms.HiddenInput(),  # Hidden field for JSON data
             'research_papers': forms.HiddenInput(),  # Hidden field for JSON data
             'achievements': forms.HiddenInput(),  # Hidden field for JSON data
-            'others': forms.HiddenInput()  # Hidden field for JSON data
+            'others': forms.HiddenInput(),  # Hidden field for JSON data
+            'theme': forms.Select(attrs={'class': 'form-input'})
         }
     
     def __init__(self, *args, **kwargs):
@@ -249,6 +262,7 @@ class ResumeBuilderForm(forms.ModelForm):
         self.fields['phone'].required = False
         self.fields['linkedin'].required = False
         self.fields['github'].required = False
+        self.fields['theme'].required = False
     
     @log_function_call
     def clean(self):
@@ -271,51 +285,40 @@ class ResumeBuilderForm(forms.ModelForm):
             logger.warning("Resume builder validation failed: insufficient email")
             raise forms.ValidationError("Please provide a valid email address.")
         
-        # Validate JSON fields
-        json_fields = {
-            'education': education,
-            'projects': projects,
-            'skills': skills
-        }
+        # Optional sections default to empty lists
+        for field_name in ('experience', 'research_papers', 'achievements', 'others'):
+            if not cleaned_data.get(field_name):
+                cleaned_data[field_name] = []
         
-        for field_name, field_value in json_fields.items():
-            if field_value:
-                try:
-                    if isinstance(field_value, str):
-                        parsed_data = json.loads(field_value)
-                        if field_name == 'education' and not isinstance(parsed_data, list):
-                            raise forms.ValidationError(f"{field_name.title()} must be a list.")
-                        elif field_name == 'projects' and not isinstance(parsed_data, list):
-                            raise forms.ValidationError(f"{field_name.title()} must be a list.")
-                        elif field_name == 'skills' and not isinstance(parsed_data, dict):
-                            raise forms.ValidationError(f"{field_name.title()} must be a dictionary.")
-                        logger.info(f"{field_name.title()} JSON validation successful")
-                except json.JSONDecodeError as e:
-                    logger.error(f"{field_name.title()} JSON validation failed: {str(e)}")
-                    raise forms.ValidationError(f"{field_name.title()} must be in valid JSON format.")
+        # JSONField has already parsed the hidden inputs; check their shapes
+        for field_name, expected_type, type_name in self.JSON_FIELD_TYPES:
+            value = cleaned_data.get(field_name)
+            if value and not isinstance(value, expected_type):
+                logger.error(f"{field_name.title()} JSON validation failed: expected {type_name}, got {type(value).__name__}")
+                raise forms.ValidationError(f"{field_name.replace('_', ' ').title()} must be {type_name}.")
         
         # Validate that we have at least education and projects
-        if not education or (isinstance(education, str) and education.strip() == '[]'):
+        if not education:
             logger.warning("Resume builder validation failed: no education provided")
             raise forms.ValidationError("Please provide at least one education entry.")
         
-        if not projects or (isinstance(projects, str) and projects.strip() == '[]'):
+        if not projects:
             logger.warning("Resume builder validation failed: no projects provided")
             raise forms.ValidationError("Please provide at least one project.")
         
-        if not skills or (isinstance(skills, str) and skills.strip() == '{}'):
+        if not skills:
             logger.warning("Resume builder validation failed: no skills provided")
             raise forms.ValidationError("Please provide your skills.")
         
-        # Set default values for optional fields if they're empty
-        if not cleaned_data.get('research_papers') or (isinstance(cleaned_data.get('research_papers'), str) and cleaned_data.get('research_papers').strip() == '[]'):
-            cleaned_data['research_papers'] = '[]'
-        
-        if not cleaned_data.get('achievements') or (isinstance(cleaned_data.get('achievements'), str) and cleaned_data.get('achievements').strip() == '[]'):
-            cleaned_data['achievements'] = '[]'
+        # Build the typed resume once here; generation uses it as-is, so problems such as
+        # entries missing required parts are reported now rather than by the queued task
+        self.resume_ir = build_resume_ir(cleaned_data)
+        for field_name, message in validate_resume_ir(self.resume_ir):
+            logger.warning(f"Resume builder validation failed: {field_name}: {message}")
+            self.add_error(None, message)
         
-        if not cleaned_data.get('others') or (isinstance(cleaned_data.get('others'), str) and cleaned_data.get('others').strip() == '[]'):
-            cleaned_data['others'] = '[]'
+        if not cleaned_data.get('theme'):
+            cleaned_data['theme'] = DEFAULT_THEME
         
         duration = time.time() - start_time
         log_performance("Resume builder form validation", duration, f"Name: {name}")
@@ -0,0 +1,52 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from logging_config import get_logger
+
+# Initialize logger
+logger = get_logger('commands')
+
+DEFAULT_DOCUMENTS = [f"sample_resume.tex={os.path.join('pdfs', 'sample.pdf')}"]
+
+
+class Command(BaseCommand):
+    help = "Compile LaTeX resumes in batched pdflatex runs (run on deploy to regenerate the sample resume)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'documents',
+            nargs='*',
+            default=DEFAULT_DOCUMENTS,
+            help='source.tex or source.tex=output.pdf (default output: source name with .pdf in pdfs/)',
+        )
+
+    def handle(self, *args, **options):
+        from pdf_generator import generate_pdfs_from_latex_batch, publish_pdf
+
+        jobs = []
+        for document in options['documents']:
+            source, _, output = document.partition('=')
+            if not output:
+                output = os.path.join('pdfs', f"{os.path.splitext(os.path.basename(source))[0]}.pdf")
+            try:
+                with open(source, encoding='utf-8') as f:
+                    jobs.append((source, output, f.read()))
+            except OSError as e:
+                raise CommandError(f"Cannot read {source}: {e}")
+
+        logger.info(f"Compiling {len(jobs)} LaTeX documents in batch")
+        results = generate_pdfs_from_latex_batch([latex for _, _, latex in jobs])
+
+        failed = 0
+        for (source, output, _), pdf_path in zip(jobs, results):
+            if pdf_path:
+                publish_pdf(pdf_path, output)
+                self.stdout.write(f"{source} -> {output}")
+            else:
+                failed += 1
+                self.stderr.write(f"{source}: PDF generation failed")
+
+        if failed:
+            raise CommandError(f"{failed} of {len(jobs)} documents failed to compile")
+        self.stdout.write(self.style.SUCCESS(f"Compiled {len(jobs)} documents"))
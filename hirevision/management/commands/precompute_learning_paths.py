@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from learning_path_library import LIBRARY_SIZE
+from logging_config import get_logger
+
+# Initialize logger
+logger = get_logger('commands')
+
+
+class Command(BaseCommand):
+    help = "Pre-generate canonical learning paths for the most requested dream roles (run from cron)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=LIBRARY_SIZE, help='Number of most requested roles to pre-generate')
+        parser.add_argument('--sync', action='store_true', help='Run in this process instead of enqueueing a Dramatiq task')
+
+    def handle(self, *args, **options):
+        from hirevision.tasks import precompute_learning_path_library_task
+
+        top_n = options['top']
+        if options['sync']:
+            logger.info(f"Running learning path library precompute synchronously for top {top_n} roles")
+            precompute_learning_path_library_task.fn(top_n)
+            self.stdout.write(self.style.SUCCESS(f"Learning path library refreshed for top {top_n} roles"))
+        else:
+            message = precompute_learning_path_library_task.send(top_n)
+            logger.info(f"Enqueued learning path library precompute: {message.message_id}")
+            self.stdout.write(self.style.SUCCESS(f"Enqueued learning path library precompute ({message.message_id})"))
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.4 on 2026-10-19 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hirevision", "0011_threadlike"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resumebuilder",
+            name="theme",
+            field=models.CharField(
+                choices=[("classic", "Classic"), ("compact", "Compact"), ("modern", "Modern")],
+                default="classic",
+                max_length=20,
+            ),
+        ),
+    ]
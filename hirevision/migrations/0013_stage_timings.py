@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-19 14:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hirevision", "0012_resumebuilder_theme"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="learningpath",
+            name="stage_timings",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="resumeanalysis",
+            name="stage_timings",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="resumebuilder",
+            name="stage_timings",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
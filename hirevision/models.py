@@ -5,6 +5,7 @@ import json
 import uuid
 import time
 from logging_config import get_logger, log_function_call, log_performance
+from latex_templates import THEME_CHOICES, DEFAULT_THEME
 
 # Initialize logger for models
 logger = get_logger('models')
@@ -82,6 +83,7 @@ class ResumeAnalysis(models.Model):
         default='pending'
     )
     task_error = models.TextField(blank=True, null=True)
+    stage_timings = models.JSONField(default=list, blank=True)  # per-stage start/end/duration of the last run
     
     ats_score = models.IntegerField(null=True, blank=True)
     score_explanation = models.TextField(blank=True)
@@ -138,6 +140,7 @@ class LearningPath(models.Model):
         default='pending'
     )
     task_error = models.TextField(blank=True, null=True)
+    stage_timings = models.JSONField(default=list, blank=True)  # per-stage start/end/duration of the last run
     
     role_analysis = models.TextField(blank=True)
     skills_gap = models.JSONField(default=list)
@@ -196,6 +199,7 @@ class ResumeBuilder(models.Model):
         default='pending'
     )
     task_error = models.TextField(blank=True, null=True)
+    stage_timings = models.JSONField(default=list, blank=True)  # per-stage start/end/duration of the last run
     
     education = models.JSONField(default=list)
     experience = models.JSONField(default=list)
@@ -206,6 +210,7 @@ class ResumeBuilder(models.Model):
     others = models.JSONField(default=list)
     latex_content = models.TextField(blank=True)
     pdf_file = models.FileField(upload_to='generated_resumes/', blank=True)
+    theme = models.CharField(max_length=20, choices=THEME_CHOICES, default=DEFAULT_THEME)
     
     class Meta:
         verbose_name_plural = "Resume Builders"
@@ -0,0 +1,134 @@
+"""
+Stage-level progress for background tasks.
+
+Actors report named stages with start/end timestamps. Live progress goes to the shared
+Redis cache so the status endpoints can show it while a task runs. When the task
+finishes, the timings are persisted on the record's stage_timings field for latency
+analysis.
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from utils import get_cached_result, set_cached_result
+from logging_config import get_logger, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+PROGRESS_TTL = 24 * 60 * 60  # live progress outlives any task; finished tasks read the record
+
+# Stages each task kind reports, in order
+TASK_STAGES = {
+    "resume_analysis": ["extract", "classify", "analyze", "persist"],
+    "learning_path": ["lookup", "analyze", "persist"],
+    "resume_builder": ["build", "compile", "store"],
+}
+
+
+def progress_key(kind: str, record_id: Any) -> str:
+    return f"task_progress:{kind}:{record_id}"
+
+
+class TaskProgress:
+    """Stage reporter for one run of one actor"""
+
+    def __init__(self, kind: str, model, record_id: Any):
+        self.kind = kind
+        self.model = model
+        self.record_id = str(record_id)
+        self.stages: List[Dict[str, Any]] = []
+
+    @classmethod
+    def load(cls, kind: str, model, record_id: Any) -> "TaskProgress":
+        """Continue the stage list of a task whose stages run in separate actors (pipelines)"""
+        progress = cls(kind, model, record_id)
+        live = get_cached_result(progress_key(kind, record_id))
+        if live:
+            progress.stages = live["stages"]
+        return progress
+
+    def _current(self) -> Optional[Dict[str, Any]]:
+        if self.stages and self.stages[-1]["ended_at"] is None:
+            return self.stages[-1]
+        return None
+
+    def _publish(self) -> None:
+        set_cached_result(
+            progress_key(self.kind, self.record_id),
+            {"stages": self.stages, "updated_at": time.time()},
+            PROGRESS_TTL,
+        )
+
+    def start_stage(self, name: str) -> None:
+        """Begin a stage, ending the previous one if it is still open"""
+        if self._current() is not None:
+            self.end_stage()
+        self.stages.append({"name": name, "status": "running", "started_at": time.time(), "ended_at": None, "duration": None})
+        logger.debug(f"{self.kind} {self.record_id}: stage '{name}' started")
+        self._publish()
+
+    def end_stage(self, status: str = "completed") -> None:
+        """End the open stage, if any"""
+        entry = self._current()
+        if entry is None:
+            return
+        entry["ended_at"] = time.time()
+        entry["duration"] = round(entry["ended_at"] - entry["started_at"], 4)
+        entry["status"] = status
+        log_performance(f"{self.kind} stage {entry['name']}", entry["duration"], f"{self.record_id}: {status}")
+        self._publish()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Context manager around a stage; an exception marks it failed"""
+        self.start_stage(name)
+        try:
+            yield
+        except Exception:
+            self.end_stage("failed")
+            raise
+        self.end_stage()
+
+    def persist(self) -> None:
+        """
+        Store the stage timings on the record.
+
+        Called once when the actor exits; a stage still open at that point was left by
+        an early return or an exception and is recorded as failed.
+        """
+        if not self.stages:
+            return
+        self.end_stage("failed")
+        try:
+            self.model.objects.filter(pk=self.record_id).update(stage_timings=self.stages)
+        except Exception as e:
+            logger.warning(f"Could not persist stage timings for {self.kind} {self.record_id}: {str(e)}")
+
+
+def get_progress(kind: str, record) -> Dict[str, Any]:
+    """
+    Progress payload for a status endpoint.
+
+    Prefers the live entry in the cache and falls back to the timings persisted on the
+    record once the cache entry has expired.
+    """
+    live = get_cached_result(progress_key(kind, record.id))
+    stages = live["stages"] if live else (record.stage_timings or [])
+    total = len(TASK_STAGES.get(kind, [])) or len(stages)
+    # A retried stage appears once per attempt; count it once
+    completed = len({stage["name"] for stage in stages if stage["status"] == "completed"})
+    current = next((stage["name"] for stage in reversed(stages) if stage["status"] == "running"), None)
+
+    if record.task_status == "completed":
+        percent = 100
+    else:
+        percent = int(100 * min(completed, total) / total) if total else 0
+
+    return {
+        "stage": current,
+        "completed_stages": completed,
+        "total_stages": total,
+        "percent": percent,
+        "stages": stages,
+    }
@@ -0,0 +1,58 @@
+"""
+Dramatiq queues and worker pools.
+
+Kept free of Django imports so start_workers.py can read the pool layout without
+configuring Django; settings are only consulted when Django is already configured.
+"""
+import os
+
+# Queues per workload class
+LLM_QUEUE = "llm"  # I/O-bound: waits on OpenRouter, cheap on CPU
+COMPILE_QUEUE = "compile"  # CPU-bound: PDF text extraction, pdflatex / ReportLab rendering
+MAINTENANCE_QUEUE = "maintenance"  # bulk and periodic jobs nobody is waiting on
+
+
+def _priority(name: str, default: int) -> int:
+    """settings.DRAMATIQ_QUEUE_PRIORITIES[name] when Django is configured, else the default"""
+    try:
+        from django.conf import settings
+
+        return int(getattr(settings, "DRAMATIQ_QUEUE_PRIORITIES", {}).get(name, default))
+    except Exception:
+        return default
+
+
+# Dramatiq runs lower numbers first among messages a worker has already fetched
+PRIORITY_INTERACTIVE = _priority("interactive", 0)  # a user is polling the status endpoint
+PRIORITY_BACKGROUND = _priority("background", 50)  # follow-up work for an interactive request
+PRIORITY_BULK = _priority("bulk", 100)  # cron and deploy-time jobs
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+# One worker pool per queue class. Threads suit the LLM queue (they mostly wait on the
+# network); compile work gets a process per compile so slow TeX runs use separate cores
+# without a GIL or a shared compile pool between them. Override with
+# HIREVISION_<POOL>_PROCESSES / HIREVISION_<POOL>_THREADS.
+WORKER_POOLS = {
+    "llm": {
+        "queues": [LLM_QUEUE],
+        "processes": _env_int("HIREVISION_LLM_PROCESSES", 1),
+        "threads": _env_int("HIREVISION_LLM_THREADS", 16),
+    },
+    "compile": {
+        "queues": [COMPILE_QUEUE],
+        "processes": _env_int("HIREVISION_COMPILE_PROCESSES", max(1, (os.cpu_count() or 2) // 2)),
+        "threads": _env_int("HIREVISION_COMPILE_THREADS", 1),
+    },
+    "maintenance": {
+        "queues": [MAINTENANCE_QUEUE],
+        "processes": _env_int("HIREVISION_MAINTENANCE_PROCESSES", 1),
+        "threads": _env_int("HIREVISION_MAINTENANCE_THREADS", 2),
+    },
+}
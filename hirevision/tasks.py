@@ -1,7 +1,7 @@
 import os
 import django
 import dramatiq
-import json
+from dramatiq import pipeline
 import time
 from typing import Dict, Any
 
@@ -9,12 +9,24 @@ from typing import Dict, Any
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hirevision_django.settings')
 django.setup()
 
+from django.conf import settings
 from django.core.files.base import ContentFile
 from .models import ResumeAnalysis, LearningPath, ResumeBuilder
-from resume_analyzer import process_resume_analysis
+from .progress import TaskProgress
+from .queues import (
+    LLM_QUEUE, COMPILE_QUEUE, MAINTENANCE_QUEUE,
+    PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND, PRIORITY_BULK,
+)
+from resume_analyzer import extract_resume_stage, classify_resume_stage, analyze_resume
+from utils import is_error_analysis
 from learning_path_analyzer import process_learning_path_analysis
+from learning_path_cache import get_cached_learning_path, cache_learning_path
+from learning_path_library import get_library_path, personalize_learning_path, build_learning_path_library, LIBRARY_SIZE
+from resource_verifier import verify_learning_path_resources
 from resume_builder import process_resume_builder
-from pdf_generator import generate_pdf_from_latex, get_sample_pdf_path
+from resume_ir import resume_ir_from_model
+from latex_templates import render_latex_document
+from pdf_generator import generate_pdf_from_latex, get_sample_pdf_path, publish_pdf
 
 # Import logging
 from logging_config import get_logger, log_performance
@@ -22,142 +34,303 @@ from logging_config import get_logger, log_performance
 # Initialize logger
 logger = get_logger(__name__)
 
+# Matches ResumeBuilder.pdf_file's upload_to
+GENERATED_RESUME_DIR = "generated_resumes"
 
-@dramatiq.actor(max_retries=3, min_backoff=1000, max_backoff=30000)
+
+def _already_completed(record, label: str) -> bool:
+    """
+    Whether a previous delivery of this message already finished the record.
+
+    Redelivered messages (worker restarts, retries after a late failure) must not redo
+    the LLM call or overwrite a stored result.
+    """
+    if record.task_status == 'completed':
+        logger.info(f"Skipping {label} {record.id}: already completed")
+        return True
+    return False
+
+
+class PipelineStop(Exception):
+    """
+    Ends a pipeline without retrying: the record is already completed, or a stage found
+    a problem a retry cannot fix (and has marked the record failed)
+    """
+
+
+class StageError(Exception):
+    """A pipeline stage hit a transient failure (LLM/API error); Retries re-runs only that stage"""
+
+
+# Shared by the resume analysis stages: each stage retries on its own, and a stage that
+# runs out of retries marks the analysis failed via mark_resume_analysis_failed_task.
+# A stage's result is piped into the next stage's message, so a retry re-sends the same
+# input instead of redoing earlier stages.
+ANALYSIS_STAGE_OPTIONS = {
+    "max_retries": 3,
+    "min_backoff": 1000,
+    "max_backoff": 30000,
+    "throws": (PipelineStop,),
+    "on_retry_exhausted": "mark_resume_analysis_failed_task",
+}
+
+
+def _fail_analysis(analysis_id: str, error: str):
+    """Mark an analysis failed and stop its pipeline"""
+    logger.error(f"Resume analysis failed for analysis {analysis_id}: {error}")
+    ResumeAnalysis.objects.filter(id=analysis_id).update(task_status='failed', task_error=error)
+    raise PipelineStop(error)
+
+
+def _get_pending_analysis(analysis_id: str) -> ResumeAnalysis:
+    """Load an analysis for a pipeline stage, stopping the pipeline if there is nothing to do"""
+    try:
+        analysis = ResumeAnalysis.objects.get(id=analysis_id)
+    except ResumeAnalysis.DoesNotExist:
+        logger.error(f"ResumeAnalysis with id {analysis_id} not found")
+        raise PipelineStop(f"analysis {analysis_id} not found")
+    if _already_completed(analysis, "analysis"):
+        raise PipelineStop(f"analysis {analysis_id} already completed")
+    return analysis
+
+
+def start_resume_analysis_pipeline(analysis_id: str) -> pipeline:
+    """
+    Enqueue extract -> classify -> analyze -> persist for an analysis.
+
+    Extraction is CPU-bound and runs on the compile pool; the LLM stages and the DB write
+    run on the llm pool. Returns the pipeline; its first message id is the task id.
+    """
+    analysis_id = str(analysis_id)
+    logger.info(f"Starting resume analysis pipeline for analysis ID: {analysis_id}")
+    return pipeline([
+        extract_resume_text_task.message(analysis_id),
+        classify_resume_task.message(),
+        analyze_resume_task.message(),
+        persist_resume_analysis_task.message(),
+    ]).run()
+
+
+@dramatiq.actor(queue_name=LLM_QUEUE, priority=PRIORITY_INTERACTIVE, max_retries=3, min_backoff=1000, max_backoff=30000)
 def process_resume_analysis_task(analysis_id: str):
     """
     Async task to process resume analysis
+
+    Starts the stage pipeline; kept as an actor so messages sent before the pipeline
+    existed still run.
+    """
+    start_resume_analysis_pipeline(analysis_id)
+
+
+@dramatiq.actor(queue_name=COMPILE_QUEUE, priority=PRIORITY_INTERACTIVE, **ANALYSIS_STAGE_OPTIONS)
+def extract_resume_text_task(analysis_id: str) -> Dict[str, Any]:
+    """
+    Pipeline stage 1: validate the upload and extract the resume text
     """
     start_time = time.time()
-    logger.info(f"Starting resume analysis task for analysis ID: {analysis_id}")
+    analysis = _get_pending_analysis(analysis_id)
+    logger.info(f"Found analysis record: {analysis_id}, user: {analysis.user.id if analysis.user else 'None'}")
+    
+    analysis.task_status = 'running'
+    analysis.save(update_fields=['task_status'])
+    logger.debug(f"Updated task status to 'running' for analysis: {analysis_id}")
     
+    progress = TaskProgress("resume_analysis", ResumeAnalysis, analysis_id)
     try:
-        analysis = ResumeAnalysis.objects.get(id=analysis_id)
-        logger.info(f"Found analysis record: {analysis_id}, user: {analysis.user.id if analysis.user else 'None'}")
-        
-        analysis.task_status = 'running'
-        analysis.save(update_fields=['task_status'])
-        logger.debug(f"Updated task status to 'running' for analysis: {analysis_id}")
-        
-        # Process the resume analysis
-        logger.info(f"Processing resume analysis for file: {analysis.resume_file.path}")
-        result = process_resume_analysis(
-            analysis.resume_file.path,
-            analysis.job_description
-        )
-        
-        logger.info(f"Result type: {type(result)}")
-        logger.info(f"Result content: {str(result)[:500]}...")
-        
-        # Check if the result is an error message
-        if isinstance(result, str) and result.startswith('## ❌'):
-            logger.error(f"Resume analysis failed for analysis {analysis_id}: {result}")
-            analysis.task_status = 'failed'
-            analysis.task_error = result
-            analysis.save(update_fields=['task_status', 'task_error'])
-            return
-        
-        # Check if it's the OpenRouter API key error - provide demo data
-        if isinstance(result, str) and ("OpenRouter API Key Not Configured" in result or "API key not configured" in result.lower()):
-            logger.info(f"Using demo data for analysis {analysis_id} (OpenRouter API key not configured)")
-            # Demo data
-            analysis.ats_score = 78
-            analysis.score_explanation = "Demo analysis: Your resume shows good technical skills and relevant experience. The ATS score indicates a strong match for the position."
-            analysis.strengths = [
-                "Strong technical background in software development",
-                "Relevant project experience",
-                "Good educational qualifications",
-                "Demonstrated problem-solving skills"
-            ]
-            analysis.weaknesses = [
-                "Could include more quantifiable achievements",
-                "Consider adding more industry-specific keywords",
-                "Experience section could be more detailed"
-            ]
-            analysis.recommendations = [
-                "Add specific metrics and numbers to achievements",
-                "Include more relevant keywords from the job description",
-                "Expand on technical skills and tools used"
-            ]
-            analysis.skills_gap = [
-                "Advanced cloud computing (AWS/Azure)",
-                "Microservices architecture",
-                "DevOps practices"
-            ]
-            analysis.upskilling_suggestions = [
-                "Take AWS or Azure certification courses",
-                "Learn about microservices and containerization",
-                "Study DevOps tools and practices"
-            ]
-            analysis.overall_assessment = "Demo assessment: You have a solid foundation and good potential for this role. Focus on highlighting quantifiable achievements and adding relevant technical skills to improve your ATS score."
-        else:
-            # Parse the result if it's structured
-            if isinstance(result, dict):
-                logger.info(f"Processing structured result for analysis {analysis_id}")
-                # Ensure ats_score is an integer
-                ats_score = result.get('ats_score', 75)
-                if isinstance(ats_score, str):
-                    try:
-                        ats_score = int(ats_score)
-                    except (ValueError, TypeError):
-                        ats_score = 75
-                
-                analysis.ats_score = ats_score
-                analysis.score_explanation = result.get('score_explanation', 'Analysis completed successfully')
-                analysis.strengths = result.get('strengths', [])
-                analysis.weaknesses = result.get('weaknesses', [])
-                analysis.recommendations = result.get('recommendations', [])
-                analysis.skills_gap = result.get('skills_gap', [])
-                analysis.upskilling_suggestions = result.get('upskilling_suggestions', [])
-                analysis.overall_assessment = result.get('overall_assessment', 'Analysis completed successfully')
-                
-                logger.info(f"Saved analysis data: score={analysis.ats_score}, strengths={len(analysis.strengths)}, weaknesses={len(analysis.weaknesses)}")
-            else:
-                logger.info(f"Processing fallback result for analysis {analysis_id}")
-                # Fallback for markdown string result
-                analysis.overall_assessment = result[:500] + "..." if len(result) > 500 else result
-                analysis.ats_score = 75
-                analysis.score_explanation = "Analysis completed successfully"
-                analysis.strengths = ["Strong technical skills", "Good experience"]
-                analysis.weaknesses = ["Could improve communication skills"]
-                analysis.recommendations = ["Add more quantifiable achievements"]
-                analysis.skills_gap = ["Advanced Python", "Cloud computing"]
-                analysis.upskilling_suggestions = ["Take advanced Python course"]
-        
-        analysis.task_status = 'completed'
-        analysis.save()
-        logger.info(f"Resume analysis task completed successfully for analysis {analysis_id}")
-        
-        duration = time.time() - start_time
-        log_performance("Resume analysis task", duration, f"Completed analysis {analysis_id} with score {analysis.ats_score}")
-        
-    except ResumeAnalysis.DoesNotExist:
-        logger.error(f"ResumeAnalysis with id {analysis_id} not found")
-    except Exception as e:
-        logger.error(f"Error processing resume analysis task for {analysis_id}: {str(e)}", exc_info=True)
-        try:
-            analysis = ResumeAnalysis.objects.get(id=analysis_id)
-            analysis.task_status = 'failed'
-            analysis.task_error = str(e)
-            analysis.save(update_fields=['task_status', 'task_error'])
-            logger.info(f"Updated analysis {analysis_id} status to 'failed'")
-        except Exception as save_error:
-            logger.error(f"Failed to update analysis {analysis_id} status: {str(save_error)}")
+        with progress.stage("extract"):
+            logger.info(f"Extracting resume text from file: {analysis.resume_file.path}")
+            resume_text, error = extract_resume_stage(analysis.resume_file.path, analysis.job_description)
+            if error:
+                _fail_analysis(analysis_id, error)
+    finally:
+        progress.persist()
+    
+    log_performance("Resume extract stage", time.time() - start_time, f"Analysis {analysis_id}: {len(resume_text)} characters")
+    return {"analysis_id": analysis_id, "resume_text": resume_text}
+
+
+@dramatiq.actor(queue_name=LLM_QUEUE, priority=PRIORITY_INTERACTIVE, **ANALYSIS_STAGE_OPTIONS)
+def classify_resume_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Pipeline stage 2: check the document is a resume before paying for the analysis
+    """
+    start_time = time.time()
+    analysis_id = payload["analysis_id"]
+    _get_pending_analysis(analysis_id)
+    
+    progress = TaskProgress.load("resume_analysis", ResumeAnalysis, analysis_id)
+    try:
+        with progress.stage("classify"):
+            error = classify_resume_stage(payload["resume_text"])
+            if error:
+                _fail_analysis(analysis_id, error)
+    finally:
+        progress.persist()
+    
+    log_performance("Resume classify stage", time.time() - start_time, f"Analysis {analysis_id}")
+    return payload
+
+
+@dramatiq.actor(queue_name=LLM_QUEUE, priority=PRIORITY_INTERACTIVE, **ANALYSIS_STAGE_OPTIONS)
+def analyze_resume_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Pipeline stage 3: LLM analysis of the resume against the job description
+    """
+    start_time = time.time()
+    analysis_id = payload["analysis_id"]
+    analysis = _get_pending_analysis(analysis_id)
+    
+    progress = TaskProgress.load("resume_analysis", ResumeAnalysis, analysis_id)
+    try:
+        with progress.stage("analyze"):
+            result = analyze_resume(payload["resume_text"], analysis.job_description)
+            
+            logger.info(f"Result type: {type(result)}")
+            logger.info(f"Result content: {str(result)[:500]}...")
+            
+            # Check if the result is an error message
+            if isinstance(result, str) and result.startswith('## ❌'):
+                _fail_analysis(analysis_id, result)
+            # analyze_resume reports API errors as a placeholder analysis; retry the stage
+            if is_error_analysis(result):
+                raise StageError(result["score_explanation"])
+    finally:
+        progress.persist()
+    
+    log_performance("Resume analyze stage", time.time() - start_time, f"Analysis {analysis_id}")
+    return {"analysis_id": analysis_id, "result": result}
+
+
+@dramatiq.actor(queue_name=LLM_QUEUE, priority=PRIORITY_INTERACTIVE, **ANALYSIS_STAGE_OPTIONS)
+def persist_resume_analysis_task(payload: Dict[str, Any]):
+    """
+    Pipeline stage 4: store the analysis result and mark the record completed
+    """
+    start_time = time.time()
+    analysis_id = payload["analysis_id"]
+    analysis = _get_pending_analysis(analysis_id)
+    
+    progress = TaskProgress.load("resume_analysis", ResumeAnalysis, analysis_id)
+    try:
+        with progress.stage("persist"):
+            if is_error_analysis(payload["result"]):
+                _fail_analysis(analysis_id, payload["result"]["score_explanation"])
+            _store_analysis_result(analysis, payload["result"])
+            analysis.task_status = 'completed'
+            analysis.save()
+    finally:
+        progress.persist()
+    logger.info(f"Resume analysis task completed successfully for analysis {analysis_id}")
+    
+    duration = time.time() - start_time
+    log_performance("Resume analysis task", duration, f"Completed analysis {analysis_id} with score {analysis.ats_score}")
+
+
+@dramatiq.actor(queue_name=LLM_QUEUE, priority=PRIORITY_INTERACTIVE, max_retries=0)
+def mark_resume_analysis_failed_task(message_data: Dict[str, Any], retry_info: Dict[str, Any]):
+    """
+    Called by the Retries middleware when an analysis stage has used up its retries
+    """
+    first_arg = message_data["args"][0]
+    analysis_id = first_arg["analysis_id"] if isinstance(first_arg, dict) else first_arg
+    stage = message_data["actor_name"]
+    logger.error(f"Resume analysis {analysis_id}: {stage} failed after {retry_info.get('retries')} retries")
+    
+    ResumeAnalysis.objects.filter(id=analysis_id).exclude(task_status='completed').update(
+        task_status='failed',
+        task_error="## ❌ Processing Error\n\nThe analysis could not be completed. Please try again or contact support if the issue persists.",
+    )
 
 
-@dramatiq.actor(max_retries=3, min_backoff=1000, max_backoff=30000)
+def _store_analysis_result(analysis: ResumeAnalysis, result):
+    """
+    Copy an analysis result (structured dict, markdown fallback or demo data) onto the record
+    """
+    # Check if it's the OpenRouter API key error - provide demo data
+    if isinstance(result, str) and ("OpenRouter API Key Not Configured" in result or "API key not configured" in result.lower()):
+        logger.info(f"Using demo data for analysis {analysis.id} (OpenRouter API key not configured)")
+        # Demo data
+        analysis.ats_score = 78
+        analysis.score_explanation = "Demo analysis: Your resume shows good technical skills and relevant experience. The ATS score indicates a strong match for the position."
+        analysis.strengths = [
+            "Strong technical background in software development",
+            "Relevant project experience",
+            "Good educational qualifications",
+            "Demonstrated problem-solving skills"
+        ]
+        analysis.weaknesses = [
+            "Could include more quantifiable achievements",
+            "Consider adding more industry-specific keywords",
+            "Experience section could be more detailed"
+        ]
+        analysis.recommendations = [
+            "Add specific metrics and numbers to achievements",
+            "Include more relevant keywords from the job description",
+            "Expand on technical skills and tools used"
+        ]
+        analysis.skills_gap = [
+            "Advanced cloud computing (AWS/Azure)",
+            "Microservices architecture",
+            "DevOps practices"
+        ]
+        analysis.upskilling_suggestions = [
+            "Take AWS or Azure certification courses",
+            "Learn about microservices and containerization",
+            "Study DevOps tools and practices"
+        ]
+        analysis.overall_assessment = "Demo assessment: You have a solid foundation and good potential for this role. Focus on highlighting quantifiable achievements and adding relevant technical skills to improve your ATS score."
+    else:
+        # Parse the result if it's structured
+        if isinstance(result, dict):
+            logger.info(f"Processing structured result for analysis {analysis.id}")
+            # Ensure ats_score is an integer
+            ats_score = result.get('ats_score', 75)
+            if isinstance(ats_score, str):
+                try:
+                    ats_score = int(ats_score)
+                except (ValueError, TypeError):
+                    ats_score = 75
+
+            analysis.ats_score = ats_score
+            analysis.score_explanation = result.get('score_explanation', 'Analysis completed successfully')
+            analysis.strengths = result.get('strengths', [])
+            analysis.weaknesses = result.get('weaknesses', [])
+            analysis.recommendations = result.get('recommendations', [])
+            analysis.skills_gap = result.get('skills_gap', [])
+            analysis.upskilling_suggestions = result.get('upskilling_suggestions', [])
+            analysis.overall_assessment = result.get('overall_assessment', 'Analysis completed successfully')
+
+            logger.info(f"Saved analysis data: score={analysis.ats_score}, strengths={len(analysis.strengths)}, weaknesses={len(analysis.weaknesses)}")
+        else:
+            logger.info(f"Processing fallback result for analysis {analysis.id}")
+            # Fallback for markdown string result
+            analysis.overall_assessment = result[:500] + "..." if len(result) > 500 else result
+            analysis.ats_score = 75
+            analysis.score_explanation = "Analysis completed successfully"
+            analysis.strengths = ["Strong technical skills", "Good experience"]
+            analysis.weaknesses = ["Could improve communication skills"]
+            analysis.recommendations = ["Add more quantifiable achievements"]
+            analysis.skills_gap = ["Advanced Python", "Cloud computing"]
+            analysis.upskilling_suggestions = ["Take advanced Python course"]
+
+
+@dramatiq.actor(queue_name=LLM_QUEUE, priority=PRIORITY_INTERACTIVE, max_retries=3, min_backoff=1000, max_backoff=30000)
 def process_learning_path_task(path_id: str):
     """
     Async task to process learning path analysis with proper error handling and validation
     """
     start_time = time.time()
     logger.info(f"Starting learning path task for path ID: {path_id}")
+    progress = TaskProgress("learning_path", LearningPath, path_id)
     
     try:
         # Get the learning path record
         learning_path = LearningPath.objects.get(id=path_id)
         logger.info(f"Found learning path record: {path_id}, user: {learning_path.user.id if learning_path.user else 'None'}")
         
+        if _already_completed(learning_path, "learning path"):
+            return
+        
         # Update status to running
         learning_path.task_status = 'running'
         learning_path.save(update_fields=['task_status'])
@@ -172,12 +345,37 @@ def process_learning_path_task(path_id: str):
             learning_path.save(update_fields=['task_status', 'task_error'])
             return
         
-        # Process the learning path analysis
-        logger.info(f"Processing learning path analysis for skills: {len(learning_path.current_skills)} chars, role: {len(learning_path.dream_role)} chars")
-        result = process_learning_path_analysis(
-            learning_path.current_skills,
-            learning_path.dream_role
-        )
+        # Serve repeated skills/role combinations from the cache before calling the LLM
+        progress.start_stage("lookup")
+        cached_result = get_cached_learning_path(learning_path.current_skills, learning_path.dream_role)
+        if cached_result is not None:
+            logger.info(f"Using cached learning path for {path_id}")
+            progress.start_stage("persist")
+            _update_learning_path_with_data(learning_path, cached_result)
+            learning_path.task_status = 'completed'
+            learning_path.save()
+            progress.end_stage()
+            _schedule_resource_verification(path_id)
+            
+            duration = time.time() - start_time
+            log_performance("Learning path task", duration, f"Completed learning path {path_id} from cache")
+            return
+        
+        # Popular roles have a pre-generated path; only the user-specific delta is generated
+        result = None
+        library_path = get_library_path(learning_path.dream_role)
+        progress.start_stage("analyze")
+        if library_path is not None:
+            logger.info(f"Personalizing library learning path for {path_id}")
+            result = personalize_learning_path(library_path, learning_path.current_skills, learning_path.dream_role)
+        
+        if result is None:
+            # Process the learning path analysis
+            logger.info(f"Processing learning path analysis for skills: {len(learning_path.current_skills)} chars, role: {len(learning_path.dream_role)} chars")
+            result = process_learning_path_analysis(
+                learning_path.current_skills,
+                learning_path.dream_role
+            )
         
         logger.info(f"Learning path analysis result type: {type(result)}")
         logger.debug(f"Result preview: {str(result)[:200]}...")
@@ -220,17 +418,11 @@ Without the API key, the system cannot generate personalized learning paths.
             return
         
         elif isinstance(result, dict):
-            # Validate the structured result
+            # Structured results are validated once by learning_path_analyzer; store them as-is
+            progress.start_stage("persist")
             logger.info(f"Processing structured result for learning path {path_id}")
-            if _validate_learning_path_data(result):
-                _update_learning_path_with_data(learning_path, result)
-            else:
-                error_msg = "## ❌ Data Validation Error\n\nReceived invalid data structure from the analysis service."
-                logger.error(f"Invalid data structure for learning path {path_id}")
-                learning_path.task_status = 'failed'
-                learning_path.task_error = error_msg
-                learning_path.save(update_fields=['task_status', 'task_error'])
-                return
+            _update_learning_path_with_data(learning_path, result)
+            cache_learning_path(learning_path.current_skills, learning_path.dream_role, result)
         else:
             # Unknown result type
             error_msg = f"## ❌ Unexpected Result Type\n\nReceived unexpected result type: {type(result)}"
@@ -243,7 +435,9 @@ Without the API key, the system cannot generate personalized learning paths.
         # Mark as completed
         learning_path.task_status = 'completed'
         learning_path.save()
+        progress.end_stage()
         logger.info(f"Learning path task completed successfully for {path_id}")
+        _schedule_resource_verification(path_id)
         
         duration = time.time() - start_time
         log_performance("Learning path task", duration, f"Completed learning path {path_id}")
@@ -260,43 +454,71 @@ Without the API key, the system cannot generate personalized learning paths.
             logger.info(f"Updated learning path {path_id} status to 'failed'")
         except Exception as save_error:
             logger.error(f"Failed to update learning path {path_id} status: {str(save_error)}")
+    finally:
+        progress.persist()
 
 
-def _validate_learning_path_data(data: dict) -> bool:
+def _schedule_resource_verification(path_id: str):
     """
-    Validate the structure and content of learning path data
+    Enqueue link verification for a completed learning path; never fails the calling task
     """
-    if not isinstance(data, dict):
-        return False
-    
-    # Check for required fields
-    required_fields = ['role_analysis', 'skills_gap', 'learning_path']
-    for field in required_fields:
-        if field not in data:
-            logger.warning(f"Missing required field in learning path data: {field}")
-            return False
-    
-    # Validate role_analysis
-    if not data.get('role_analysis') or len(str(data['role_analysis']).strip()) < 10:
-        logger.warning("Role analysis is too short or empty")
-        return False
-    
-    # Validate skills_gap
-    if not isinstance(data.get('skills_gap'), list) or len(data['skills_gap']) == 0:
-        logger.warning("Skills gap must be a non-empty list")
-        return False
+    try:
+        verify_learning_path_resources_task.send(str(path_id))
+    except Exception as e:
+        logger.warning(f"Could not schedule resource verification for learning path {path_id}: {str(e)}")
+
+
+@dramatiq.actor(queue_name=MAINTENANCE_QUEUE, priority=PRIORITY_BACKGROUND, max_retries=1, time_limit=5 * 60 * 1000)
+def verify_learning_path_resources_task(path_id: str):
+    """
+    Background task that HEAD-checks resource URLs of a completed learning path and stores the verdicts
+    """
+    start_time = time.time()
+    logger.info(f"Starting resource verification for learning path {path_id}")
     
-    # Validate learning_path (the field name in the data, not the model field)
-    if not isinstance(data.get('learning_path'), list):
-        logger.warning("Learning path must be a list")
-        return False
+    try:
+        learning_path = LearningPath.objects.get(id=path_id)
+        verified_data, stats = verify_learning_path_resources(learning_path.learning_path_data)
+        
+        if stats['checked']:
+            learning_path.learning_path_data = verified_data
+            learning_path.save(update_fields=['learning_path_data'])
+        
+        duration = time.time() - start_time
+        log_performance("Resource verification task", duration, f"Learning path {path_id}: {stats['live']}/{stats['checked']} URLs live")
+        
+    except LearningPath.DoesNotExist:
+        logger.error(f"LearningPath with id {path_id} not found for resource verification")
+    except Exception as e:
+        logger.error(f"Error verifying resources for learning path {path_id}: {str(e)}", exc_info=True)
+
+
+@dramatiq.actor(queue_name=MAINTENANCE_QUEUE, priority=PRIORITY_BULK, max_retries=0, time_limit=60 * 60 * 1000)
+def precompute_learning_path_library_task(top_n: int = LIBRARY_SIZE):
+    """
+    Background job that pre-generates canonical learning paths for the most requested dream roles
+    """
+    start_time = time.time()
+    logger.info(f"Starting learning path library precompute for top {top_n} roles")
     
-    return True
+    try:
+        dream_roles = (
+            LearningPath.objects.filter(task_status='completed')
+            .order_by('-created_at')
+            .values_list('dream_role', flat=True)[:5000]
+        )
+        generated = build_learning_path_library(list(dream_roles), top_n)
+        
+        duration = time.time() - start_time
+        log_performance("Learning path library precompute task", duration, f"Generated {generated} canonical paths")
+        
+    except Exception as e:
+        logger.error(f"Error precomputing learning path library: {str(e)}", exc_info=True)
 
 
 def _update_learning_path_with_data(learning_path: LearningPath, data: dict):
     """
-    Update learning path record with validated data
+    Update learning path record with validated structured data
     """
     logger.info("Updating learning path with validated data")
     
@@ -312,166 +534,73 @@ def _update_learning_path_with_data(learning_path: LearningPath, data: dict):
     logger.info(f"Updated learning path with: {len(learning_path.skills_gap)} skills gaps, {len(learning_path.learning_path_data)} learning phases")
 
 
-def _parse_markdown_to_structured_data(markdown_text: str) -> dict:
+def _store_resume_pdf(resume: ResumeBuilder, pdf_path: str):
+    """Link/move a compiled PDF into media storage instead of re-writing it through the FileField"""
+    storage_name = f"{GENERATED_RESUME_DIR}/{resume.id}.pdf"
+    publish_pdf(pdf_path, os.path.join(settings.MEDIA_ROOT, storage_name))
+    resume.pdf_file.name = storage_name
+    logger.info(f"PDF stored for resume {resume.id}: {storage_name}")
+
+
+@dramatiq.actor(queue_name=COMPILE_QUEUE, priority=PRIORITY_INTERACTIVE, max_retries=1, time_limit=5 * 60 * 1000)
+def compile_resume_pdf_task(resume_id: str):
     """
-    Parse markdown text to extract structured learning path data
+    Compile the PDF of a completed resume that has none (e.g. the build ran without pdflatex)
+    so the export view never runs pdflatex inside a web request
     """
+    start_time = time.time()
     try:
-        # This is a simplified parser - in a production system, you'd use a proper markdown parser
-        lines = markdown_text.split('\n')
-        structured_data = {
-            'role_analysis': '',
-            'skills_gap': [],
-            'learning_path': [],
-            'timeline': '',
-            'success_metrics': [],
-            'career_advice': '',
-            'networking_tips': []
-        }
-        
-        current_section = None
-        current_phase = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Detect sections
-            if line.startswith('## 🎯 Dream Role Analysis'):
-                current_section = 'role_analysis'
-                continue
-            elif line.startswith('## 🔍 Skills Gap Analysis'):
-                current_section = 'skills_gap'
-                continue
-            elif line.startswith('## 📚 Detailed Learning Path'):
-                current_section = 'learning_path'
-                continue
-            elif line.startswith('## ⏱️ Overall Timeline'):
-                current_section = 'timeline'
-                continue
-            elif line.startswith('## 📊 Success Metrics'):
-                current_section = 'success_metrics'
-                continue
-            elif line.startswith('## 💼 Career Advice'):
-                current_section = 'career_advice'
-                continue
-            elif line.startswith('## 🤝 Networking Tips'):
-                current_section = 'networking_tips'
-                continue
-            
-            # Process content based on current section
-            if current_section == 'role_analysis' and line and not line.startswith('#'):
-                structured_data['role_analysis'] += line + ' '
-            elif current_section == 'skills_gap' and line.startswith('•'):
-                skill = line[1:].strip()
-                if skill:
-                    structured_data['skills_gap'].append(skill)
-            elif current_section == 'learning_path':
-                # Parse learning path phases
-                if line.startswith('### ') and 'Phase' in line:
-                    # Start of a new phase
-                    if current_phase:
-                        structured_data['learning_path'].append(current_phase)
-                    current_phase = {
-                        'phase': line.replace('### ', '').strip(),
-                        'description': '',
-                        'skills_to_learn': [],
-                        'resources': [],
-                        'projects': []
-                    }
-                elif current_phase and line and not line.startswith('#'):
-                    if 'Skills to Learn:' in line:
-                        # Skills section starts
-                        continue
-                    elif line.startswith('•') and current_phase:
-                        # Skill to learn
-                        skill = line[1:].strip()
-                        if skill and 'Skills to Learn:' not in skill:
-                            current_phase['skills_to_learn'].append(skill)
-                    elif current_phase and not line.startswith('•') and not line.startswith('**') and line.strip():
-                        # Description text
-                        if not current_phase['description']:
-                            current_phase['description'] = line.strip()
-                        else:
-                            current_phase['description'] += ' ' + line.strip()
-            elif current_section == 'timeline' and line and not line.startswith('#'):
-                structured_data['timeline'] = line
-            elif current_section == 'success_metrics' and line.startswith('•'):
-                metric = line[1:].strip()
-                if metric:
-                    structured_data['success_metrics'].append(metric)
-            elif current_section == 'career_advice' and line and not line.startswith('#'):
-                structured_data['career_advice'] += line + ' '
-            elif current_section == 'networking_tips' and line.startswith('•'):
-                tip = line[1:].strip()
-                if tip:
-                    structured_data['networking_tips'].append(tip)
-        
-        # Add the last phase if it exists
-        if current_phase:
-            structured_data['learning_path'].append(current_phase)
-        
-        # Clean up text fields
-        structured_data['role_analysis'] = structured_data['role_analysis'].strip()
-        structured_data['career_advice'] = structured_data['career_advice'].strip()
-        
-        # Validate that we have meaningful data
-        if (structured_data['role_analysis'] and 
-            structured_data['skills_gap'] and 
-            structured_data['learning_path'] and
-            len(structured_data['role_analysis']) > 50 and
-            len(structured_data['learning_path']) > 0):
-            return structured_data
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error parsing markdown to structured data: {str(e)}")
-        return None
+        resume = ResumeBuilder.objects.get(id=resume_id)
+    except ResumeBuilder.DoesNotExist:
+        logger.error(f"ResumeBuilder with id {resume_id} not found")
+        return
+    if resume.task_status != 'completed' or (resume.pdf_file and os.path.exists(resume.pdf_file.path)):
+        logger.info(f"Resume {resume_id} needs no PDF compile (status: {resume.task_status})")
+        return
+
+    resume_ir = resume_ir_from_model(resume)
+    data = resume_ir.to_template_data()
+    pdf_path = generate_pdf_from_latex(render_latex_document(data, resume.theme), resume_data=data, theme=resume.theme)
+    if not pdf_path:
+        raise RuntimeError(f"PDF generation failed for resume {resume_id}")
 
+    _store_resume_pdf(resume, pdf_path)
+    resume.save(update_fields=['pdf_file'])
+    log_performance("Resume PDF compile task", time.time() - start_time, f"Resume {resume_id}")
 
-@dramatiq.actor(max_retries=3, min_backoff=1000, max_backoff=30000)
+
+@dramatiq.actor(queue_name=COMPILE_QUEUE, priority=PRIORITY_INTERACTIVE, max_retries=3, min_backoff=1000, max_backoff=30000)
 def process_resume_builder_task(resume_id: str):
     """
     Async task to process resume building with proper error handling and logging
     """
     start_time = time.time()
     logger.info(f"Starting resume builder task for resume ID: {resume_id}")
+    progress = TaskProgress("resume_builder", ResumeBuilder, resume_id)
     
     try:
         resume = ResumeBuilder.objects.get(id=resume_id)
         logger.info(f"Found resume record: {resume_id}, user: {resume.user.id if resume.user else 'None'}")
         
+        if _already_completed(resume, "resume"):
+            return
+        
         resume.task_status = 'running'
         resume.save(update_fields=['task_status'])
         logger.debug(f"Updated task status to 'running' for resume: {resume_id}")
         
-        # Convert form data to the format expected by the existing function
-        name = resume.name
-        email = resume.email
-        phone = resume.phone
-        linkedin = resume.linkedin
-        github = resume.github
+        # JSONField values are already parsed; build the typed IR straight from them
+        resume_ir = resume_ir_from_model(resume)
+        name = resume_ir.name
         
-        # Parse JSON fields properly for processing
-        education = json.dumps(resume.education) if resume.education else "[]"
-        experience = json.dumps(resume.experience) if resume.experience else "[]"
-        projects = json.dumps(resume.projects) if resume.projects else "[]"
-        skills = json.dumps(resume.skills) if resume.skills else "{}"
-        research_papers = json.dumps(resume.research_papers) if resume.research_papers else "[]"
-        achievements = json.dumps(resume.achievements) if resume.achievements else "[]"
-        others = json.dumps(resume.others) if resume.others else "[]"
-        
-        logger.info(f"Processing resume builder for user: {name}, email: {email}")
-        logger.debug(f"Data lengths - education: {len(education)}, experience: {len(experience)}, projects: {len(projects)}, skills: {len(skills)}")
+        logger.info(f"Processing resume builder for user: {name}, email: {resume_ir.email}")
+        logger.debug(
+            f"Entries - education: {len(resume_ir.education)}, experience: {len(resume_ir.experience)}, "
+            f"projects: {len(resume_ir.projects)}, skill categories: {len(resume_ir.skills)}"
+        )
         
         # Process the resume builder
-        result = process_resume_builder(
-            name, email, phone, linkedin, github,
-            education, experience, projects, skills,
-            research_papers, achievements, others
-        )
+        result = process_resume_builder(resume_ir, theme=resume.theme, stage=progress.stage)
         
         logger.info(f"Resume builder result type: {type(result)}")
         logger.debug(f"Result preview: {str(result)[:200]}...")
@@ -484,6 +613,8 @@ def process_resume_builder_task(resume_id: str):
             resume.save(update_fields=['task_status', 'task_error'])
             return
         
+        progress.start_stage("store")
+        
         # Check if it's the OpenRouter API key error - provide demo data
         if isinstance(result, str) and "OpenRouter API Key Not Configured" in result:
             logger.info(f"Using demo data for resume {resume_id} (OpenRouter API key not configured)")
@@ -584,8 +715,10 @@ def process_resume_builder_task(resume_id: str):
                 resume.latex_content = latex_content
                 logger.info(f"LaTeX content generated for resume {resume_id}, length: {len(latex_content)}")
                 
-                # Skip PDF generation - user will compile LaTeX themselves
-                logger.info(f"Skipping PDF generation for resume {resume_id} - user will compile LaTeX code")
+                if pdf_path:
+                    _store_resume_pdf(resume, pdf_path)
+                else:
+                    logger.info(f"No PDF generated for resume {resume_id} - user will compile LaTeX code")
             else:
                 # Fallback - assume it's LaTeX content
                 resume.latex_content = str(result)
@@ -596,6 +729,7 @@ def process_resume_builder_task(resume_id: str):
         
         resume.task_status = 'completed'
         resume.save()
+        progress.end_stage()
         logger.info(f"Resume builder task completed successfully for {resume_id}")
         
         duration = time.time() - start_time
@@ -612,4 +746,6 @@ def process_resume_builder_task(resume_id: str):
             resume.save(update_fields=['task_status', 'task_error'])
             logger.info(f"Updated resume {resume_id} status to 'failed'")
         except Exception as save_error:
-            logger.error(f"Failed to update resume {resume_id} status: {str(save_error)}") 
\ No newline at end of file
+            logger.error(f"Failed to update resume {resume_id} status: {str(save_error)}")
+    finally:
+        progress.persist()
@@ -1,3 +1,1409 @@
-from django.test import TestCase
+import importlib
+import io
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import zipfile
+from xml.etree import ElementTree
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import urlsplit
 
-# Create your tests here.
+import dramatiq
+from dramatiq.brokers.stub import StubBroker
+from dramatiq.middleware import Callbacks, Pipelines, Retries
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+import document_classifier
+import latex_templates
+import learning_path_analyzer
+import learning_path_library
+import resource_catalog
+import resource_verifier
+import resume_analyzer
+import pdf_generator
+import resume_exporters
+import resume_pdf_renderer
+import resume_preview
+import sample_resume_cache
+from latex_lint import lint_latex
+from learning_path_cache import (
+    cache_learning_path, canonicalize_role, get_cached_learning_path, match_role, normalize_skills,
+)
+from learning_path_library import (
+    apply_learning_path_delta, build_learning_path_library, get_library_path, rank_popular_roles,
+)
+from latex_templates import escape_latex
+from resume_ir import build_resume_ir, validate_resume_ir
+from resume_builder import generate_latex_resume
+
+from . import dedup, queues, tasks, worker_middleware
+from .downloads import file_etag, serve_file
+from .progress import TaskProgress, get_progress
+from .models import ResumeAnalysis, ResumeBuilder, User
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+RESUME_TEXT = (
+    "Jane Doe - Software Engineer. Experience: built REST APIs in Python and Django. "
+    "Education: B.S. Computer Science. Skills: Python, SQL, Docker."
+)
+RESUME_DATA = {
+    "name": "Ada <Lovelace> & Co",
+    "email": "ada@example.com",
+    "phone": "555-0100",
+    "education": [{"institution": "University of London", "degree": "B.Sc. Mathematics", "duration": "1830 -- 1833"}],
+    "experience": [{
+        "title": "Analyst", "company": "Analytical Engine Ltd", "location": "London", "duration": "1842 -- 1843",
+        "description": "- Wrote the first published program\n- Annotated Menabrea's paper",
+    }],
+    "projects": [{"name": "Note G", "tech_stack": "Bernoulli numbers", "description": "Computed B8"}],
+    "skills": {"Languages": ["Mathematics", "French"]},
+    "achievements": ["Ada programming language named after her"],
+}
+JOB_DESCRIPTION = "Backend engineer with Python, Django and SQL experience to build and run production APIs."
+
+
+class StubBrokerMixin:
+    """
+    Runs the task module's actors on an in-memory broker with a worker thread.
+
+    The actors are bound to the configured (Redis) broker at import; each test rebinds
+    them to a StubBroker carrying the middleware the pipelines rely on, and restores them
+    afterwards.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.previous_broker = dramatiq.get_broker()
+        self.broker = StubBroker(middleware=[Callbacks(), Pipelines(), Retries()])
+        self.broker.emit_after("process_boot")
+        dramatiq.set_broker(self.broker)
+        self.rebound = []
+        for value in vars(tasks).values():
+            if isinstance(value, dramatiq.Actor):
+                self.rebound.append((value, value.broker))
+                value.broker = self.broker
+                self.broker.declare_actor(value)
+        self.worker = dramatiq.Worker(self.broker, worker_timeout=50, worker_threads=1)
+        self.worker.start()
+
+    def tearDown(self):
+        self.worker.stop()
+        self.broker.close()
+        for actor, broker in self.rebound:
+            actor.broker = broker
+        dramatiq.set_broker(self.previous_broker)
+        super().tearDown()
+
+    def wait_for(self, predicate, timeout=10):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.05)
+        return False
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ResumeAnalysisPipelineTests(StubBrokerMixin, TransactionTestCase):
+    """extract -> classify -> analyze -> persist, with per-stage retries"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        super().setUp()
+        self.analysis = ResumeAnalysis.objects.create(
+            job_description=JOB_DESCRIPTION,
+            resume_file=SimpleUploadedFile("resume.pdf", b"%PDF-1.4 test"),
+        )
+        # Local stand-ins for PDF parsing and the classifier; fast backoff for retries
+        for target, kwargs in (
+            ("hirevision.tasks.extract_resume_stage", {"return_value": (RESUME_TEXT, None)}),
+            ("hirevision.tasks.classify_resume_stage", {"return_value": None}),
+            ("resume_analyzer.extract_job_requirements", {"return_value": None}),
+        ):
+            patcher = mock.patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(tasks.analyze_resume_task.options, {"min_backoff": 10, "max_backoff": 20})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_pipeline(self):
+        tasks.start_resume_analysis_pipeline(self.analysis.id)
+
+        def finished():
+            self.analysis.refresh_from_db()
+            return self.analysis.task_status in ("completed", "failed")
+
+        self.assertTrue(self.wait_for(finished), "pipeline did not finish")
+        self.worker.join()
+
+    def test_failing_llm_call_retries_stage_then_marks_failed(self):
+        with mock.patch("resume_analyzer.make_api_call", side_effect=Exception("Connection reset by peer")), \
+                mock.patch("hirevision.tasks.analyze_resume", wraps=tasks.analyze_resume) as analyze:
+            self.run_pipeline()
+
+        self.assertEqual(analyze.call_count, tasks.ANALYSIS_STAGE_OPTIONS["max_retries"] + 1)
+        self.assertEqual(tasks.extract_resume_stage.call_count, 1)
+        self.assertEqual(self.analysis.task_status, "failed")
+        self.assertIsNone(self.analysis.ats_score)
+
+    def test_transient_llm_error_retries_only_the_analyze_stage(self):
+        answer = (
+            '{"ats_score": 81, "score_explanation": "Good match", "strengths": ["APIs"], "weaknesses": [], '
+            '"recommendations": [], "skills_gap": [], "upskilling_suggestions": [], "overall_assessment": "Solid"}'
+        )
+        with mock.patch("resume_analyzer.make_api_call", side_effect=[Exception("Connection reset by peer"), answer]):
+            self.run_pipeline()
+
+        self.assertEqual(self.analysis.task_status, "completed")
+        self.assertEqual(self.analysis.ats_score, 81)
+        self.assertEqual(tasks.extract_resume_stage.call_count, 1)
+        self.assertEqual(tasks.classify_resume_stage.call_count, 1)
+
+    def test_error_analysis_is_never_persisted_as_a_score(self):
+        from utils import create_error_analysis
+
+        tasks.persist_resume_analysis_task.send({"analysis_id": str(self.analysis.id), "result": create_error_analysis("boom")})
+        self.assertTrue(self.wait_for(lambda: ResumeAnalysis.objects.get(id=self.analysis.id).task_status == "failed"))
+        self.analysis.refresh_from_db()
+        self.assertIsNone(self.analysis.ats_score)
+
+
+class EscapeLatexTests(SimpleTestCase):
+    def test_specials_are_escaped(self):
+        self.assertEqual(escape_latex("50% & $5_000 #1"), r"50\% \& \$5\_000 \#1")
+        self.assertEqual(escape_latex("a\\b {c}"), r"a\textbackslash{}b \{c\}")
+
+    def test_fullwidth_specials_fold_to_escaped_ascii(self):
+        self.assertEqual(escape_latex("30％"), r"30\%")
+        self.assertEqual(escape_latex("C＃ and ＄5M"), r"C\# and \$5M")
+        self.assertEqual(escape_latex("＼textbf"), r"\textbackslash{}textbf")
+        self.assertEqual(escape_latex("ｆｕｌｌ　ｗｉｄｔｈ"), "full width")
+
+    def test_unicode_replacements_are_not_escaped_again(self):
+        self.assertEqual(escape_latex("a → b ≥ c"), r"a $\rightarrow$ b $\geq$ c")
+        self.assertEqual(escape_latex("“quoted” – • ok"), r"``quoted'' -- \textbullet{} ok")
+
+    def test_unsupported_characters_are_dropped_and_latin_kept(self):
+        self.assertEqual(escape_latex("Café résumé 😀"), "Café résumé ")
+        self.assertEqual(escape_latex(None), "")
+
+
+def latex_document(body, preamble=""):
+    return "\\documentclass{article}\n" + preamble + "\\begin{document}\n" + body + "\n\\end{document}\n"
+
+
+class LintLatexTests(SimpleTestCase):
+    def test_clean_document_passes_unchanged(self):
+        document = latex_document("\\section{Experience}\n\\textbf{Engineer} at Acme, 50\\% faster")
+        result = lint_latex(document)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.repairs, [])
+        self.assertEqual(result.latex, document)
+
+    def test_undefined_commands_are_escaped(self):
+        result = lint_latex(latex_document("Use \\foo{bar} and \\textbf{x}"))
+        self.assertTrue(result.ok)
+        self.assertIn("\\textbackslash{}foo{bar}", result.latex)
+        self.assertIn("\\textbf{x}", result.latex)
+        self.assertIn("foo", result.repairs[0])
+
+    def test_commands_defined_in_the_preamble_are_known(self):
+        result = lint_latex(latex_document("\\resumeItem{x}", preamble="\\newcommand{\\resumeItem}[1]{#1}\n"))
+        self.assertTrue(result.ok)
+        self.assertEqual(result.repairs, [])
+
+    def test_unbalanced_braces_are_repaired(self):
+        result = lint_latex(latex_document("a } b {\\textbf{c}"))
+        self.assertTrue(result.ok)
+        self.assertIn("a \\} b {\\textbf{c}\n}\\end{document}", result.latex)
+        self.assertEqual(len(result.repairs), 2)
+
+    def test_comments_are_ignored(self):
+        result = lint_latex(latex_document("text % \\undefined{ not code"))
+        self.assertTrue(result.ok)
+        self.assertEqual(result.repairs, [])
+
+    def test_fullwidth_specials_in_source_are_escaped(self):
+        result = lint_latex(latex_document("Improved by 30％"))
+        self.assertTrue(result.ok)
+        self.assertIn("Improved by 30\\%", result.latex)
+
+    def test_without_repair_problems_are_errors(self):
+        result = lint_latex(latex_document("\\foo{ 30％"), repair=False)
+        self.assertFalse(result.ok)
+        self.assertEqual(len(result.errors), 3)
+        self.assertEqual(result.repairs, [])
+
+    def test_missing_document_frame(self):
+        result = lint_latex("\\documentclass{article}\nno body")
+        self.assertEqual(result.errors, ["missing \\begin{document} or \\end{document}"])
+
+    def test_mismatched_environment(self):
+        result = lint_latex(latex_document("\\begin{itemize}\\item x\\end{enumerate}"))
+        self.assertIn("\\end{enumerate} does not match the open environment", result.errors)
+
+    def test_unclosed_environment(self):
+        result = lint_latex(latex_document("\\begin{itemize}\\item x"))
+        self.assertIn("unclosed environment(s): itemize", result.errors)
+
+    def test_unbalanced_math_shift(self):
+        result = lint_latex(latex_document("costs $5 and \\$6"))
+        self.assertIn("unbalanced $ math shift", result.errors)
+
+    def test_unbalanced_preamble(self):
+        result = lint_latex(latex_document("x", preamble="\\newcommand{\\x}{{\n"))
+        self.assertIn("unbalanced braces in the preamble", result.errors)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class LearningPathCacheTests(SimpleTestCase):
+    path = {"role_analysis": "cached", "skills_gap": ["Kubernetes"], "learning_path": [{"phase": "1"}]}
+
+    def setUp(self):
+        cache.clear()
+
+    def test_role_and_skill_normalization(self):
+        self.assertEqual(canonicalize_role("Sr. SWE!"), "senior software engineer")
+        self.assertEqual(normalize_skills("Python3, JS and k8s; python"), ["javascript", "kubernetes", "python"])
+
+    def test_hit_for_same_skills_in_another_order(self):
+        cache_learning_path("Python, SQL, Docker", "Backend Engineer", self.path)
+        self.assertEqual(get_cached_learning_path("docker; sql; python3", "backend engineer"), self.path)
+        self.assertIsNone(get_cached_learning_path("Python, SQL", "Backend Engineer"))
+
+    def test_fuzzy_hit_for_similar_title(self):
+        cache_learning_path("Python, SQL", "Senior Software Engineer", self.path)
+        self.assertEqual(get_cached_learning_path("Python, SQL", "Sr Software Engineers"), self.path)
+
+    def test_seniority_must_match(self):
+        cache_learning_path("Python, SQL", "Senior Software Engineer", self.path)
+        self.assertIsNone(get_cached_learning_path("Python, SQL", "Junior Software Engineer"))
+        self.assertIsNone(get_cached_learning_path("Python, SQL", "Software Engineer"))
+
+    def test_match_role_ignores_other_levels(self):
+        self.assertIsNone(match_role("junior data scientist", ["senior data scientist"]))
+        self.assertEqual(match_role("junior data scientist", ["senior data scientist", "junior data scientists"]), "junior data scientists")
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class LearningPathLibraryTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.generated = []
+
+        def fake_analyze(current_skills, dream_role):
+            self.generated.append(dream_role)
+            return {"role_analysis": f"path for {dream_role}", "skills_gap": ["x"], "learning_path": [{"phase": "1"}]}
+
+        patcher = mock.patch("learning_path_analyzer.analyze_learning_path", side_effect=fake_analyze)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rank_popular_roles_groups_canonical_titles(self):
+        ranked = rank_popular_roles(["Sr. SWE", "Senior Software Engineer", "Sr. SWE", "Data Analyst"], top_n=5)
+        self.assertEqual(ranked[0], ("senior software engineer", "Sr. SWE", 3))
+        self.assertEqual(ranked[1][0], "data analyst")
+
+    def test_build_then_lookup_respects_seniority(self):
+        self.assertEqual(build_learning_path_library(["Senior Data Scientist"]), 1)
+        self.assertEqual(get_library_path("Sr Data Scientists")["role_analysis"], "path for Senior Data Scientist")
+        self.assertIsNone(get_library_path("Junior Data Scientist"))
+
+    def test_fresh_entries_are_kept_and_stale_ones_regenerated(self):
+        build_learning_path_library(["Backend Engineer"])
+        self.assertEqual(build_learning_path_library(["Backend Engineer"]), 0)
+        self.assertEqual(len(self.generated), 1)
+
+        later = time.time() + learning_path_library.LIBRARY_REFRESH_AGE + 1
+        with mock.patch("learning_path_library.time.time", return_value=later):
+            self.assertEqual(build_learning_path_library(["Backend Engineer"]), 1)
+        self.assertEqual(len(self.generated), 2)
+
+    def test_apply_delta_removes_covered_skills(self):
+        base = {"skills_gap": ["Docker", "SQL"], "learning_path": [{"skills_to_learn": ["Docker", "Helm"]}], "timeline": "6 months"}
+        path = apply_learning_path_delta(base, {"skills_already_covered": ["docker"], "additional_skills_gap": ["Go"], "timeline": "4 months"})
+        self.assertEqual(path["skills_gap"], ["SQL", "Go"])
+        self.assertEqual(path["learning_path"][0]["skills_to_learn"], ["Helm"])
+        self.assertEqual(path["timeline"], "4 months")
+        self.assertEqual(base["skills_gap"], ["Docker", "SQL"])
+
+
+class DocumentClassifierTests(SimpleTestCase):
+    def test_shipped_weights_classify_clear_cases(self):
+        from train_document_classifier import synthetic_document
+
+        self.assertIsNotNone(document_classifier.load_weights())
+        rng = random.Random(7)  # not the training seed
+        for label in document_classifier.DOCUMENT_CLASSES:
+            document_type, confidence = document_classifier.classify_document(synthetic_document(label, rng))
+            self.assertEqual(document_type, label)
+            self.assertGreater(confidence, 0.5)
+
+    def classify(self, prediction):
+        from resume_analyzer import validate_document_type
+
+        with mock.patch("resume_analyzer.classify_document", return_value=prediction), \
+                mock.patch("resume_analyzer.validate_document_type_with_llm", return_value=(True, "llm")) as llm:
+            return validate_document_type("document text"), llm.called
+
+    def test_confident_resume_is_accepted_locally(self):
+        (is_resume, _), used_llm = self.classify(("resume", document_classifier.CLASSIFIER_CONFIDENCE_THRESHOLD))
+        self.assertTrue(is_resume)
+        self.assertFalse(used_llm)
+
+    def test_confident_non_resume_is_rejected_locally(self):
+        (is_resume, message), used_llm = self.classify(("invoice", document_classifier.CLASSIFIER_REJECT_THRESHOLD))
+        self.assertFalse(is_resume)
+        self.assertIn("invoice", message)
+        self.assertFalse(used_llm)
+
+    def test_uncertain_predictions_fall_back_to_the_llm(self):
+        for prediction in [
+            ("resume", document_classifier.CLASSIFIER_CONFIDENCE_THRESHOLD - 0.01),
+            ("invoice", document_classifier.CLASSIFIER_REJECT_THRESHOLD - 0.01),
+            None,
+        ]:
+            (is_resume, message), used_llm = self.classify(prediction)
+            self.assertTrue(used_llm, prediction)
+            self.assertEqual(message, "llm")
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Local HTTP stand-in for the link checker"""
+
+    def _respond(self):
+        port = self.server.server_address[1]
+        self.server.hosts.append(self.headers["Host"])
+        if self.path == "/ok":
+            self.send_response(200)
+        elif self.path == "/missing":
+            self.send_response(404)
+        elif self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/ok")
+        elif self.path == "/redirect-missing":
+            self.send_response(301)
+            self.send_header("Location", "/missing")
+        elif self.path == "/redirect-out":
+            self.send_response(302)
+            self.send_header("Location", f"http://localhost:{port}/ok")
+        elif self.path == "/no-head":
+            self.send_response(405 if self.command == "HEAD" else 206)
+        elif self.path == "/slow":
+            time.sleep(1.5)
+            self.send_response(200)
+        else:
+            self.send_response(500)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_HEAD = do_GET = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ResourceVerifierTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        cls.server.daemon_threads = True
+        cls.server.hosts = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def check(self, path, timeout=2):
+        # Only the stand-in's own address is allowed, so /redirect-out (to "localhost") is blocked
+        return resource_verifier.check_url(
+            self.base + path, timeout,
+            allow_url=lambda url: urlsplit(url).hostname == "127.0.0.1", allow_address=lambda address: address == "127.0.0.1",
+        )
+
+    def test_live_and_dead_links(self):
+        self.assertTrue(self.check("/ok"))
+        self.assertFalse(self.check("/missing"))
+
+    def test_redirects_are_followed(self):
+        self.assertTrue(self.check("/redirect"))
+        self.assertFalse(self.check("/redirect-missing"))
+
+    def test_redirect_to_disallowed_host_is_blocked(self):
+        self.assertFalse(self.check("/redirect-out"))
+
+    def test_head_rejection_retries_with_get(self):
+        self.assertTrue(self.check("/no-head"))
+
+    def test_timeout_counts_as_dead(self):
+        self.assertFalse(self.check("/slow", timeout=0.3))
+
+    def test_connection_to_a_rebound_private_address_is_refused(self):
+        # The pre-check saw a public address; by connect time the name resolves to loopback
+        port = self.server.server_address[1]
+        real_getaddrinfo = socket.getaddrinfo
+
+        def rebound(host, *args, **kwargs):
+            return real_getaddrinfo("127.0.0.1" if host == "rebind.test" else host, *args, **kwargs)
+
+        url = f"http://rebind.test:{port}/ok"
+        self.server.hosts.clear()
+        with mock.patch("socket.getaddrinfo", side_effect=rebound):
+            self.assertFalse(resource_verifier.check_url(url, 2, allow_url=lambda url: True))
+            self.assertEqual(self.server.hosts, [])
+            self.assertTrue(resource_verifier.check_url(url, 2, allow_url=lambda url: True, allow_address=lambda address: address == "127.0.0.1"))
+        self.assertEqual(self.server.hosts, [f"rebind.test:{port}"])
+
+    def test_private_and_non_http_urls_are_never_fetched(self):
+        with mock.patch("resource_verifier._request_status") as request:
+            for url in [
+                self.base + "/ok", "http://localhost/", "http://10.0.0.5/", "http://169.254.169.254/latest/meta-data",
+                "http://[::1]/", "file:///etc/passwd", "ftp://example.com/file",
+            ]:
+                self.assertFalse(resource_verifier.check_url(url), url)
+            request.assert_not_called()
+        self.assertTrue(resource_verifier.is_public_url("http://93.184.216.34/"))
+        self.assertFalse(resource_verifier.is_public_address("fe80::1%eth0"))
+        self.assertTrue(resource_verifier.is_public_address("2606:4700::1111"))
+
+    def test_learning_path_flags_and_dead_templates(self):
+        data = [{
+            "resources": [{"url": "https://live.example/a"}, {"url": "https://dead.example/b"}],
+            "projects": [{"name": "p", "github_template": "https://dead.example/b"}],
+        }]
+        with mock.patch("resource_verifier.check_url", side_effect=lambda url, timeout: "live" in url):
+            updated, stats = resource_verifier.verify_learning_path_resources(data)
+        self.assertEqual(stats, {"checked": 2, "live": 1, "dead": 1})
+        self.assertEqual([r["verified"] for r in updated[0]["resources"]], [True, False])
+        self.assertIsNone(updated[0]["projects"][0]["github_template"])
+        self.assertNotIn("verified", data[0]["resources"][0])
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ResumeExporterTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.ir = build_resume_ir(RESUME_DATA)
+
+    def test_html_is_escaped_and_themed(self):
+        html = resume_exporters.render_html(self.ir, "modern").decode("utf-8")
+        self.assertIn("Ada &lt;Lovelace&gt; &amp; Co", html)
+        self.assertNotIn("<Lovelace>", html)
+        self.assertIn(resume_exporters.HTML_THEME_ACCENTS["modern"], html)
+        self.assertIn("Wrote the first published program", html)
+
+    def test_plain_text_is_ats_friendly(self):
+        text = resume_exporters.render_plain_text(self.ir, "classic").decode("utf-8")
+        lines = text.splitlines()
+        self.assertEqual(lines[0], "ADA <LOVELACE> & CO")
+        self.assertIn("EXPERIENCE", lines)
+        self.assertIn("- Wrote the first published program", lines)
+        self.assertIn("Languages: Mathematics, French", lines)
+        self.assertNotIn("\t", text)
+
+    def test_docx_is_a_valid_deterministic_package(self):
+        output = resume_exporters.render_docx(self.ir, "classic")
+        self.assertEqual(output, resume_exporters.render_docx(self.ir, "classic"))
+        with zipfile.ZipFile(io.BytesIO(output)) as docx:
+            self.assertIn("[Content_Types].xml", docx.namelist())
+            document = ElementTree.fromstring(docx.read("word/document.xml"))
+        namespace = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+        text = "".join(node.text or "" for node in document.iter(f"{namespace}t"))
+        self.assertIn("Ada <Lovelace> & Co", text)
+        self.assertIn("Annotated Menabrea's paper", text)
+
+    def test_export_is_cached_by_content(self):
+        render = mock.Mock(return_value=b"text")
+        fmt = resume_exporters.EXPORT_FORMATS["txt"]._replace(render=render)
+        with mock.patch.dict(resume_exporters.EXPORT_FORMATS, {"txt": fmt}):
+            resume_exporters.export_resume(self.ir, "txt")
+            resume_exporters.export_resume(self.ir, "txt", "modern")
+            resume_exporters.export_resume(build_resume_ir(dict(RESUME_DATA, phone="555-0199")), "txt")
+        self.assertEqual(render.call_count, 2)
+
+    def test_pdf_exports_are_never_cached(self):
+        render = mock.Mock(side_effect=[b"fallback", b"compiled"])
+        fmt = resume_exporters.EXPORT_FORMATS["pdf"]._replace(render=render)
+        with mock.patch.dict(resume_exporters.EXPORT_FORMATS, {"pdf": fmt}):
+            self.assertEqual(resume_exporters.export_resume(self.ir, "pdf"), b"fallback")
+            self.assertEqual(resume_exporters.export_resume(self.ir, "pdf"), b"compiled")
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ResumeExportViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.user = User.objects.create_user(username="ada", password="pw")
+        self.client.force_login(self.user)
+        fields = {key: value for key, value in RESUME_DATA.items() if key != "name"}
+        self.resume = ResumeBuilder.objects.create(user=self.user, name="Ada", task_status="completed", **fields)
+
+    def export(self, fmt):
+        return self.client.get(reverse("hirevision:resume_builder_export", args=[self.resume.id, fmt]))
+
+    def test_built_pdf_is_served_without_compiling(self):
+        with override_settings(MEDIA_ROOT=self.media_root):
+            os.makedirs(os.path.join(self.media_root, tasks.GENERATED_RESUME_DIR))
+            self.resume.pdf_file.name = f"{tasks.GENERATED_RESUME_DIR}/{self.resume.id}.pdf"
+            with open(self.resume.pdf_file.path, "wb") as f:
+                f.write(b"%PDF-1.4 built")
+            self.resume.save()
+            with mock.patch("resume_exporters.render_pdf") as render, \
+                    mock.patch("hirevision.views.compile_resume_pdf_task") as compile_task:
+                response = self.export("pdf")
+                content = b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(content, b"%PDF-1.4 built")
+        render.assert_not_called()
+        compile_task.send.assert_not_called()
+
+    def test_missing_pdf_is_compiled_in_the_background_once(self):
+        with mock.patch("hirevision.views.compile_resume_pdf_task") as compile_task:
+            first, second = self.export("pdf"), self.export("pdf")
+        self.assertRedirects(first, reverse("hirevision:resume_builder_result", args=[self.resume.id]), fetch_redirect_response=False)
+        self.assertEqual(second.status_code, 302)
+        compile_task.send.assert_called_once_with(str(self.resume.id))
+
+    def test_pending_resume_does_not_queue_a_compile(self):
+        ResumeBuilder.objects.filter(id=self.resume.id).update(task_status="pending")
+        with mock.patch("hirevision.views.compile_resume_pdf_task") as compile_task:
+            self.assertEqual(self.export("pdf").status_code, 302)
+        compile_task.send.assert_not_called()
+
+    def test_compile_task_stores_the_pdf(self):
+        compiled = os.path.join(self.media_root, "compiled.pdf")
+        with open(compiled, "wb") as f:
+            f.write(b"%PDF-1.4 compiled")
+        with override_settings(MEDIA_ROOT=self.media_root), \
+                mock.patch("hirevision.tasks.generate_pdf_from_latex", return_value=compiled) as generate:
+            tasks.compile_resume_pdf_task(str(self.resume.id))
+            tasks.compile_resume_pdf_task(str(self.resume.id))
+            self.resume.refresh_from_db()
+            with open(self.resume.pdf_file.path, "rb") as f:
+                self.assertEqual(f.read(), b"%PDF-1.4 compiled")
+        generate.assert_called_once()
+        self.assertEqual(generate.call_args.kwargs["theme"], self.resume.theme)
+
+    def test_text_formats_are_rendered_inline(self):
+        response = self.export("txt")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"ADA", response.content)
+        self.assertIn("attachment", response["Content-Disposition"])
+
+
+class SampleResumeViewTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.path = os.path.join(self.directory, "sample.pdf")
+        self.content = b"%PDF-1.4 " + bytes(range(256)) * 4
+        with open(self.path, "wb") as f:
+            f.write(self.content)
+        patcher = mock.patch("pdf_generator.get_sample_pdf_path", return_value=self.path)
+        self.get_sample_pdf_path = patcher.start()
+        self.addCleanup(patcher.stop)
+        sample_patcher = mock.patch.object(sample_resume_cache, "_sample", None)
+        sample_patcher.start()
+        self.addCleanup(sample_patcher.stop)
+
+    def get(self, **headers):
+        return self.client.get(reverse("hirevision:sample_resume"), **headers)
+
+    def test_loaded_lazily_once_and_served_from_memory(self):
+        first = self.get()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.content, self.content)
+        self.assertIn("public", first["Cache-Control"])
+        os.remove(self.path)
+        self.assertEqual(self.get().content, self.content)
+        self.get_sample_pdf_path.assert_called_once()
+
+    def test_byte_ranges(self):
+        response = self.get(HTTP_RANGE="bytes=0-9")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, self.content[:10])
+        self.assertEqual(response["Content-Range"], f"bytes 0-9/{len(self.content)}")
+        suffix = self.get(HTTP_RANGE="bytes=-16")
+        self.assertEqual(suffix.content, self.content[-16:])
+        self.assertEqual(self.get(HTTP_RANGE=f"bytes={len(self.content)}-").status_code, 416)
+
+    def test_conditional_get(self):
+        etag = self.get()["ETag"]
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # A stale If-Range validator gets the whole file, not a fragment of a different one
+        response = self.get(HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, self.content)
+
+
+def process_alive(pid):
+    """True while pid is running; zombies awaiting a reaper count as dead"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return False
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class CompilePoolTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        if not os.path.isdir("/proc/self"):
+            self.skipTest("needs /proc")
+
+    def test_timeout_kills_the_whole_process_group(self):
+        before = pdf_generator.get_compile_pool_stats()
+        start = time.time()
+        with self.assertRaises(subprocess.TimeoutExpired) as raised:
+            pdf_generator.run_latex_process(["sh", "-c", "sleep 30 & echo $!; wait"], timeout=0.5)
+        self.assertLess(time.time() - start, 10)
+        child_pid = int(raised.exception.output.strip())
+        deadline = time.time() + 5
+        while process_alive(child_pid) and time.time() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(process_alive(child_pid))
+        after = pdf_generator.get_compile_pool_stats()
+        self.assertEqual(after["timed_out"], before["timed_out"] + 1)
+        self.assertEqual(after["running"], 0)
+
+    def test_limits_are_set_before_exec(self):
+        with mock.patch("pdf_generator.subprocess.Popen", wraps=subprocess.Popen) as popen:
+            result = pdf_generator.run_latex_process(["sh", "-c", "ulimit -v; ulimit -t"])
+        self.assertIsNone(popen.call_args.kwargs.get("preexec_fn"))  # not fork-safe in threaded workers
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.split(), [
+            str(pdf_generator.COMPILE_MEMORY_LIMIT_BYTES // 1024), str(pdf_generator.COMPILE_CPU_LIMIT_SECONDS),
+        ])
+
+    def test_full_pool_times_out_in_the_queue(self):
+        with mock.patch.object(pdf_generator, "_compile_slots", threading.BoundedSemaphore(1)) as slots, \
+                mock.patch.object(pdf_generator, "COMPILE_QUEUE_TIMEOUT", 0.1):
+            slots.acquire()
+            with self.assertRaises(subprocess.TimeoutExpired):
+                pdf_generator.run_latex_process(["true"])
+        self.assertGreaterEqual(pdf_generator.get_compile_pool_stats()["queue_timeouts"], 1)
+
+    def test_published_stats_are_aggregated_across_workers(self):
+        pdf_generator.run_latex_process(["true"])
+        self.assertTrue(pdf_generator.publish_compile_pool_stats())
+        with mock.patch("pdf_generator.os.getpid", return_value=1):
+            pdf_generator.publish_compile_pool_stats()
+        collected = pdf_generator.collect_compile_pool_stats()
+        self.assertEqual(len(collected["workers"]), 2)
+        own = pdf_generator.get_compile_pool_stats()
+        self.assertEqual(collected["totals"]["completed"], 2 * own["completed"])
+        self.assertEqual(collected["totals"]["max_concurrent"], 2 * pdf_generator.MAX_CONCURRENT_COMPILES)
+
+    def test_middleware_publishes_only_changed_stats(self):
+        middleware = worker_middleware.CompilePoolStatsMiddleware()
+        with mock.patch("pdf_generator.publish_compile_pool_stats") as publish:
+            pdf_generator.run_latex_process(["true"])
+            middleware.after_process_message(None, None)
+            middleware.after_skip_message(None, None)
+            self.assertEqual(publish.call_count, 1)
+            pdf_generator.run_latex_process(["true"])
+            middleware.after_process_message(None, None)
+            self.assertEqual(publish.call_count, 2)
+            with mock.patch.object(middleware, "REFRESH_INTERVAL", 0):
+                middleware.after_process_message(None, None)
+            self.assertEqual(publish.call_count, 3)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class CompilePoolStatusViewTests(TestCase):
+    def test_status_endpoint_is_staff_only(self):
+        url = reverse("hirevision:api_compile_pool_status")
+        self.client.force_login(User.objects.create_user(username="member", email="member@example.com", password="pw"))
+        self.assertEqual(self.client.get(url).status_code, 302)
+        self.client.force_login(User.objects.create_user(username="staff", email="staff@example.com", password="pw", is_staff=True))
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["workers"], [])
+
+
+class QueuePriorityTests(SimpleTestCase):
+    def tearDown(self):
+        importlib.reload(queues)
+
+    def test_priorities_come_from_settings(self):
+        with override_settings(DRAMATIQ_QUEUE_PRIORITIES={"bulk": 7}):
+            importlib.reload(queues)
+        self.assertEqual(queues.PRIORITY_BULK, 7)
+        self.assertEqual(queues.PRIORITY_INTERACTIVE, 0)
+
+    def test_defaults_without_the_setting(self):
+        with override_settings():
+            from django.conf import settings
+            del settings.DRAMATIQ_QUEUE_PRIORITIES
+            importlib.reload(queues)
+        self.assertEqual((queues.PRIORITY_INTERACTIVE, queues.PRIORITY_BACKGROUND, queues.PRIORITY_BULK), (0, 50, 100))
+
+    def test_actors_use_the_configured_priorities(self):
+        self.assertEqual(tasks.process_resume_builder_task.priority, queues.PRIORITY_INTERACTIVE)
+        self.assertEqual(tasks.precompute_learning_path_library_task.priority, queues.PRIORITY_BULK)
+
+
+OUTLINE_RESPONSE = json.dumps({
+    "role_analysis": "Data engineers build and operate the pipelines that move and model data for analytics.",
+    "skills_gap": ["Spark", "Airflow"],
+    "phases": [
+        {"phase": "Phase 1: Foundation", "duration": "2 months", "description": "SQL and Python for data"},
+        {"phase": "Phase 2: Pipelines", "duration": "3 months", "description": "Batch and streaming pipelines"},
+    ],
+    "timeline": "5 months",
+})
+
+
+def phase_response(skill):
+    return json.dumps({"skills_to_learn": [skill], "resource_skills": [], "projects": []})
+
+
+@mock.patch("utils.RETRY_DELAY", 0)
+class LearningPathFanOutTests(SimpleTestCase):
+    def fan_out(self, phase_replies):
+        """Run the fan-out with the outline answered normally and phase calls answered from phase_replies"""
+        def api_call(messages, system_message=None):
+            prompt = messages[0]["content"]
+            if "Detail ONE phase" not in prompt:
+                return OUTLINE_RESPONSE
+            reply = phase_replies["Phase 1" if "Phase 1: Foundation (" in prompt else "Phase 2"].pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        with mock.patch("learning_path_analyzer.make_api_call", side_effect=api_call) as make_api_call:
+            return learning_path_analyzer._analyze_learning_path_fan_out("Python, SQL", "Data Engineer"), make_api_call
+
+    def test_failed_phase_call_is_retried(self):
+        analysis, make_api_call = self.fan_out({
+            "Phase 1": [ConnectionError("connection reset"), "not json", phase_response("SQL")],
+            "Phase 2": [phase_response("Spark")],
+        })
+        self.assertEqual([phase["skills_to_learn"] for phase in analysis["learning_path"]], [["SQL"], ["Spark"]])
+        self.assertEqual(make_api_call.call_count, 5)
+
+    def test_phase_that_never_succeeds_fails_the_fan_out(self):
+        analysis, _ = self.fan_out({
+            "Phase 1": [phase_response("SQL")],
+            "Phase 2": [TimeoutError("timed out")] * 3,
+        })
+        self.assertIsNone(analysis)
+
+    def test_no_hollow_phase_reaches_the_caller(self):
+        with mock.patch("learning_path_analyzer._analyze_learning_path_fan_out", return_value=None), \
+                mock.patch("learning_path_analyzer.make_api_call", side_effect=ConnectionError("connection reset")):
+            result = learning_path_analyzer.analyze_learning_path("Python, SQL", "Data Engineer")
+        self.assertIsInstance(result, str)
+        self.assertTrue(result.startswith("## ❌"))
+
+
+class ResumeIRTests(SimpleTestCase):
+    def test_entries_follow_the_template_rules(self):
+        ir = build_resume_ir(dict(
+            RESUME_DATA,
+            education=RESUME_DATA["education"] + [{"institution": "No degree"}],
+            experience=RESUME_DATA["experience"] + [{"title": "No company"}],
+            skills={"Languages": "French", "Empty": []},
+        ))
+        self.assertEqual(len(ir.education), 1)
+        self.assertEqual(len(ir.experience), 1)
+        self.assertEqual(ir.experience[0].bullets, ("Wrote the first published program", "Annotated Menabrea's paper"))
+        self.assertEqual([(group.category, group.skills) for group in ir.skills], [("Languages", ("French",))])
+
+    def test_content_hash_tracks_content(self):
+        ir = build_resume_ir(RESUME_DATA)
+        self.assertEqual(ir.content_hash, build_resume_ir(dict(RESUME_DATA)).content_hash)
+        self.assertNotEqual(ir.content_hash, build_resume_ir(dict(RESUME_DATA, email="ada@example.org")).content_hash)
+
+    def test_template_data_round_trips(self):
+        ir = build_resume_ir(RESUME_DATA)
+        self.assertEqual(build_resume_ir(ir.to_template_data()), ir)
+
+    def test_validation_reports_each_missing_field(self):
+        ir = build_resume_ir({"name": "A", "education": [{"institution": "Somewhere"}]})
+        self.assertEqual([field for field, _ in validate_resume_ir(ir)], ["name", "education", "skills"])
+        self.assertEqual(validate_resume_ir(build_resume_ir(RESUME_DATA)), [])
+
+    def test_generation_validates_the_rebuilt_ir(self):
+        self.assertTrue(generate_latex_resume(build_resume_ir({"name": "Ada"})).startswith("Error:"))
+        latex = generate_latex_resume(build_resume_ir(RESUME_DATA), "classic")
+        self.assertIn("\\begin{document}", latex)
+        self.assertIn(escape_latex(RESUME_DATA["name"]), latex)
+
+
+@override_settings(SENDFILE_BACKEND=None)
+class ServeFileTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        self.path = os.path.join(directory, "resume.pdf")
+        self.content = bytes(range(256)) * 8
+        with open(self.path, "wb") as f:
+            f.write(self.content)
+        self.size = len(self.content)
+
+    def serve(self, **headers):
+        response = serve_file(RequestFactory().get("/download/", **headers), self.path, "resume.pdf", as_attachment=True)
+        body = b"".join(response.streaming_content) if response.streaming else response.content
+        return response, body
+
+    def test_full_download_has_validators(self):
+        response, body = self.serve()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body, self.content)
+        self.assertEqual(response["ETag"], file_etag(os.stat(self.path)))
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_open_ended_range(self):
+        response, body = self.serve(HTTP_RANGE="bytes=0-")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(body, self.content)
+        self.assertEqual(response["Content-Range"], f"bytes 0-{self.size - 1}/{self.size}")
+        response, body = self.serve(HTTP_RANGE="bytes=100-")
+        self.assertEqual(body, self.content[100:])
+
+    def test_suffix_range(self):
+        response, body = self.serve(HTTP_RANGE="bytes=-10")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(body, self.content[-10:])
+        self.assertEqual(response["Content-Length"], "10")
+        # A suffix longer than the file is the whole file
+        self.assertEqual(self.serve(HTTP_RANGE=f"bytes=-{self.size * 2}")[1], self.content)
+
+    def test_unsatisfiable_range(self):
+        for header in (f"bytes={self.size}-", "bytes=-0"):
+            response, _ = self.serve(HTTP_RANGE=header)
+            self.assertEqual(response.status_code, 416, header)
+            self.assertEqual(response["Content-Range"], f"bytes */{self.size}")
+
+    def test_malformed_and_multi_ranges_get_the_whole_file(self):
+        for header in ("bytes=5-1", "bytes=0-1,5-6", "items=0-1"):
+            response, body = self.serve(HTTP_RANGE=header)
+            self.assertEqual((response.status_code, body), (200, self.content), header)
+
+    def test_if_none_match(self):
+        etag = self.serve()[0]["ETag"]
+        self.assertEqual(self.serve(HTTP_IF_NONE_MATCH=etag)[0].status_code, 304)
+        self.assertEqual(self.serve(HTTP_IF_NONE_MATCH='"other"')[0].status_code, 200)
+
+    def test_stale_if_range_gets_the_whole_file(self):
+        response, body = self.serve(HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"')
+        self.assertEqual((response.status_code, body), (200, self.content))
+
+
+class PdfCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        cache_dir = os.path.join(self.directory, "cache")
+        os.makedirs(cache_dir)
+        patcher = mock.patch.object(pdf_generator, "PDF_CACHE_DIR", cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def cache_entry(self, key, size=100, used_at=None):
+        path = pdf_generator._pdf_cache_path(key)
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        if used_at is not None:
+            os.utime(path, (used_at, used_at))
+        return path
+
+    def test_cache_hit_leaves_published_validators_alone(self):
+        self.cache_entry("key", used_at=time.time() - 3600)
+        published = os.path.join(self.directory, "media", "resume.pdf")
+        pdf_generator.publish_pdf(pdf_generator._pdf_cache_path("key"), published)
+        etag = file_etag(os.stat(published))
+
+        self.assertEqual(pdf_generator.get_cached_pdf("key"), pdf_generator._pdf_cache_path("key"))
+        self.assertEqual(file_etag(os.stat(published)), etag)
+        self.assertGreater(os.stat(published).st_atime, time.time() - 60)
+
+    def test_eviction_removes_least_recently_used(self):
+        now = time.time()
+        for age, key in enumerate(["newest", "middle", "oldest"]):
+            self.cache_entry(key, used_at=now - 100 * (age + 1))
+        pdf_generator.get_cached_pdf("oldest")
+        self.assertEqual(pdf_generator.evict_pdf_cache(max_bytes=200), 1)
+        remaining = sorted(os.listdir(pdf_generator.PDF_CACHE_DIR))
+        self.assertEqual(remaining, ["newest.pdf", "oldest.pdf"])
+
+    def test_miss(self):
+        self.assertIsNone(pdf_generator.get_cached_pdf("absent"))
+
+
+REQUIREMENTS_RESPONSE = json.dumps({
+    "job_title": "Backend Engineer",
+    "seniority": "mid",
+    "min_years_experience": 3,
+    "education": None,
+    "must_have_skills": ["Python", "Django", "SQL"],
+    "nice_to_have_skills": [],
+    "responsibilities": ["Run production APIs"],
+    "keywords": ["REST"],
+})
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class JobRequirementsCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def extract(self, job_description, response=REQUIREMENTS_RESPONSE):
+        with mock.patch("resume_analyzer.make_api_call", return_value=response) as make_api_call:
+            return resume_analyzer.extract_job_requirements(job_description), make_api_call.call_count
+
+    def test_requirements_are_extracted_once_per_posting(self):
+        requirements, calls = self.extract(JOB_DESCRIPTION)
+        self.assertEqual(requirements["must_have_skills"], ["Python", "Django", "SQL"])
+        self.assertEqual(calls, 1)
+        # Re-pasted with different line breaks, spacing and case
+        cached, calls = self.extract("  " + JOB_DESCRIPTION.upper().replace(" ", "\n  "))
+        self.assertEqual((cached, calls), (requirements, 0))
+        self.assertEqual(self.extract(JOB_DESCRIPTION + " Kubernetes a plus.")[1], 1)
+
+    def test_unusable_extractions_are_not_cached(self):
+        for response in ("not json", json.dumps({"must_have_skills": []})):
+            self.assertEqual(self.extract(JOB_DESCRIPTION, response), (None, 1))
+        self.assertEqual(self.extract(JOB_DESCRIPTION)[1], 1)
+
+    def test_api_errors_fall_back_to_the_full_description(self):
+        with mock.patch("resume_analyzer.make_api_call", side_effect=ConnectionError("connection reset")):
+            self.assertIsNone(resume_analyzer.extract_job_requirements(JOB_DESCRIPTION))
+
+    def test_scoring_prompt_uses_the_extracted_requirements(self):
+        self.extract(JOB_DESCRIPTION)
+        with mock.patch("resume_analyzer.make_api_call", return_value="{}") as make_api_call:
+            resume_analyzer.analyze_resume(RESUME_TEXT, JOB_DESCRIPTION)
+        prompt = make_api_call.call_args.args[0][0]["content"]
+        self.assertIn("JOB REQUIREMENTS (extracted from the job description):", prompt)
+        self.assertIn("- Must-have skills: Python; Django; SQL", prompt)
+        self.assertNotIn(JOB_DESCRIPTION, prompt)
+
+
+class ResourceCatalogTests(SimpleTestCase):
+    def test_shipped_catalog_is_well_formed(self):
+        skill_ids = resource_catalog.get_catalog_skill_ids()
+        self.assertIn("python", skill_ids)
+        index = resource_catalog.load_catalog()
+        for skill_id in skill_ids:
+            resources = index.skills[skill_id]["resources"]
+            self.assertTrue(resources, skill_id)
+            for entry in resources:
+                self.assertTrue(entry["url"].startswith("https://"), entry)
+                self.assertIn(entry["difficulty"], ("beginner", "intermediate", "advanced"), entry)
+
+    def test_free_text_matching(self):
+        self.assertEqual(resource_catalog.match_catalog_skills(["Advanced Python programming", "SQL joins"]), ["python", "sql"])
+        self.assertEqual(resource_catalog.match_catalog_skills(["PostgreSQL tuning"]), ["postgresql"])
+        self.assertEqual(resource_catalog.match_catalog_skills(["go beyond the rest of the basics"]), [])
+
+    def test_phase_resources_prefer_requested_skills_and_spread_across_them(self):
+        resources = resource_catalog.resolve_phase_resources(["sql", "not_a_skill"], ["Python scripting"])
+        self.assertEqual([entry["catalog_skill"] for entry in resources[:2]], ["sql", "python"])
+        self.assertLessEqual(len(resources), resource_catalog.MAX_RESOURCES_PER_PHASE)
+        self.assertTrue(all(entry["verified"] for entry in resources))
+        self.assertEqual(len({entry["url"] for entry in resources}), len(resources))
+        self.assertNotEqual(resources[0]["type"], "project")
+
+    def test_attach_replaces_skill_ids_with_resources(self):
+        learning_path = [{"phase": "Phase 1", "skills_to_learn": ["Python"], "resource_skills": ["sql"]}, "junk"]
+        resource_catalog.attach_catalog_resources(learning_path)
+        self.assertNotIn("resource_skills", learning_path[0])
+        self.assertEqual(learning_path[0]["resources"][0]["catalog_skill"], "sql")
+
+    def test_missing_catalog_resolves_nothing(self):
+        with mock.patch.object(resource_catalog, "_index", None):
+            self.assertIsNone(resource_catalog.load_catalog("/nonexistent/catalog.json"))
+            self.assertEqual(resource_catalog.resolve_phase_resources(["python"]), [])
+
+
+def fake_pdflatex(returncode=0, stdout=""):
+    """run_latex_process stand-in that writes the .fmt or .pdf pdflatex would have produced"""
+    def run(args, timeout=None, env=None, cwd=None):
+        output_dir = args[args.index("-output-directory") + 1]
+        jobname = next(arg.split("=", 1)[1] for arg in args if arg.startswith("-jobname="))
+        if returncode == 0:
+            with open(os.path.join(output_dir, jobname + (".fmt" if "-ini" in args else ".pdf")), "wb") as f:
+                f.write(b"output")
+        return subprocess.CompletedProcess(args, returncode, stdout, "")
+    return mock.Mock(side_effect=run)
+
+
+class PreambleFormatTests(SimpleTestCase):
+    PREAMBLE = "\\documentclass{article}\n\\usepackage{titlesec}\n"
+    DOCUMENT = PREAMBLE + "\\begin{document}\nHello\n\\end{document}\n"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        for name, value in (("LATEX_FORMAT_DIR", os.path.join(self.directory, "formats")), ("_failed_formats", set())):
+            patcher = mock.patch.object(pdf_generator, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_split_and_format_names(self):
+        preamble, body = pdf_generator.split_preamble(self.DOCUMENT)
+        self.assertEqual(preamble, self.PREAMBLE)
+        self.assertTrue(body.startswith("\\begin{document}"))
+        self.assertIsNone(pdf_generator.split_preamble("no document here"))
+        name = pdf_generator._format_name(self.PREAMBLE)
+        self.assertEqual(name, pdf_generator._format_name(self.PREAMBLE))
+        self.assertNotEqual(name, pdf_generator._format_name(self.PREAMBLE + "%"))
+        with mock.patch.object(pdf_generator, "LATEX_FORMAT_VERSION", pdf_generator.LATEX_FORMAT_VERSION + 1):
+            self.assertNotEqual(name, pdf_generator._format_name(self.PREAMBLE))
+
+    def test_format_is_built_once(self):
+        run = fake_pdflatex()
+        with mock.patch("pdf_generator.run_latex_process", run):
+            name = pdf_generator.get_preamble_format(self.PREAMBLE)
+            self.assertEqual(pdf_generator.get_preamble_format(self.PREAMBLE), name)
+        self.assertEqual(run.call_count, 1)
+        self.assertIn("-ini", run.call_args.args[0])
+        self.assertTrue(os.path.exists(os.path.join(pdf_generator.LATEX_FORMAT_DIR, f"{name}.fmt")))
+
+    def test_failed_build_is_not_retried(self):
+        run = fake_pdflatex(returncode=1)
+        with mock.patch("pdf_generator.run_latex_process", run):
+            self.assertIsNone(pdf_generator.get_preamble_format(self.PREAMBLE))
+            self.assertIsNone(pdf_generator.get_preamble_format(self.PREAMBLE))
+        self.assertEqual(run.call_count, 1)
+
+    def test_warm_compile_uses_the_format(self):
+        run = fake_pdflatex()
+        with mock.patch("pdf_generator.run_latex_process", run):
+            pdf_path = pdf_generator._compile_with_preamble_format(self.DOCUMENT, "resume", self.directory)
+        self.assertEqual(pdf_path, os.path.join(self.directory, "resume.pdf"))
+        args, env = run.call_args.args[0], run.call_args.kwargs["env"]
+        self.assertIn(f"-fmt={pdf_generator._format_name(self.PREAMBLE)}", args)
+        self.assertTrue(env["TEXFORMATS"].startswith(os.path.abspath(pdf_generator.LATEX_FORMAT_DIR)))
+        with open(args[-1], encoding="utf-8") as f:
+            body = f.read()
+        self.assertTrue(body.startswith(pdf_generator.LATEX_FORMAT_BODY_PRELUDE))
+        self.assertNotIn("\\documentclass", body)
+
+    def test_stale_format_is_discarded(self):
+        with mock.patch("pdf_generator.run_latex_process", fake_pdflatex()):
+            name = pdf_generator.get_preamble_format(self.PREAMBLE)
+        stale = fake_pdflatex(returncode=1, stdout="---! Fatal format file error; I'm stymied")
+        with mock.patch("pdf_generator.run_latex_process", stale):
+            self.assertIsNone(pdf_generator._compile_with_preamble_format(self.DOCUMENT, "resume", self.directory))
+        self.assertFalse(os.path.exists(os.path.join(pdf_generator.LATEX_FORMAT_DIR, f"{name}.fmt")))
+
+
+class LatexTemplateTests(SimpleTestCase):
+    def test_document_renders_escaped_sections_in_order(self):
+        document = latex_templates.render_latex_document(RESUME_DATA)
+        self.assertTrue(document.startswith(latex_templates.get_theme().preamble))
+        self.assertTrue(document.endswith("\\end{document}"))
+        self.assertIn("\\scshape Ada \\textless{}Lovelace\\textgreater{} \\& Co}", document)
+        self.assertIn("\\href{mailto:ada@example.com}{\\underline{ada@example.com}}", document)
+        self.assertIn("\\resumeItem{Annotated Menabrea's paper}", document)
+        positions = [document.index(f"\\section{{{title}}}") for title in ("Education", "Experience", "Projects", "Technical Skills", "Achievements")]
+        self.assertEqual(positions, sorted(positions))
+        self.assertNotIn("\\section{Research Papers}", document)
+
+    def test_sections_assemble_the_document(self):
+        sections = [latex_templates.render_section("heading", RESUME_DATA)]
+        sections += [latex_templates.render_section(name, RESUME_DATA) for name, _ in latex_templates.SECTION_RENDERERS]
+        self.assertEqual(latex_templates.render_section("research_papers", RESUME_DATA), "")
+        document = latex_templates.render_latex_document(RESUME_DATA)
+        self.assertIn("".join(sections), document)
+
+    def test_themes_are_compiled_once_and_unknown_names_fall_back(self):
+        classic = latex_templates.get_theme("classic")
+        self.assertIs(latex_templates.get_theme("classic"), classic)
+        self.assertIs(latex_templates.get_theme("no-such-theme"), classic)
+        self.assertNotEqual(latex_templates.get_theme("modern").preamble, classic.preamble)
+        self.assertIn("\\LARGE \\scshape", latex_templates.render_section("heading", RESUME_DATA, "compact"))
+        self.assertNotIn("<<", classic.preamble)
+
+    def test_description_items_and_urls(self):
+        self.assertEqual(latex_templates.description_items("* one\n\n• two\n - three"), ["one", "two", "three"])
+        self.assertEqual(latex_templates.description_items(["a", 3, "- b"]), ["a", "b"])
+        self.assertEqual(latex_templates.description_items(None), [])
+        self.assertEqual(latex_templates.escape_url("https://x.dev/a%20b#top{}"), "https://x.dev/a\\%20b\\#top")
+
+
+class ResumePdfRendererTests(SimpleTestCase):
+    def test_blocks_escape_markup_and_skip_empty_sections(self):
+        heading, education, experience, projects, skills, research, achievements, others = resume_pdf_renderer.build_resume_blocks(RESUME_DATA)
+        self.assertEqual(heading[0], ("name", "Ada &lt;Lovelace&gt; &amp; Co"))
+        self.assertEqual(heading[1], ("contact", "555-0100 | ada@example.com"))
+        self.assertEqual(education[0], ("section", "Education"))
+        self.assertEqual([block for block in experience if block[0] == "bullet"], [
+            ("bullet", "Wrote the first published program"), ("bullet", "Annotated Menabrea's paper"),
+        ])
+        self.assertEqual(projects[1], ("row", "Note G | <i>Bernoulli numbers</i>", ""))
+        self.assertEqual(skills[1], ("line", "<b>Languages</b>: Mathematics, French"))
+        self.assertEqual((research, others), ([], []))
+        self.assertEqual(resume_pdf_renderer.build_section_blocks("education", {"education": [{"institution": "No degree"}]}), [])
+
+    def test_renders_pdf_bytes_or_writes_output_path(self):
+        pdf_bytes = resume_pdf_renderer.render_resume_pdf(RESUME_DATA, "modern")
+        self.assertTrue(pdf_bytes.startswith(b"%PDF"))
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        output_path = os.path.join(directory, "out", "resume.pdf")
+        self.assertEqual(resume_pdf_renderer.render_resume_pdf(RESUME_DATA, "no-such-theme", output_path=output_path), output_path)
+        with open(output_path, "rb") as f:
+            self.assertTrue(f.read().startswith(b"%PDF"))
+
+    def test_rendering_failure_returns_none(self):
+        with mock.patch("resume_pdf_renderer.render_blocks_to_pdf", side_effect=ValueError("layout")):
+            self.assertIsNone(resume_pdf_renderer.render_resume_pdf(RESUME_DATA))
+
+    def test_alternative_generation_prefers_structured_data(self):
+        with mock.patch("resume_pdf_renderer.render_resume_pdf", return_value="pdfs/resume.pdf") as render:
+            self.assertEqual(pdf_generator.generate_pdf_alternative("ignored", "resume", RESUME_DATA, "compact"), "pdfs/resume.pdf")
+        render.assert_called_once_with(RESUME_DATA, "compact", output_path=os.path.join("pdfs", "resume.pdf"))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ResumePreviewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def post_preview(self, data, **extra):
+        return self.client.post(reverse("hirevision:resume_preview"), data=json.dumps(data), content_type="application/json", **extra)
+
+    def test_debounce_per_client(self):
+        with mock.patch("resume_preview.time.time", return_value=1000.0):
+            self.assertEqual(resume_preview.check_preview_debounce("user:1"), 0)
+            self.assertAlmostEqual(resume_preview.check_preview_debounce("user:1"), resume_preview.PREVIEW_MIN_INTERVAL)
+            self.assertEqual(resume_preview.check_preview_debounce("user:2"), 0)
+        with mock.patch("resume_preview.time.time", return_value=1000.0 + resume_preview.PREVIEW_MIN_INTERVAL):
+            self.assertEqual(resume_preview.check_preview_debounce("user:1"), 0)
+
+    def test_only_changed_sections_are_rebuilt(self):
+        pdf_bytes, stats = resume_preview.render_resume_preview(RESUME_DATA)
+        self.assertTrue(pdf_bytes.startswith(b"%PDF"))
+        self.assertEqual(stats, {"rendered": len(resume_pdf_renderer.SECTION_ORDER), "cached": 0})
+        with mock.patch("resume_preview.render_blocks_to_pdf") as render:
+            self.assertEqual(resume_preview.render_resume_preview(RESUME_DATA)[0], pdf_bytes)
+        render.assert_not_called()
+        _, stats = resume_preview.render_resume_preview(dict(RESUME_DATA, skills={"Languages": ["Mathematics"]}))
+        self.assertEqual(stats, {"rendered": 1, "cached": len(resume_pdf_renderer.SECTION_ORDER) - 1})
+
+    def test_view_renders_then_debounces(self):
+        response = self.post_preview(RESUME_DATA)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["Cache-Control"], "no-store")
+        self.assertEqual(response["X-Preview-Sections-Cached"], "0")
+        response = self.post_preview(RESUME_DATA)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "1")
+        self.assertEqual(self.post_preview(RESUME_DATA, REMOTE_ADDR="10.0.0.2").status_code, 200)
+
+    def test_view_rejects_bad_requests(self):
+        self.assertEqual(self.client.get(reverse("hirevision:resume_preview")).status_code, 405)
+        self.assertEqual(self.post_preview({"name": "x" * resume_preview.PREVIEW_MAX_BYTES}).status_code, 413)
+        self.assertEqual(self.post_preview(["not", "an", "object"], REMOTE_ADDR="10.0.0.3").status_code, 400)
+
+
+def fake_batch_pdflatex(pages_per_document):
+    """run_latex_process stand-in for a batch run: one page per mark, plus the .marks file"""
+    def run(args, timeout=None, env=None, cwd=None):
+        from reportlab.pdfgen import canvas
+
+        output_dir = args[args.index("-output-directory") + 1]
+        jobname = next(arg.split("=", 1)[1] for arg in args if arg.startswith("-jobname="))
+        pdf = canvas.Canvas(os.path.join(output_dir, jobname + ".pdf"))
+        marks, page = [], 1
+        for index, pages in enumerate(pages_per_document):
+            marks.append(f"{index} {page}\n")
+            for _ in range(pages):
+                pdf.drawString(72, 720, f"document {index}")
+                pdf.showPage()
+                page += 1
+        pdf.save()
+        with open(os.path.join(output_dir, jobname + ".marks"), "w", encoding="utf-8") as f:
+            f.writelines(marks)
+        return subprocess.CompletedProcess(args, 0, "", "")
+    return mock.Mock(side_effect=run)
+
+
+class BatchCompileTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        for name, value in (("PDF_CACHE_ENABLED", False), ("LATEX_FORMAT_ENABLED", False), ("PDF_BUILD_DIR", self.directory)):
+            patcher = mock.patch.object(pdf_generator, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_inner_body(self):
+        self.assertEqual(pdf_generator._document_inner_body("\\begin{document}\nHi\n\\end{document}\n"), "\nHi\n")
+        self.assertEqual(pdf_generator._document_inner_body("\\begin{document}\nunterminated"), "\nunterminated")
+
+    def test_documents_are_grouped_by_preamble(self):
+        first, second, third = (latex_document(f"Body {n}") for n in range(3))
+        other = latex_document("Other", preamble="\\usepackage{xcolor}\n")
+        documents = [first, other, second, first, "no document environment", third]
+        compiled = {}
+
+        def compile_group(preamble, bodies, filename, temp_dir):
+            compiled[preamble] = bodies
+            return [f"{filename}_{index}.pdf" for index in range(len(bodies))]
+
+        with mock.patch("pdf_generator._compile_batch_group", side_effect=compile_group), \
+                mock.patch("pdf_generator._store_compiled_pdf", side_effect=lambda pdf_path, *args: pdf_path), \
+                mock.patch("pdf_generator.generate_pdf_from_latex", side_effect=lambda latex: f"single:{latex[-30:]}") as single:
+            results = pdf_generator.generate_pdfs_from_latex_batch(documents)
+
+        self.assertEqual(list(compiled), ["\\documentclass{article}\n"])
+        self.assertEqual(len(compiled["\\documentclass{article}\n"]), 3)
+        self.assertEqual([call.args[0] for call in single.call_args_list], [other, "no document environment"])
+        self.assertEqual(results[3], results[0])
+        self.assertTrue(results[0].endswith("_0.pdf") and results[2].endswith("_1.pdf") and results[5].endswith("_2.pdf"))
+        self.assertTrue(results[1].startswith("single:"))
+
+    def test_failed_group_falls_back_to_single_compiles(self):
+        documents = [latex_document(f"Body {n}") for n in range(2)]
+        with mock.patch("pdf_generator._compile_batch_group", return_value=None), \
+                mock.patch("pdf_generator.generate_pdf_from_latex", side_effect=lambda latex: "single") as single:
+            self.assertEqual(pdf_generator.generate_pdfs_from_latex_batch(documents), ["single", "single"])
+        self.assertEqual(single.call_count, 2)
+
+    def test_group_output_is_split_at_the_marks(self):
+        from PyPDF2 import PdfReader
+
+        bodies = [f"\\begin{{document}}\nBody {n}\n\\end{{document}}\n" for n in range(3)]
+        with mock.patch("pdf_generator.run_latex_process", fake_batch_pdflatex([1, 2, 1])) as run:
+            outputs = pdf_generator._compile_batch_group("\\documentclass{article}\n", bodies, "batch", self.directory)
+        self.assertEqual([len(PdfReader(path).pages) for path in outputs], [1, 2, 1])
+        with open(run.call_args.args[0][-1], encoding="utf-8") as f:
+            source = f.read()
+        self.assertEqual(source.count("\\begin{document}"), 1)
+        self.assertEqual(source.count("\\begingroup"), 3)
+
+    def test_mismatched_marks_fail_the_group(self):
+        bodies = [f"\\begin{{document}}\nBody {n}\n\\end{{document}}\n" for n in range(3)]
+        with mock.patch("pdf_generator.run_latex_process", fake_batch_pdflatex([1, 1])):
+            self.assertIsNone(pdf_generator._compile_batch_group("\\documentclass{article}\n", bodies, "batch", self.directory))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class SubmissionDedupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="grace", email="grace@example.com", password="pw")
+
+    def test_key_depends_on_kind_user_and_inputs(self):
+        key = dedup.submission_key("resume_builder", self.user.id, {"b": 1, "a": 2}, "text")
+        self.assertEqual(key, dedup.submission_key("resume_builder", self.user.id, {"a": 2, "b": 1}, "text"))
+        self.assertTrue(key.startswith(f"task_submission:resume_builder:{self.user.id}:"))
+        self.assertNotEqual(key, dedup.submission_key("resume_builder", self.user.id, {"a": 2, "b": 1}, "other"))
+        self.assertNotEqual(key, dedup.submission_key("learning_path", self.user.id, {"a": 2, "b": 1}, "text"))
+        self.assertNotEqual(key, dedup.submission_key("resume_builder", "anon", {"a": 2, "b": 1}, "text"))
+
+    def test_file_digest_rewinds(self):
+        upload = SimpleUploadedFile("resume.pdf", b"%PDF-1.4 test")
+        self.assertEqual(dedup.file_digest(upload), dedup.file_digest(upload))
+        self.assertEqual(upload.read(), b"%PDF-1.4 test")
+
+    @mock.patch("hirevision.dedup.SUBMISSION_CLAIM_WAIT", 0.2)
+    def test_claim_record_and_release(self):
+        key = dedup.submission_key("resume_builder", self.user.id, "inputs")
+        self.assertIsNone(dedup.claim_submission(key))
+        self.assertIsNone(dedup.claim_submission(key))  # still pending after the wait: submit anyway
+        dedup.record_submission(key, 42)
+        self.assertEqual(dedup.claim_submission(key), "42")
+        dedup.release_submission(key)
+        self.assertIsNone(dedup.claim_submission(key))
+
+    def test_claim_without_a_cache_skips_dedup(self):
+        with mock.patch.object(cache, "add", side_effect=ConnectionError("down")):
+            self.assertIsNone(dedup.claim_submission("task_submission:x"))
+            self.assertTrue(dedup.claim_job("x"))
+
+    def test_find_duplicate_ignores_failed_and_foreign_records(self):
+        resume = ResumeBuilder.objects.create(user=self.user, name="Grace", task_status="processing")
+        key = dedup.submission_key("resume_builder", self.user.id, "inputs")
+        self.assertIsNone(dedup.find_duplicate_submission(key, ResumeBuilder, self.user))
+        dedup.record_submission(key, resume.id)
+        self.assertEqual(dedup.find_duplicate_submission(key, ResumeBuilder, self.user), resume)
+        other = User.objects.create_user(username="alan", email="alan@example.com", password="pw")
+        self.assertIsNone(dedup.find_duplicate_submission(key, ResumeBuilder, other))
+        ResumeBuilder.objects.filter(id=resume.id).update(task_status="failed")
+        self.assertIsNone(dedup.find_duplicate_submission(key, ResumeBuilder, self.user))
+
+    def test_job_is_claimed_once_per_ttl(self):
+        self.assertTrue(dedup.claim_job("compile_pdf:1"))
+        self.assertFalse(dedup.claim_job("compile_pdf:1"))
+        self.assertTrue(dedup.claim_job("compile_pdf:2"))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class TaskProgressTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.resume = ResumeBuilder.objects.create(name="Ada", task_status="processing")
+
+    def test_stages_are_published_live(self):
+        progress = TaskProgress("resume_builder", ResumeBuilder, self.resume.id)
+        with progress.stage("build"):
+            pass
+        progress.start_stage("compile")
+        payload = get_progress("resume_builder", self.resume)
+        self.assertEqual(payload["stage"], "compile")
+        self.assertEqual((payload["completed_stages"], payload["total_stages"], payload["percent"]), (1, 3, 33))
+        self.assertEqual([stage["status"] for stage in payload["stages"]], ["completed", "running"])
+        self.assertIsNotNone(payload["stages"][0]["duration"])
+
+    def test_failed_stage_and_persisted_timings(self):
+        progress = TaskProgress("resume_builder", ResumeBuilder, self.resume.id)
+        with self.assertRaises(RuntimeError), progress.stage("build"):
+            raise RuntimeError("boom")
+        progress.start_stage("build")
+        progress.persist()  # the open retry is recorded as failed
+        self.resume.refresh_from_db()
+        self.assertEqual([stage["status"] for stage in self.resume.stage_timings], ["failed", "failed"])
+
+        cache.clear()
+        self.assertEqual(get_progress("resume_builder", self.resume)["stages"], self.resume.stage_timings)
+
+    def test_pipeline_stages_continue_across_actors(self):
+        first = TaskProgress("resume_builder", ResumeBuilder, self.resume.id)
+        with first.stage("build"):
+            pass
+        second = TaskProgress.load("resume_builder", ResumeBuilder, self.resume.id)
+        with second.stage("build"):  # a retried stage is counted once
+            pass
+        with second.stage("compile"):
+            pass
+        payload = get_progress("resume_builder", self.resume)
+        self.assertEqual(len(payload["stages"]), 3)
+        self.assertEqual((payload["completed_stages"], payload["percent"]), (2, 66))
+
+        ResumeBuilder.objects.filter(id=self.resume.id).update(task_status="completed")
+        self.client.force_login(User.objects.create_user(username="ada", email="ada@example.com", password="pw"))
+        response = self.client.get(reverse("hirevision:api_resume_builder_status", args=[self.resume.id]))
+        self.assertEqual(response.json()["progress"]["percent"], 100)
@@ -27,6 +27,7 @@ urlpatterns = [
     path('api/resume-analysis/<uuid:analysis_id>/status/', views.check_resume_analysis_status, name='api_resume_analysis_status'),
     path('api/learning-path/<uuid:path_id>/status/', views.check_learning_path_status, name='api_learning_path_status'),
     path('api/resume-builder/<uuid:resume_id>/status/', views.check_resume_builder_status, name='api_resume_builder_status'),
+    path('api/compile-pool/status/', views.compile_pool_status, name='api_compile_pool_status'),
     
     # Learning Path
     path('learning-path/', views.learning_path_analyzer, name='learning_path_analyzer'),
@@ -38,6 +39,8 @@ urlpatterns = [
     path('resume-builder/<uuid:resume_id>/', views.resume_builder_result, name='resume_builder_result'),
     path('check-resume-builder-status/<uuid:resume_id>/', views.check_resume_builder_status, name='check_resume_builder_status'),
     path('download-pdf/<uuid:resume_id>/', views.download_pdf, name='download_pdf'),
+    path('resume-builder/preview/', views.resume_preview, name='resume_preview'),
+    path('resume-builder/<uuid:resume_id>/export/<str:fmt>/', views.resume_builder_export, name='resume_builder_export'),
     
     # Sample Resume
     path('sample-resume/', views.sample_resume, name='sample_resume'),
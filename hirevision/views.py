@@ -6,22 +6,32 @@ from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.decorators import login_required
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.forms import AuthenticationForm
 from django.http import Http404
+from django.utils.http import content_disposition_header
 from django.db.models import Q
 import json
+import math
 import os
 import time
 
 from .forms import ResumeAnalysisForm, LearningPathForm, ResumeBuilderForm, UserSignUpForm, UserLoginForm, ThreadForm, CommentForm, MessageForm, UserSearchForm
 from .models import ResumeAnalysis, LearningPath, ResumeBuilder, User, Thread, Comment, ThreadLike, Message, Conversation
-from .tasks import process_resume_analysis_task, process_learning_path_task, process_resume_builder_task
+from .tasks import start_resume_analysis_pipeline, process_learning_path_task, process_resume_builder_task, compile_resume_pdf_task
+from .downloads import serve_file, serve_bytes
+from .progress import get_progress
+from .dedup import file_digest, submission_key, find_duplicate_submission, record_submission, release_submission, claim_job
 
 # Import the existing modules
 from resume_analyzer import process_resume_analysis
 from learning_path_analyzer import process_learning_path_analysis
 from resume_builder import process_resume_builder
-from pdf_generator import get_sample_pdf_path, generate_pdf_from_latex
+from sample_resume_cache import get_sample_resume, SAMPLE_RESUME_MAX_AGE
+from resume_preview import render_resume_preview, check_preview_debounce, PREVIEW_MAX_BYTES
+from resume_ir import resume_ir_from_model
+from resume_exporters import EXPORT_FORMATS, export_resume
+from pdf_generator import collect_compile_pool_stats
 
 # Import logging
 from logging_config import get_logger, log_user_action, log_performance
@@ -118,9 +128,21 @@ def resume_analyzer(request):
         logger.info(f"Resume analysis form submitted by user: {user_id}")
         form = ResumeAnalysisForm(request.POST, request.FILES)
         if form.is_valid():
+            dedup_key = None
             try:
                 logger.debug("Form validation successful, processing resume analysis")
                 
+                # Same file and job description within the dedup window: reuse the existing analysis
+                dedup_key = submission_key(
+                    'resume_analysis', user_id,
+                    file_digest(form.cleaned_data['resume_file']), form.cleaned_data.get('job_description') or '',
+                )
+                existing = find_duplicate_submission(dedup_key, ResumeAnalysis, request.user)
+                if existing:
+                    log_user_action(str(user_id), "duplicate_resume_analysis", f"Reused analysis: {existing.id}")
+                    messages.info(request, "This resume is already being analyzed. Showing the existing analysis.")
+                    return redirect('hirevision:resume_analysis_result', analysis_id=existing.id)
+                
                 # Save the form to get the model instance
                 analysis = form.save(commit=False)
                 
@@ -132,12 +154,13 @@ def resume_analyzer(request):
                 analysis.save()
                 logger.info(f"Resume analysis record created with ID: {analysis.id}")
                 
-                # Start async processing
-                logger.info(f"Starting async task for analysis ID: {analysis.id}")
-                task = process_resume_analysis_task.send(str(analysis.id))
-                analysis.task_id = task.message_id
+                # Start async processing (extract -> classify -> analyze -> persist pipeline)
+                logger.info(f"Starting async pipeline for analysis ID: {analysis.id}")
+                task_pipeline = start_resume_analysis_pipeline(analysis.id)
+                analysis.task_id = task_pipeline.messages[0].message_id
                 analysis.task_status = 'pending'
                 analysis.save(update_fields=['task_id', 'task_status'])
+                record_submission(dedup_key, analysis.id)
                 
                 log_user_action(str(user_id), "start_resume_analysis", f"Started analysis for file: {analysis.resume_file.name}")
                 
@@ -150,6 +173,8 @@ def resume_analyzer(request):
                 
             except Exception as e:
                 logger.error(f"Error in resume analyzer for user {user_id}: {str(e)}", exc_info=True)
+                if dedup_key:
+                    release_submission(dedup_key)
                 log_user_action(str(user_id), "resume_analysis_error", f"Error: {str(e)}", success=False)
                 messages.error(request, f"An error occurred: {str(e)}")
         else:
@@ -206,6 +231,7 @@ def learning_path_analyzer(request):
         logger.info(f"Learning path form submitted by user: {user_id}")
         form = LearningPathForm(request.POST)
         if form.is_valid():
+            dedup_key = None
             try:
                 logger.debug("Form validation successful, processing learning path analysis")
                 
@@ -223,6 +249,17 @@ def learning_path_analyzer(request):
                     messages.error(request, error_msg)
                     return render(request, 'hirevision/learning_path_analyzer.html', {'form': form})
                 
+                # Same skills and role within the dedup window: reuse the existing learning path
+                dedup_key = submission_key(
+                    'learning_path', user_id,
+                    learning_path.current_skills.strip(), learning_path.dream_role.strip(),
+                )
+                existing = find_duplicate_submission(dedup_key, LearningPath, request.user)
+                if existing:
+                    log_user_action(str(user_id), "duplicate_learning_path", f"Reused learning path: {existing.id}")
+                    messages.info(request, "This learning path is already being generated. Showing the existing one.")
+                    return redirect('hirevision:learning_path_result', path_id=existing.id)
+                
                 # Save the model first
                 learning_path.save()
                 logger.info(f"Learning path record created with ID: {learning_path.id}")
@@ -233,6 +270,7 @@ def learning_path_analyzer(request):
                 learning_path.task_id = task.message_id
                 learning_path.task_status = 'pending'
                 learning_path.save(update_fields=['task_id', 'task_status'])
+                record_submission(dedup_key, learning_path.id)
                 
                 log_user_action(str(user_id), "start_learning_path_analysis", 
                               f"Started learning path analysis for skills: {len(learning_path.current_skills)} chars, role: {len(learning_path.dream_role)} chars")
@@ -247,6 +285,8 @@ def learning_path_analyzer(request):
                 
             except Exception as e:
                 logger.error(f"Error in learning path analyzer for user {user_id}: {str(e)}", exc_info=True)
+                if dedup_key:
+                    release_submission(dedup_key)
                 log_user_action(str(user_id), "learning_path_analysis_error", f"Error: {str(e)}", success=False)
                 messages.error(request, f"An error occurred while starting the learning path analysis. Please try again.")
         else:
@@ -322,6 +362,7 @@ def resume_builder(request):
         logger.info(f"Resume builder form submitted by user: {user_id}")
         form = ResumeBuilderForm(request.POST)
         if form.is_valid():
+            dedup_key = None
             try:
                 logger.debug("Form validation successful, processing resume builder")
                 
@@ -341,6 +382,14 @@ def resume_builder(request):
                         messages.error(request, error_msg)
                         return render(request, 'hirevision/resume_builder.html', {'form': form})
                 
+                # Identical resume data within the dedup window: reuse the existing build
+                dedup_key = submission_key('resume_builder', user_id, form.cleaned_data)
+                existing = find_duplicate_submission(dedup_key, ResumeBuilder, request.user)
+                if existing:
+                    log_user_action(str(user_id), "duplicate_resume_builder", f"Reused resume: {existing.id}")
+                    messages.info(request, "This resume is already being generated. Showing the existing one.")
+                    return redirect('hirevision:resume_builder_result', resume_id=existing.id)
+                
                 # Save the model first
                 resume.save()
                 logger.info(f"Resume builder record created with ID: {resume.id}")
@@ -351,6 +400,7 @@ def resume_builder(request):
                 resume.task_id = task.message_id
                 resume.task_status = 'pending'
                 resume.save(update_fields=['task_id', 'task_status'])
+                record_submission(dedup_key, resume.id)
                 
                 log_user_action(str(user_id), "start_resume_builder", 
                               f"Started resume builder for user: {resume.name}")
@@ -365,11 +415,18 @@ def resume_builder(request):
                 
             except Exception as e:
                 logger.error(f"Error in resume builder for user {user_id}: {str(e)}", exc_info=True)
+                if dedup_key:
+                    release_submission(dedup_key)
                 log_user_action(str(user_id), "resume_builder_error", f"Error: {str(e)}", success=False)
                 messages.error(request, f"An error occurred while starting the resume generation. Please try again.")
         else:
             logger.warning(f"Form validation failed for user {user_id}: {form.errors}")
-            messages.error(request, "Please correct the errors in the form.")
+            form_errors = form.non_field_errors()
+            if form_errors:
+                for error in form_errors:
+                    messages.error(request, error)
+            else:
+                messages.error(request, "Please correct the errors in the form.")
     else:
         form = ResumeBuilderForm()
         log_user_action(str(user_id), "view_resume_builder", "User accessed resume builder")
@@ -431,32 +488,121 @@ def resume_builder_result(request, resume_id):
         messages.error(request, "An error occurred while loading the resume result. Please try again.")
         return redirect('hirevision:resume_builder')
 
-def sample_resume(request):
-    """Sample resume view"""
+@login_required
+def resume_builder_export(request, resume_id, fmt):
+    """Export a built resume as PDF, HTML, DOCX, LaTeX or ATS-friendly plain text"""
+    start_time = time.time()
+    user_id = request.user.id
+    export_format = EXPORT_FORMATS.get(fmt)
+    if export_format is None:
+        raise Http404(f"Unknown export format: {fmt}")
+
+    resume = get_object_or_404(ResumeBuilder, id=resume_id)
+    if resume.user and resume.user != request.user:
+        logger.warning(f"Permission denied: user {user_id} tried to export resume {resume_id} owned by user {resume.user.id}")
+        log_user_action(str(user_id), "unauthorized_access", f"Tried to export resume {resume_id}", success=False)
+        messages.error(request, "You don't have permission to view this resume.")
+        return redirect('hirevision:resume_builder')
+
+    if fmt == 'pdf':
+        return _export_resume_pdf(request, resume)
+
     try:
-        sample_pdf_path = get_sample_pdf_path()
-        if os.path.exists(sample_pdf_path):
-            with open(sample_pdf_path, 'rb') as pdf_file:
-                response = HttpResponse(pdf_file.read(), content_type='application/pdf')
-                response['Content-Disposition'] = 'inline; filename="sample_resume.pdf"'
-                return response
-        else:
-            messages.error(request, "Sample resume not found.")
-            return redirect('hirevision:home')
+        content = export_resume(resume_ir_from_model(resume), fmt, resume.theme)
+    except Exception as e:
+        logger.error(f"Resume export to {fmt} failed for {resume_id}: {str(e)}", exc_info=True)
+        messages.error(request, f"Could not export the resume as {fmt.upper()}. Please try again.")
+        return redirect('hirevision:resume_builder_result', resume_id=resume_id)
+
+    log_user_action(str(user_id), "export_resume", f"Exported resume {resume_id} as {fmt}")
+    log_performance("Resume export view", time.time() - start_time, f"{fmt}, {len(content)} bytes")
+
+    response = HttpResponse(content, content_type=export_format.content_type)
+    response['Content-Disposition'] = content_disposition_header(True, f"{resume.name}_resume.{export_format.extension}")
+    return response
+
+def _export_resume_pdf(request, resume):
+    """Serve the PDF the builder task compiled; never run pdflatex inside the request"""
+    if resume.pdf_file and os.path.exists(resume.pdf_file.path):
+        log_user_action(str(request.user.id), "export_resume", f"Exported resume {resume.id} as pdf")
+        return serve_file(request, resume.pdf_file.path, f"{resume.name}_resume.pdf", as_attachment=True)
+
+    if resume.task_status != 'completed':
+        messages.info(request, "Your resume is still being generated. The PDF will be available when it is done.")
+    elif claim_job(f"resume_pdf:{resume.id}"):
+        try:
+            compile_resume_pdf_task.send(str(resume.id))
+            logger.info(f"Queued PDF compile for resume {resume.id}")
+            messages.info(request, "Your PDF is being compiled. Please try the download again in a moment.")
+        except Exception as e:
+            logger.error(f"Could not queue PDF compile for resume {resume.id}: {str(e)}", exc_info=True)
+            messages.error(request, "Could not export the resume as PDF. Please try again.")
+    else:
+        messages.info(request, "Your PDF is being compiled. Please try the download again in a moment.")
+    return redirect('hirevision:resume_builder_result', resume_id=resume.id)
+
+def resume_preview(request):
+    """Render a quick PDF preview of (possibly partial) resume builder data posted as JSON"""
+    start_time = time.time()
+    if request.method != 'POST':
+        return JsonResponse({'error': 'POST required'}, status=405)
+
+    if len(request.body) > PREVIEW_MAX_BYTES:
+        return JsonResponse({'error': 'Preview data too large'}, status=413)
+
+    # Debounce per user (or per session/IP for anonymous builders)
+    if request.user.is_authenticated:
+        client_key = f"user:{request.user.id}"
+    else:
+        client_key = f"anon:{request.session.session_key or request.META.get('REMOTE_ADDR', '')}"
+    retry_after = check_preview_debounce(client_key)
+    if retry_after:
+        response = JsonResponse({'error': 'Preview requested too frequently'}, status=429)
+        response['Retry-After'] = str(max(1, math.ceil(retry_after)))
+        return response
+
+    try:
+        data = json.loads(request.body or b'{}')
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    if not isinstance(data, dict):
+        return JsonResponse({'error': 'Preview data must be a JSON object'}, status=400)
+
+    try:
+        pdf_bytes, stats = render_resume_preview(data, data.get('theme'))
     except Exception as e:
-        messages.error(request, f"Error loading sample resume: {str(e)}")
+        logger.error(f"Resume preview failed for {client_key}: {str(e)}", exc_info=True)
+        return JsonResponse({'error': 'Preview could not be rendered'}, status=500)
+
+    response = HttpResponse(pdf_bytes, content_type='application/pdf')
+    response['Content-Disposition'] = 'inline; filename="resume_preview.pdf"'
+    response['Cache-Control'] = 'no-store'
+    response['X-Preview-Sections-Rendered'] = str(stats['rendered'])
+    response['X-Preview-Sections-Cached'] = str(stats['cached'])
+
+    duration = time.time() - start_time
+    log_performance("Resume preview request", duration, f"{stats['rendered']} rendered, {stats['cached']} cached")
+    return response
+
+def sample_resume(request):
+    """Sample resume view, served from memory with long-lived cache headers"""
+    sample = get_sample_resume()
+    if sample is None:
+        messages.error(request, "Sample resume not found.")
         return redirect('hirevision:home')
 
+    return serve_bytes(
+        request, sample.content, "sample_resume.pdf", sample.etag, sample.last_modified,
+        public=True, max_age=SAMPLE_RESUME_MAX_AGE,
+    )
+
 @csrf_exempt
 def download_pdf(request, resume_id):
     """Download generated PDF resume"""
     try:
         resume = ResumeBuilder.objects.get(id=resume_id)
         if resume.pdf_file and os.path.exists(resume.pdf_file.path):
-            with open(resume.pdf_file.path, 'rb') as pdf_file:
-                response = HttpResponse(pdf_file.read(), content_type='application/pdf')
-                response['Content-Disposition'] = f'attachment; filename="{resume.name}_resume.pdf"'
-                return response
+            return serve_file(request, resume.pdf_file.path, f"{resume.name}_resume.pdf", as_attachment=True)
         else:
             messages.error(request, "PDF file not found.")
             return redirect('hirevision:resume_builder_result', resume_id=resume_id)
@@ -538,7 +684,8 @@ def check_resume_analysis_status(request, analysis_id):
         return JsonResponse({
             'status': analysis.task_status,
             'error': analysis.task_error,
-            'has_results': analysis.task_status == 'completed' and analysis.ats_score is not None
+            'has_results': analysis.task_status == 'completed' and analysis.ats_score is not None,
+            'progress': get_progress('resume_analysis', analysis),
         })
     except ResumeAnalysis.DoesNotExist:
         return JsonResponse({'error': 'Analysis not found'}, status=404)
@@ -555,7 +702,8 @@ def check_learning_path_status(request, path_id):
         return JsonResponse({
             'status': learning_path.task_status,
             'error': learning_path.task_error,
-            'has_results': learning_path.task_status == 'completed' and learning_path.role_analysis
+            'has_results': learning_path.task_status == 'completed' and learning_path.role_analysis,
+            'progress': get_progress('learning_path', learning_path),
         })
     except LearningPath.DoesNotExist:
         return JsonResponse({'error': 'Learning path not found'}, status=404)
@@ -572,11 +720,19 @@ def check_resume_builder_status(request, resume_id):
         return JsonResponse({
             'status': resume.task_status,
             'error': resume.task_error,
-            'has_results': resume.task_status == 'completed' and resume.latex_content
+            'has_results': resume.task_status == 'completed' and resume.latex_content,
+            'progress': get_progress('resume_builder', resume),
         })
     except ResumeBuilder.DoesNotExist:
         return JsonResponse({'error': 'Resume not found'}, status=404)
 
+@staff_member_required
+def compile_pool_status(request):
+    """Queue depth, running compiles and wait times of the pdflatex pools across all workers"""
+    response = JsonResponse(collect_compile_pool_stats())
+    response['Cache-Control'] = 'no-store'
+    return response
+
 # Thread and Comment Views
 @login_required
 def threads_list(request):
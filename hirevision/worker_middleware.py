@@ -0,0 +1,68 @@
+import threading
+import time
+
+import dramatiq
+
+from logging_config import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+
+class LatexFormatWarmupMiddleware(dramatiq.Middleware):
+    """
+    Build the precompiled pdflatex preamble format when a worker boots.
+
+    Runs in a background thread so the worker starts consuming immediately; a compile that
+    arrives before the format is ready just builds or waits for it via pdf_generator.
+    """
+
+    def after_worker_boot(self, broker, worker):
+        threading.Thread(target=self._warm_format, name="latex-format-warmup", daemon=True).start()
+
+    def _warm_format(self):
+        # Imported lazily: this module is loaded while Django configures the broker
+        from pdf_generator import warm_latex_format, LATEX_FORMAT_ENABLED
+
+        if not LATEX_FORMAT_ENABLED:
+            return
+        try:
+            fmt_name = warm_latex_format()
+            if fmt_name:
+                logger.info(f"pdflatex format {fmt_name} ready")
+            else:
+                logger.warning("pdflatex format unavailable, resumes will use cold compiles")
+        except Exception as e:
+            logger.error(f"pdflatex format warm-up failed: {str(e)}", exc_info=True)
+
+
+class CompilePoolStatsMiddleware(dramatiq.Middleware):
+    """
+    Publish the worker's compile pool stats (queue depth, running compiles, waits) to the
+    shared cache after messages that changed them, so the web process can report them.
+    """
+
+    # Republish unchanged stats well within pdf_generator.COMPILE_STATS_TTL so live workers never expire
+    REFRESH_INTERVAL = 60
+
+    def __init__(self):
+        self._published = None
+        self._published_at = 0.0
+        self._lock = threading.Lock()
+
+    def after_process_message(self, broker, message, *, result=None, exception=None):
+        from pdf_generator import get_compile_pool_stats, publish_compile_pool_stats
+
+        stats = get_compile_pool_stats()
+        if not (stats["completed"] or stats["timed_out"] or stats["queue_timeouts"] or stats["running"]):
+            return  # this process never compiled anything
+        with self._lock:
+            if stats == self._published and time.time() - self._published_at < self.REFRESH_INTERVAL:
+                return
+            self._published, self._published_at = stats, time.time()
+        try:
+            publish_compile_pool_stats()
+        except Exception as e:
+            logger.warning(f"Could not publish compile pool stats: {str(e)}")
+
+    after_skip_message = after_process_message
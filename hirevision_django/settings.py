@@ -132,6 +132,13 @@ STATICFILES_DIRS = [
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Optional download offload to the front-end server: None streams from Django,
+# "x-sendfile" for Apache/lighttpd, "x-accel-redirect" for nginx (files under
+# SENDFILE_ROOT are exposed at SENDFILE_URL_PREFIX, which must be an internal location)
+SENDFILE_BACKEND = None
+SENDFILE_ROOT = BASE_DIR
+SENDFILE_URL_PREFIX = '/protected/'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -156,15 +163,39 @@ DRAMATIQ_BROKER = {
         "dramatiq.middleware.AgeLimit",
         "dramatiq.middleware.TimeLimit",
         "dramatiq.middleware.Callbacks",
+        "dramatiq.middleware.Pipelines",
         "dramatiq.middleware.Retries",
         "django_dramatiq.middleware.DbConnectionsMiddleware",
         "django_dramatiq.middleware.AdminMiddleware",
+        "hirevision.worker_middleware.LatexFormatWarmupMiddleware",
+        "hirevision.worker_middleware.CompilePoolStatsMiddleware",
     ]
 }
 
 # Task Configuration
 DRAMATIQ_TASKS_DATABASE = "default"
 
+# Dramatiq message priorities per workload class (lower runs first); see hirevision/queues.py
+DRAMATIQ_QUEUE_PRIORITIES = {
+    "interactive": 0,
+    "background": 50,
+    "bulk": 100,
+}
+
+# Concurrent pdflatex processes per worker process (pdf_generator's compile pool);
+# None uses half the CPU cores
+MAX_CONCURRENT_COMPILES = None
+
+# Cache Configuration (shared between web and worker processes)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://localhost:6379/1",
+        "TIMEOUT": 60 * 60 * 24,
+        "KEY_PREFIX": "hirevision",
+    }
+}
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
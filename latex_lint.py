@@ -0,0 +1,232 @@
+import re
+import threading
+import time
+from typing import FrozenSet, List, NamedTuple, Optional, Set
+
+from latex_templates import BASE_SECTION_TEMPLATES, THEME_SETTINGS, get_theme, normalize_unicode
+from logging_config import get_logger, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+DOCUMENT_BEGIN = "\\begin{document}"
+DOCUMENT_END = "\\end{document}"
+
+# Standard commands accepted in a document body besides those the themes use and those the
+# document defines itself; anything else would stop pdflatex with "Undefined control sequence"
+KNOWN_LATEX_COMMANDS = frozenset({
+    "begin", "end", "item", "section", "subsection", "subsubsection", "paragraph",
+    "textbf", "textit", "texttt", "textsc", "textsf", "textrm", "textsl", "emph", "underline",
+    "href", "url", "small", "footnotesize", "scriptsize", "tiny", "normalsize",
+    "large", "Large", "LARGE", "huge", "Huge", "bfseries", "itshape", "scshape",
+    "sffamily", "rmfamily", "ttfamily", "mdseries", "upshape", "normalfont",
+    "vspace", "hspace", "vfill", "hfill", "newline", "linebreak", "pagebreak", "newpage",
+    "clearpage", "noindent", "centering", "raggedright", "raggedleft", "par",
+    "hline", "cline", "textwidth", "linewidth", "fill", "extracolsep", "quad", "qquad",
+    "enspace", "ldots", "dots", "cdot", "textbullet", "textbar", "textbackslash",
+    "textasciitilde", "textasciicircum", "textless", "textgreater", "textendash",
+    "textemdash", "textquoteleft", "textquoteright", "texttrademark", "textregistered",
+    "textcopyright", "LaTeX", "TeX", "today", "label", "ref", "color", "textcolor",
+    "mbox", "makebox", "fbox", "parbox", "rule", "bullet", "vcenter", "hbox", "titlerule",
+    "rightarrow", "leftarrow", "geq", "leq", "approx", "sim", "times", "pm", "infty",
+})
+
+_COMMAND_PATTERN = re.compile(r"\\([A-Za-z@]+\*?|.)", re.DOTALL)
+_DEFINITION_PATTERN = re.compile(
+    r"\\(?:re|provide)?newcommand\*?\s*\{?\s*\\([A-Za-z@]+)|\\def\s*\\([A-Za-z@]+)|\\let\s*\\([A-Za-z@]+)"
+)
+_COMMENT_PATTERN = re.compile(r"(?<!\\)%.*")
+_ENVIRONMENT_PATTERN = re.compile(r"\\(begin|end)\s*\{([^}]*)\}")
+
+_template_commands: Optional[FrozenSet[str]] = None
+_template_commands_lock = threading.Lock()
+
+
+class LatexLintResult(NamedTuple):
+    latex: str  # the input with all repairs applied
+    errors: List[str]  # problems that would still fail the compile
+    repairs: List[str]  # what was changed
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _get_template_commands() -> FrozenSet[str]:
+    """Every command the theme preambles and section templates use, collected once"""
+    global _template_commands
+    if _template_commands is not None:
+        return _template_commands
+    with _template_commands_lock:
+        if _template_commands is None:
+            sources: List[str] = list(BASE_SECTION_TEMPLATES.values())
+            for name, settings in THEME_SETTINGS.items():
+                sources.append(get_theme(name).preamble)
+                sources.extend(settings.get("sections", {}).values())
+            commands: Set[str] = set()
+            for source in sources:
+                commands.update(_COMMAND_PATTERN.findall(source))
+            _template_commands = frozenset(commands)
+    return _template_commands
+
+
+def _defined_commands(preamble: str) -> Set[str]:
+    return {name for match in _DEFINITION_PATTERN.findall(preamble) for name in match if name}
+
+
+def strip_comments(latex: str) -> str:
+    """Drop % comments (but not escaped \\%) line by line"""
+    return "\n".join(_COMMENT_PATTERN.sub("", line) for line in latex.split("\n"))
+
+
+def _braces_balanced(text: str) -> bool:
+    """Whether every { in comment-free text is closed and no } closes nothing"""
+    depth = 0
+    index = 0
+    while index < len(text):
+        char = text[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth < 0:
+                return False
+        index += 1
+    return depth == 0
+
+
+def _repair_body(body: str, known: Set[str], repairs: List[str]) -> str:
+    """
+    Escape undefined commands and stray closing braces, and close open groups.
+
+    Works on the raw body so comments are copied unchanged.
+    """
+    out: List[str] = []
+    depth = 0
+    unknown: Set[str] = set()
+    stray_braces = 0
+    index = 0
+    in_comment = False
+    while index < len(body):
+        char = body[index]
+        if in_comment:
+            out.append(char)
+            in_comment = char != "\n"
+            index += 1
+            continue
+        if char == "%":
+            in_comment = True
+            out.append(char)
+            index += 1
+            continue
+        if char == "\\":
+            match = _COMMAND_PATTERN.match(body, index)
+            if match is None:
+                # A trailing lone backslash
+                out.append(r"\textbackslash{}")
+                index += 1
+                continue
+            command = match.group(1)
+            if command[0].isalpha() and command.rstrip("*") not in known:
+                unknown.add(command)
+                out.append(r"\textbackslash{}" + command)
+            else:
+                out.append(match.group(0))
+            index = match.end()
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            if depth == 0:
+                stray_braces += 1
+                out.append(r"\}")
+                index += 1
+                continue
+            depth -= 1
+        out.append(char)
+        index += 1
+
+    if unknown:
+        repairs.append(f"escaped undefined commands: {', '.join(sorted(unknown))}")
+    if stray_braces:
+        repairs.append(f"escaped {stray_braces} unmatched closing brace(s)")
+    if depth:
+        repairs.append(f"closed {depth} unclosed brace group(s)")
+        out.append("}" * depth)
+    return "".join(out)
+
+
+def lint_latex(latex: str, repair: bool = True) -> LatexLintResult:
+    """
+    Static pre-flight check of a LaTeX document before pdflatex is spawned.
+
+    Checks the document frame, brace balance, environment nesting, math shifts, body
+    commands (against KNOWN_LATEX_COMMANDS, the theme templates and the document's own
+    definitions) and characters pdflatex cannot typeset. With repair=True, characters,
+    undefined commands and unbalanced braces in the body are fixed; whatever is left in
+    errors means the compile would fail and should be skipped.
+    """
+    start_time = time.time()
+    errors: List[str] = []
+    repairs: List[str] = []
+
+    normalized = normalize_unicode(latex)
+    if normalized != latex:
+        if repair:
+            repairs.append("replaced characters pdflatex cannot typeset")
+            latex = normalized
+        else:
+            errors.append("contains characters pdflatex cannot typeset")
+
+    begin = latex.find(DOCUMENT_BEGIN)
+    end = latex.rfind(DOCUMENT_END)
+    if begin == -1 or end == -1 or end < begin:
+        errors.append("missing \\begin{document} or \\end{document}")
+        return LatexLintResult(latex, errors, repairs)
+
+    preamble = latex[:begin]
+    body = latex[begin + len(DOCUMENT_BEGIN):end]
+
+    if not _braces_balanced(strip_comments(preamble)):
+        errors.append("unbalanced braces in the preamble")
+
+    known = set(KNOWN_LATEX_COMMANDS) | _get_template_commands() | _defined_commands(preamble)
+    if repair:
+        repaired_body = _repair_body(body, known, repairs)
+        if repaired_body != body:
+            body = repaired_body
+            latex = latex[:begin + len(DOCUMENT_BEGIN)] + body + latex[end:]
+
+    body_code = strip_comments(body)
+    if not repair:
+        if not _braces_balanced(body_code):
+            errors.append("unbalanced braces in the document body")
+        unknown = sorted({
+            command for command in _COMMAND_PATTERN.findall(body_code)
+            if command[0].isalpha() and command.rstrip("*") not in known
+        })
+        if unknown:
+            errors.append(f"undefined commands: {', '.join(unknown)}")
+
+    # Environments must nest properly; a mismatch cannot be repaired safely
+    stack: List[str] = []
+    for kind, name in _ENVIRONMENT_PATTERN.findall(body_code):
+        if kind == "begin":
+            stack.append(name)
+        elif not stack or stack.pop() != name:
+            errors.append(f"\\end{{{name}}} does not match the open environment")
+            break
+    else:
+        if stack:
+            errors.append(f"unclosed environment(s): {', '.join(stack)}")
+
+    # An odd number of unescaped $ leaves math mode open until the end of the paragraph
+    if len(re.findall(r"(?<!\\)\$", body_code.replace("\\\\", ""))) % 2:
+        errors.append("unbalanced $ math shift")
+
+    duration = time.time() - start_time
+    log_performance("LaTeX pre-flight", duration, f"{len(errors)} errors, {len(repairs)} repairs")
+    return LatexLintResult(latex, errors, repairs)
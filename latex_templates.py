@@ -0,0 +1,519 @@
+import re
+import time
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from logging_config import get_logger, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+DEFAULT_THEME = "classic"
+
+# Placeholders are <<name>> (LaTeX-escaped), <<url:name>> (escaped for \href) or
+# <<raw:name>> (inserted verbatim); angle brackets never clash with LaTeX braces
+_PLACEHOLDER_PATTERN = re.compile(r"<<(?:(raw|url):)?([a-z_]+)>>")
+
+_LATEX_SPECIAL_CHARS = {
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+    "<": r"\textless{}",
+    ">": r"\textgreater{}",
+    "•": r"\textbullet{}",
+    "–": "--",
+    "—": "---",
+    "‘": "`",
+    "’": "'",
+    "“": "``",
+    "”": "''",
+    "…": r"\ldots{}",
+}
+_LATEX_ESCAPE_PATTERN = re.compile("|".join(re.escape(char) for char in _LATEX_SPECIAL_CHARS))
+
+# pdflatex's utf8 input encoding covers ASCII plus the Latin-1 and Latin Extended-A letters;
+# any other character aborts that line with "Unicode character ... not set up for use with LaTeX"
+_UNSUPPORTED_CHAR_PATTERN = re.compile("[^\x20-\x7e\n\t\u00a0-\u017f]")
+_UNICODE_REPLACEMENTS = {
+    "→": r"$\rightarrow$",
+    "←": r"$\leftarrow$",
+    "≥": r"$\geq$",
+    "≤": r"$\leq$",
+    "≈": r"$\approx$",
+    "∼": r"$\sim$",
+    "€": "EUR",
+    "™": r"\texttrademark{}",
+    "✓": "",
+    "✔": "",
+    "★": "*",
+    "▪": r"\textbullet{}",
+    "●": r"\textbullet{}",
+}
+
+# Special characters and unsupported characters, handled in one pass by escape_latex
+_TEXT_ESCAPE_PATTERN = re.compile(f"{_LATEX_ESCAPE_PATTERN.pattern}|{_UNSUPPORTED_CHAR_PATTERN.pattern}")
+
+_URL_SPECIAL_CHARS = {"\\": "", "%": r"\%", "#": r"\#", "{": "", "}": ""}
+_URL_ESCAPE_PATTERN = re.compile("|".join(re.escape(char) for char in _URL_SPECIAL_CHARS))
+
+# Leading markers users type for bullets; itemize already draws the bullet
+_BULLET_PREFIX = re.compile(r"^\s*(?:[*•\-·]\s*)+")
+
+
+def _fold_char(char: str) -> str:
+    """
+    LaTeX for one character pdflatex cannot typeset: a LaTeX equivalent, its ASCII
+    decomposition (escaped, since full-width ％ ＃ ＄ ＼ fold to specials) or nothing
+    (emoji, control characters)
+    """
+    if char in _UNICODE_REPLACEMENTS:
+        return _UNICODE_REPLACEMENTS[char]
+    if ord(char) <= 0x7F:
+        return ""
+    folded = unicodedata.normalize("NFKD", char).encode("ascii", "ignore").decode("ascii")
+    return _LATEX_ESCAPE_PATTERN.sub(lambda match: _LATEX_SPECIAL_CHARS[match.group(0)], folded)
+
+
+def normalize_unicode(text: str) -> str:
+    """
+    Make LaTeX source safe for pdflatex's input encoding.
+
+    Characters pdflatex cannot typeset are replaced by a LaTeX equivalent, their escaped
+    ASCII decomposition (e.g. full-width letters) or dropped (emoji, control characters).
+    Newlines and tabs are kept.
+    """
+    if text.isascii() and text.isprintable():
+        return text
+    return _UNSUPPORTED_CHAR_PATTERN.sub(lambda match: _fold_char(match.group(0)), text)
+
+
+def _escape_text_char(match) -> str:
+    char = match.group(0)
+    if char in _LATEX_SPECIAL_CHARS:
+        return _LATEX_SPECIAL_CHARS[char]
+    return _fold_char(char)
+
+
+def escape_latex(text: Any) -> str:
+    """
+    Escape LaTeX special characters and fold what pdflatex cannot typeset, in one pass
+    so neither step's output is fed through the other
+    """
+    if text is None:
+        return ""
+    text = " ".join(str(text).split())
+    return _TEXT_ESCAPE_PATTERN.sub(_escape_text_char, text)
+
+
+def escape_url(url: Any) -> str:
+    """Escape a URL for use as the first argument of \\href"""
+    if not url:
+        return ""
+    return _URL_ESCAPE_PATTERN.sub(lambda match: _URL_SPECIAL_CHARS[match.group(0)], str(url).strip())
+
+
+class LatexTemplate:
+    """A template parsed once into literal chunks and placeholders, rendered into a shared buffer"""
+
+    def __init__(self, source: str):
+        self.parts: List[Tuple[str, Optional[str], Optional[str]]] = []
+        position = 0
+        for match in _PLACEHOLDER_PATTERN.finditer(source):
+            self.parts.append((source[position:match.start()], match.group(1), match.group(2)))
+            position = match.end()
+        self.parts.append((source[position:], None, None))
+
+    def render_into(self, out: List[str], context: Dict[str, Any]) -> None:
+        for literal, mode, name in self.parts:
+            if literal:
+                out.append(literal)
+            if name is None:
+                continue
+            value = context.get(name, "")
+            if mode == "raw":
+                out.append(value)
+            elif mode == "url":
+                out.append(escape_url(value))
+            else:
+                out.append(escape_latex(value))
+
+
+CLASSIC_PREAMBLE = r"""%-------------------------
+% Resume in Latex
+% Author : Generated by HireVision
+% Based off of: https://github.com/jakeryang/resume
+% License : MIT
+%------------------------
+
+\documentclass[letterpaper,<<raw:font_size>>]{article}
+
+\usepackage{latexsym}
+\usepackage[empty]{fullpage}
+\usepackage{titlesec}
+\usepackage{marvosym}
+\usepackage[usenames,dvipsnames]{color}
+\usepackage{verbatim}
+\usepackage{enumitem}
+\usepackage[hidelinks]{hyperref}
+\usepackage{fancyhdr}
+\usepackage[english]{babel}
+\usepackage{tabularx}
+\input{glyphtounicode}
+<<raw:font_setup>>
+
+\pagestyle{fancy}
+\fancyhf{} % clear all header and footer fields
+\fancyfoot{}
+\renewcommand{\headrulewidth}{0pt}
+\renewcommand{\footrulewidth}{0pt}
+
+% Adjust margins
+\addtolength{\oddsidemargin}{<<raw:side_margin>>}
+\addtolength{\evensidemargin}{<<raw:side_margin>>}
+\addtolength{\textwidth}{<<raw:text_width>>}
+\addtolength{\topmargin}{<<raw:top_margin>>}
+\addtolength{\textheight}{<<raw:text_height>>}
+
+\urlstyle{same}
+
+\raggedbottom
+\raggedright
+\setlength{\tabcolsep}{0in}
+
+% Sections formatting
+\titleformat{\section}{
+  \vspace{-4pt}\scshape\raggedright\large<<raw:section_color>>
+}{}{0em}{}[\color{<<raw:rule_color>>}\titlerule \vspace{-5pt}]
+
+% Ensure that generate pdf is machine readable/ATS parsable
+\pdfgentounicode=1
+
+%-------------------------
+% Custom commands
+\newcommand{\resumeItem}[1]{
+  \item\small{
+    {#1 \vspace{-2pt}}
+  }
+}
+
+\newcommand{\resumeSubheading}[4]{
+  \vspace{-2pt}\item
+    \begin{tabular*}{0.97\textwidth}[t]{l@{\extracolsep{\fill}}r}
+      \textbf{#1} & #2 \\
+      \textit{\small#3} & \textit{\small #4} \\
+    \end{tabular*}\vspace{-7pt}
+}
+
+\newcommand{\resumeSubSubheading}[2]{
+    \item
+    \begin{tabular*}{0.97\textwidth}{l@{\extracolsep{\fill}}r}
+      \textit{\small#1} & \textit{\small #2} \\
+    \end{tabular*}\vspace{-7pt}
+}
+
+\newcommand{\resumeProjectHeading}[2]{
+    \item
+    \begin{tabular*}{0.97\textwidth}{l@{\extracolsep{\fill}}r}
+      \small#1 & #2 \\
+    \end{tabular*}\vspace{-7pt}
+}
+
+\newcommand{\resumeSubItem}[1]{\resumeItem{#1}\vspace{-4pt}}
+
+\renewcommand\labelitemii{$\vcenter{\hbox{\tiny$\bullet$}}$}
+
+\newcommand{\resumeSubHeadingListStart}{\begin{itemize}[leftmargin=0.15in, label={}]}
+\newcommand{\resumeSubHeadingListEnd}{\end{itemize}}
+\newcommand{\resumeItemListStart}{\begin{itemize}}
+\newcommand{\resumeItemListEnd}{\end{itemize}\vspace{-5pt}}
+
+%-------------------------------------------
+%%%%%%  RESUME STARTS HERE  %%%%%%%%%%%%%%%%%%%%%%%%%%%%
+
+
+\begin{document}
+
+"""
+
+# Section templates shared by every theme unless a theme overrides them
+BASE_SECTION_TEMPLATES = {
+    "heading": r"""
+%----------HEADING----------
+\begin{center}
+    \textbf{\Huge \scshape <<name>>} \\ \vspace{1pt}
+    \small <<raw:contact_line>>
+\end{center}
+
+""",
+    "contact_link": r"\href{<<url:url>>}{\underline{<<label>>}}",
+    "section_start": "\n%-----------<<raw:banner>>-----------\n\\section{<<title>>}\n  \\resumeSubHeadingListStart\n",
+    "section_end": "  \\resumeSubHeadingListEnd\n",
+    "list_section_start": "\n%-----------<<raw:banner>>-----------\n\\section{<<title>>}\n \\begin{itemize}[leftmargin=0.15in, label={}]\n",
+    "list_section_end": " \\end{itemize}\n",
+    "subheading": "    \\resumeSubheading\n      {<<top_left>>}{<<top_right>>}\n      {<<bottom_left>>}{<<bottom_right>>}\n",
+    "subsubheading": "    \\resumeSubSubheading\n     {<<left>>}{<<right>>}\n",
+    "project_heading": "      \\resumeProjectHeading\n          {\\textbf{<<name>>}<<raw:tech_info>>}{}\n",
+    "tech_info": " $|$ \\emph{<<tech_stack>>}",
+    "item_list_start": "      \\resumeItemListStart\n",
+    "item": "        \\resumeItem{<<text>>}\n",
+    "item_list_end": "      \\resumeItemListEnd\n",
+    "skills_start": "\n%-----------PROGRAMMING SKILLS-----------\n\\section{Technical Skills}\n \\begin{itemize}[leftmargin=0.15in, label={}]\n    \\small{\\item{\n",
+    "skill_line": "     \\textbf{<<category>>}{: <<skills>>} \\\\\n",
+    "skills_end": "    }}\n \\end{itemize}\n",
+    "list_item": "    \\small{\\item{<<text>>}}\n",
+    "footer": "\n%-------------------------------------------\n\\end{document}",
+}
+
+# Theme settings substituted into the shared preamble, plus optional section overrides
+THEME_SETTINGS = {
+    "classic": {
+        "label": "Classic",
+        "preamble": {
+            "font_size": "11pt",
+            "font_setup": "",
+            "side_margin": "-0.5in",
+            "text_width": "1in",
+            "top_margin": "-.5in",
+            "text_height": "1.0in",
+            "section_color": "",
+            "rule_color": "black",
+        },
+        "sections": {},
+    },
+    "compact": {
+        "label": "Compact",
+        "preamble": {
+            "font_size": "10pt",
+            "font_setup": "",
+            "side_margin": "-0.6in",
+            "text_width": "1.2in",
+            "top_margin": "-.6in",
+            "text_height": "1.2in",
+            "section_color": "",
+            "rule_color": "black",
+        },
+        "sections": {
+            "heading": r"""
+%----------HEADING----------
+\begin{center}
+    \textbf{\LARGE \scshape <<name>>} \\ \vspace{1pt}
+    \small <<raw:contact_line>>
+\end{center}
+
+""",
+        },
+    },
+    "modern": {
+        "label": "Modern",
+        "preamble": {
+            "font_size": "11pt",
+            "font_setup": "\\renewcommand{\\familydefault}{\\sfdefault}\n",
+            "side_margin": "-0.5in",
+            "text_width": "1in",
+            "top_margin": "-.5in",
+            "text_height": "1.0in",
+            "section_color": "\\color{NavyBlue}",
+            "rule_color": "NavyBlue",
+        },
+        "sections": {},
+    },
+}
+
+THEME_CHOICES = [(name, settings["label"]) for name, settings in THEME_SETTINGS.items()]
+
+
+class LatexTheme:
+    """A theme's preamble rendered once and its section templates parsed once"""
+
+    def __init__(self, name: str, settings: Dict[str, Any]):
+        self.name = name
+        preamble_buffer: List[str] = []
+        LatexTemplate(CLASSIC_PREAMBLE).render_into(preamble_buffer, settings["preamble"])
+        self.preamble = "".join(preamble_buffer)
+        sources = dict(BASE_SECTION_TEMPLATES, **settings.get("sections", {}))
+        self.templates = {key: LatexTemplate(source) for key, source in sources.items()}
+
+    def render(self, out: List[str], key: str, **context: Any) -> None:
+        self.templates[key].render_into(out, context)
+
+
+_themes: Dict[str, LatexTheme] = {}
+
+
+def get_theme(name: Optional[str] = None) -> LatexTheme:
+    """Return a compiled theme, falling back to the default for unknown names"""
+    if name not in THEME_SETTINGS:
+        if name:
+            logger.warning(f"Unknown resume theme '{name}', using '{DEFAULT_THEME}'")
+        name = DEFAULT_THEME
+    theme = _themes.get(name)
+    if theme is None:
+        theme = _themes[name] = LatexTheme(name, THEME_SETTINGS[name])
+    return theme
+
+
+def description_items(description: Any) -> List[str]:
+    """Normalize a description given as text (one item per line) or a list into bullet texts"""
+    if isinstance(description, str):
+        lines = description.split("\n")
+    elif isinstance(description, list):
+        lines = [item for item in description if isinstance(item, str)]
+    else:
+        return []
+    items = []
+    for line in lines:
+        text = _BULLET_PREFIX.sub("", line).strip()
+        if text:
+            items.append(text)
+    return items
+
+
+def _render_items(out: List[str], theme: LatexTheme, description: Any) -> None:
+    items = description_items(description)
+    if not items:
+        return
+    theme.render(out, "item_list_start")
+    for item in items:
+        theme.render(out, "item", text=item)
+    theme.render(out, "item_list_end")
+
+
+def _render_heading(out: List[str], theme: LatexTheme, data: Dict[str, Any]) -> None:
+    contact_parts: List[str] = []
+    if data.get("phone"):
+        contact_parts.append(escape_latex(data["phone"]))
+    for field in ["email", "linkedin", "github"]:
+        value = (data.get(field) or "").strip()
+        if value:
+            url = f"mailto:{value}" if field == "email" else value
+            link: List[str] = []
+            theme.render(link, "contact_link", url=url, label=value)
+            contact_parts.append("".join(link))
+    theme.render(out, "heading", name=data.get("name", ""), contact_line=" $|$ ".join(contact_parts))
+
+
+def _render_education(out: List[str], theme: LatexTheme, education: Iterable[Dict[str, Any]]) -> None:
+    theme.render(out, "section_start", banner="EDUCATION", title="Education")
+    for edu in education:
+        if isinstance(edu, dict) and edu.get("institution") and edu.get("degree"):
+            theme.render(
+                out, "subheading",
+                top_left=edu.get("institution"), top_right=edu.get("location"),
+                bottom_left=edu.get("degree"), bottom_right=edu.get("duration"),
+            )
+    theme.render(out, "section_end")
+
+
+def _render_experience(out: List[str], theme: LatexTheme, experience: Iterable[Dict[str, Any]]) -> None:
+    theme.render(out, "section_start", banner="EXPERIENCE", title="Experience")
+    for exp in experience:
+        if not isinstance(exp, dict) or not exp.get("title") or not exp.get("company"):
+            continue
+        theme.render(
+            out, "subheading",
+            top_left=exp.get("title"), top_right=exp.get("duration"),
+            bottom_left=exp.get("company"), bottom_right=exp.get("location"),
+        )
+        _render_items(out, theme, exp.get("description"))
+
+        # Further positions at the same company stay inside the same list
+        for position in exp.get("positions") or []:
+            if isinstance(position, dict) and position.get("title"):
+                theme.render(out, "subsubheading", left=position.get("title"), right=position.get("duration"))
+                _render_items(out, theme, position.get("description"))
+    theme.render(out, "section_end")
+
+
+def _render_projects(out: List[str], theme: LatexTheme, projects: Iterable[Dict[str, Any]]) -> None:
+    theme.render(out, "section_start", banner="PROJECTS", title="Projects")
+    for project in projects:
+        if not isinstance(project, dict) or not project.get("name"):
+            continue
+        tech_info: List[str] = []
+        if project.get("tech_stack"):
+            theme.render(tech_info, "tech_info", tech_stack=project["tech_stack"])
+        theme.render(out, "project_heading", name=project["name"], tech_info="".join(tech_info))
+        _render_items(out, theme, project.get("description"))
+    theme.render(out, "section_end")
+
+
+def _render_skills(out: List[str], theme: LatexTheme, skills: Dict[str, List[str]]) -> None:
+    theme.render(out, "skills_start")
+    for category, skill_list in skills.items():
+        if isinstance(skill_list, str):
+            skill_list = [skill_list]
+        skill_list = [str(skill).strip() for skill in skill_list or [] if str(skill).strip()]
+        if skill_list:
+            theme.render(out, "skill_line", category=category, skills=", ".join(skill_list))
+    theme.render(out, "skills_end")
+
+
+def _render_research(out: List[str], theme: LatexTheme, research_papers: Iterable[Dict[str, Any]]) -> None:
+    theme.render(out, "section_start", banner="RESEARCH PAPERS", title="Research Papers")
+    for paper in research_papers:
+        if not isinstance(paper, dict):
+            logger.warning(f"Research paper is not a dict: {type(paper)}")
+            continue
+        if paper.get("title"):
+            theme.render(
+                out, "subheading",
+                top_left=paper.get("title"), top_right=paper.get("year"),
+                bottom_left=paper.get("authors"), bottom_right=paper.get("journal"),
+            )
+    theme.render(out, "section_end")
+
+
+def _render_item_list(banner: str, title: str):
+    def render(out: List[str], theme: LatexTheme, items: Iterable[str]) -> None:
+        theme.render(out, "list_section_start", banner=banner, title=title)
+        for text in description_items(list(items)):
+            theme.render(out, "list_item", text=text)
+        theme.render(out, "list_section_end")
+    return render
+
+
+# Rendering order of the optional and required body sections
+SECTION_RENDERERS = [
+    ("education", _render_education),
+    ("experience", _render_experience),
+    ("projects", _render_projects),
+    ("skills", _render_skills),
+    ("research_papers", _render_research),
+    ("achievements", _render_item_list("ACHIEVEMENTS", "Achievements")),
+    ("others", _render_item_list("OTHERS", "Others")),
+]
+
+
+def render_section(section: str, data: Dict[str, Any], theme_name: Optional[str] = None) -> str:
+    """Render one section ('heading' or a SECTION_RENDERERS key) to LaTeX; empty sections render as ''"""
+    theme = get_theme(theme_name)
+    out: List[str] = []
+    if section == "heading":
+        _render_heading(out, theme, data)
+    else:
+        renderer = dict(SECTION_RENDERERS)[section]
+        if data.get(section):
+            renderer(out, theme, data[section])
+    return "".join(out)
+
+
+def render_latex_document(data: Dict[str, Any], theme_name: Optional[str] = None) -> str:
+    """Render a complete resume document into one buffer, joined once"""
+    start_time = time.time()
+    theme = get_theme(theme_name)
+    out: List[str] = [theme.preamble]
+    _render_heading(out, theme, data)
+    for section, renderer in SECTION_RENDERERS:
+        if data.get(section):
+            renderer(out, theme, data[section])
+    theme.render(out, "footer")
+    latex_content = "".join(out)
+    log_performance("LaTeX template render", time.time() - start_time, f"Theme '{theme.name}', {len(out)} chunks")
+    return latex_content
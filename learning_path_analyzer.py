@@ -1,5 +1,6 @@
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 from config import (
     OPENROUTER_API_KEY,
@@ -12,22 +13,32 @@ from config import (
     ERROR_MESSAGES,
 )
 from utils import (
-    create_error_analysis,
     retry_with_backoff,
     handle_api_error,
     sanitize_input,
     extract_json_from_text,
     make_api_call,
 )
+from resource_catalog import get_catalog_skill_ids, attach_catalog_resources
 from logging_config import get_logger, log_function_call, log_api_call, log_performance
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Fan-out mode: request a compact outline first, then generate each phase concurrently
+LEARNING_PATH_FAN_OUT = True
+MAX_PHASE_WORKERS = 4
+
 
 @log_function_call
-def analyze_learning_path(current_skills, dream_role):
-    """Analyze current skills against dream role and provide detailed learning path with enhanced error handling"""
+def analyze_learning_path(current_skills, dream_role, fan_out=LEARNING_PATH_FAN_OUT):
+    """
+    Analyze current skills against dream role and provide detailed learning path with enhanced error handling
+
+    With fan_out enabled the path is generated as an outline plus concurrent per-phase calls,
+    falling back to a single completion if the outline cannot be produced.
+    Returns the validated learning path dict, or a '## ❌' markdown error string.
+    """
     start_time = time.time()
     logger.info("Starting learning path analysis")
     logger.debug(f"Current skills length: {len(current_skills) if current_skills else 0}")
@@ -35,7 +46,7 @@ def analyze_learning_path(current_skills, dream_role):
     
     if not current_skills or not dream_role:
         logger.warning("Missing current skills or dream role")
-        return "Please provide both your current skills and dream role."
+        return "## ❌ Input Error\n\nPlease provide both your current skills and dream role."
 
     # Sanitize inputs
     logger.debug("Sanitizing inputs")
@@ -56,6 +67,17 @@ def analyze_learning_path(current_skills, dream_role):
             logger.warning("OpenRouter API key not configured, returning error message")
             return "## ❌ Configuration Error\n\nOpenRouter API key not configured. Please configure your API key to use the learning path generator."
 
+    if fan_out:
+        analysis = _analyze_learning_path_fan_out(current_skills, dream_role)
+        if analysis is not None:
+            duration = time.time() - start_time
+            log_performance("Learning path analysis (fan-out)", duration, f"Generated {len(analysis.get('learning_path', []))} phases concurrently")
+            return analysis
+        logger.warning("Fan-out generation failed, falling back to single completion")
+
+    # Resources are resolved locally from the catalog; the model only names catalog skill ids
+    catalog_skill_ids = ", ".join(get_catalog_skill_ids())
+
     # Create a focused, structured prompt for better results
     prompt = f"""
 You are an expert career coach and learning path specialist. Analyze the user's current skills against their dream role and provide a comprehensive, actionable learning path.
@@ -69,7 +91,7 @@ You are an expert career coach and learning path specialist. Analyze the user's
 **Instructions:**
 1. Analyze the gap between current skills and dream role requirements
 2. Create a realistic, phased learning path
-3. Recommend only verified, accessible resources
+3. Reference learning resources only by skill id from the Resource Catalog below; links are attached automatically
 4. Provide specific, actionable advice
 5. Return ONLY valid JSON in the exact format specified below
 
@@ -90,16 +112,7 @@ You are an expert career coach and learning path specialist. Analyze the user's
                 "Specific skill to learn in this phase",
                 "Another specific skill"
             ],
-            "resources": [
-                {{
-                    "type": "course",
-                    "name": "Course name (only if you know it exists)",
-                    "url": "URL (only if verified)",
-                    "description": "Why this resource is recommended",
-                    "difficulty": "beginner/intermediate/advanced",
-                    "verified": true/false
-                }}
-            ],
+            "resource_skills": ["catalog_skill_id"],
             "projects": [
                 {{
                     "name": "Project name",
@@ -124,18 +137,19 @@ You are an expert career coach and learning path specialist. Analyze the user's
     ]
 }}
 
+**Resource Catalog Skill IDs:**
+{catalog_skill_ids}
+
 **Important Guidelines:**
-- Only include resources you are confident exist and are accessible
 - Be specific about skills, technologies, and requirements
 - Provide realistic timelines and expectations
 - Focus on actionable, measurable advice
-- If unsure about a resource, set verified: false or omit it
 - Return ONLY the JSON object, no additional text or markdown
 - Ensure all JSON is properly formatted with correct quotes and brackets
 - Keep descriptions concise but informative
 - Use realistic timeframes (2-4 months per phase)
 - Include 2-4 skills per phase
-- Provide 1-2 resources per phase
+- List 1-3 resource_skills per phase, copied exactly from the Resource Catalog; use [] if none fit
 - Include 1 hands-on project per phase
 """
 
@@ -144,16 +158,14 @@ You are an expert career coach and learning path specialist. Analyze the user's
     try:
         # Use the centralized API call function directly
         logger.info("Making API call for learning path analysis")
-        system_message = "You are an expert career coach and learning path specialist. Provide detailed, actionable learning paths with verified resources only. Return only valid JSON in the exact format requested. Never hallucinate or invent fake links."
+        system_message = "You are an expert career coach and learning path specialist. Provide detailed, actionable learning paths. Return only valid JSON in the exact format requested. Never hallucinate or invent fake links."
         messages = [{"role": "user", "content": prompt}]
         
         analysis_text = make_api_call(messages, system_message)
 
         if not analysis_text:
             logger.error("Failed to get response from AI service after multiple attempts")
-            return create_error_analysis(
-                "Failed to get response from AI service after multiple attempts"
-            )
+            return "## ❌ AI Service Error\n\nFailed to get response from AI service after multiple attempts. Please try again."
 
         logger.info(f"Received analysis text of length: {len(analysis_text)}")
         logger.debug(f"Analysis text preview: {analysis_text[:200]}...")
@@ -163,18 +175,16 @@ You are an expert career coach and learning path specialist. Analyze the user's
         analysis = extract_json_from_text(analysis_text)
         if analysis is None:
             logger.warning("No valid JSON found in response, creating error response")
-            return create_error_analysis(
-                "Failed to parse structured response from AI service. Please try again."
-            )
+            return "## ❌ Response Format Error\n\nFailed to parse structured response from AI service. Please try again."
         
         logger.info("Successfully extracted JSON from response")
         
-        # Validate the extracted data
-        if not _validate_extracted_data(analysis):
+        # Validate the extracted data once, here; callers receive the validated dict as-is
+        if not validate_learning_path_data(analysis):
             logger.warning("Extracted data failed validation")
-            return create_error_analysis(
-                "Received invalid data structure from AI service. Please try again."
-            )
+            return "## ❌ Data Validation Error\n\nReceived invalid data structure from AI service. Please try again."
+
+        attach_catalog_resources(analysis["learning_path"])
 
         duration = time.time() - start_time
         log_performance("Learning path analysis", duration, f"Analysis completed with {len(analysis_text)} characters")
@@ -185,10 +195,158 @@ You are an expert career coach and learning path specialist. Analyze the user's
         duration = time.time() - start_time
         logger.error(f"Learning path analysis failed after {duration:.3f}s: {str(e)}", exc_info=True)
         error_message = handle_api_error(e)
-        return create_error_analysis(error_message)
+        return f"## ❌ AI Service Error\n\n{error_message}"
+
+
+def _generate_learning_path_outline(current_skills, dream_role):
+    """Request everything except per-phase details; returns the outline dict or None"""
+    prompt = f"""
+You are an expert career coach and learning path specialist. Analyze the user's current skills against their dream role and outline a phased learning path.
+
+**Current Skills:**
+{current_skills}
+
+**Dream Role:**
+{dream_role}
+
+**Required JSON Response Format:**
+{{
+    "role_analysis": "Detailed analysis of the dream role, its requirements, and how it differs from current skills.",
+    "skills_gap": ["Specific skill 1 that needs development", "Specific skill 2", "Specific skill 3"],
+    "phases": [
+        {{
+            "phase": "Phase 1: Foundation (2-3 months)",
+            "duration": "2-3 months",
+            "description": "What this phase covers and why it's important"
+        }}
+    ],
+    "timeline": "Overall timeline summary (e.g., '6-9 months total')",
+    "success_metrics": ["Specific, measurable metric 1", "Metric 2", "Metric 3"],
+    "career_advice": "Career advice specific to this transition",
+    "networking_tips": ["Specific networking tip 1", "Tip 2", "Tip 3"]
+}}
+
+**Important Guidelines:**
+- Return ONLY the JSON object, no additional text or markdown
+- Use 3-4 phases with realistic timeframes (2-4 months per phase)
+- Do not list skills, resources or projects per phase; they are generated separately
+"""
+
+    system_message = "You are an expert career coach and learning path specialist. Return only valid JSON in the exact format requested."
+    messages = [{"role": "user", "content": prompt}]
+
+    outline = extract_json_from_text(retry_with_backoff(make_api_call, messages, system_message))
+    if not isinstance(outline, dict) or not isinstance(outline.get("phases"), list) or not outline["phases"]:
+        logger.warning("Learning path outline missing or has no phases")
+        return None
+    return outline
+
+
+def _request_phase_details(messages, system_message, phase_name):
+    """One attempt at a phase's details; raises on an API error or an unusable response so it is retried"""
+    details = extract_json_from_text(make_api_call(messages, system_message))
+    if not isinstance(details, dict) or not isinstance(details.get("skills_to_learn"), list) or not details["skills_to_learn"]:
+        raise ValueError(f"No usable details for phase '{phase_name}'")
+    return details
+
+
+def _generate_phase_details(current_skills, dream_role, phase, all_phases, catalog_skill_ids):
+    """
+    Generate skills, catalog resource ids and projects for one phase of the outline.
+
+    Each call is retried with backoff; the last error propagates so the caller never
+    stores a phase without details.
+    """
+    other_phases = [other.get("phase", "") for other in all_phases if other is not phase]
+    prompt = f"""
+You are an expert career coach. Detail ONE phase of a learning path.
+
+**Dream Role:** {dream_role}
+
+**Current Skills:**
+{current_skills}
+
+**This Phase:** {phase.get('phase', 'Phase')} ({phase.get('duration', 'Duration TBD')})
+{phase.get('description', '')}
+
+**Other Phases (do not repeat their content):** {'; '.join(other_phases)}
+
+**Required JSON Response Format:**
+{{
+    "skills_to_learn": ["Specific skill to learn in this phase", "Another specific skill"],
+    "resource_skills": ["catalog_skill_id"],
+    "projects": [
+        {{
+            "name": "Project name",
+            "description": "What this project should accomplish",
+            "skills_practiced": ["skill1", "skill2"],
+            "github_template": "URL if available, otherwise null"
+        }}
+    ]
+}}
+
+**Resource Catalog Skill IDs:** {catalog_skill_ids}
+
+Include 2-4 skills, 1-3 resource_skills copied exactly from the catalog ([] if none fit) and 1 hands-on project. Return ONLY the JSON object.
+"""
+
+    system_message = "You are an expert career coach. Return only valid JSON in the exact format requested. Never hallucinate or invent fake links."
+    messages = [{"role": "user", "content": prompt}]
 
+    details = retry_with_backoff(_request_phase_details, messages, system_message, phase.get("phase", "Phase"))
 
-def _validate_extracted_data(data: dict) -> bool:
+    merged = dict(phase)
+    merged["skills_to_learn"] = details["skills_to_learn"]
+    merged["resource_skills"] = details.get("resource_skills") if isinstance(details.get("resource_skills"), list) else []
+    merged["projects"] = details.get("projects") if isinstance(details.get("projects"), list) else []
+    return merged
+
+
+def _analyze_learning_path_fan_out(current_skills, dream_role):
+    """
+    Generate a learning path as one outline call plus one concurrent call per phase.
+
+    Returns the validated learning path dict, or None so the caller can fall back.
+    """
+    start_time = time.time()
+    try:
+        outline = _generate_learning_path_outline(current_skills, dream_role)
+    except Exception as e:
+        logger.error(f"Learning path outline generation failed: {str(e)}", exc_info=True)
+        return None
+    if outline is None:
+        return None
+
+    phases = [phase for phase in outline.pop("phases") if isinstance(phase, dict)]
+    if not phases:
+        return None
+    outline_duration = time.time() - start_time
+    logger.info(f"Outline with {len(phases)} phases generated in {outline_duration:.3f}s, generating details concurrently")
+
+    catalog_skill_ids = ", ".join(get_catalog_skill_ids())
+    try:
+        with ThreadPoolExecutor(max_workers=min(MAX_PHASE_WORKERS, len(phases))) as executor:
+            detailed_phases = list(executor.map(
+                lambda phase: _generate_phase_details(current_skills, dream_role, phase, phases, catalog_skill_ids),
+                phases,
+            ))
+    except Exception as e:
+        # A path with a hollow phase is worse than the slower single completion
+        logger.error(f"Phase detail generation failed after retries: {str(e)}")
+        return None
+
+    outline["learning_path"] = detailed_phases
+    if not validate_learning_path_data(outline):
+        logger.warning("Fan-out learning path failed validation")
+        return None
+
+    attach_catalog_resources(outline["learning_path"])
+
+    log_performance("Learning path phase fan-out", time.time() - start_time - outline_duration, f"{len(phases)} phases")
+    return outline
+
+
+def validate_learning_path_data(data: dict) -> bool:
     """
     Validate the extracted JSON data has the required structure and content
     """
@@ -237,100 +395,13 @@ def _validate_extracted_data(data: dict) -> bool:
     return True
 
 
-def format_learning_path_output(analysis):
-    """Format the learning path analysis into a readable markdown output with resource verification"""
-    if not isinstance(analysis, dict):
-        return str(analysis)
-
-    output = f"""
-## 🎯 Dream Role Analysis
-
-{analysis.get('role_analysis', 'No analysis available')}
-
-## 🔍 Skills Gap Analysis
-
-"""
-
-    for skill in analysis.get("skills_gap", []):
-        output += f"• {skill}\n"
-
-    output += "\n## 📚 Detailed Learning Path\n"
-
-    for phase in analysis.get("learning_path", []):
-        output += f"""
-### {phase.get('phase', 'Phase')} ({phase.get('duration', 'Duration TBD')})
-
-{phase.get('description', 'No description available')}
-
-**Skills to Learn:**
-"""
-        for skill in phase.get("skills_to_learn", []):
-            output += f"• {skill}\n"
-
-        output += "\n**📖 Learning Resources:**\n"
-        for resource in phase.get("resources", []):
-            resource_type = resource.get("type", "Resource")
-            resource_name = resource.get("name", "Name")
-            resource_url = resource.get("url", "#")
-            resource_desc = resource.get("description", "No description")
-            resource_diff = resource.get("difficulty", "Not specified")
-            is_verified = resource.get("verified", False)
-
-            if is_verified and resource_url and resource_url != "#":
-                output += f"""
-**{resource_type}**: [{resource_name}]({resource_url})
-- **Difficulty**: {resource_diff}
-- **Why this resource**: {resource_desc}
-- **✅ Verified Resource**
-"""
-            else:
-                output += f"""
-**{resource_type}**: {resource_name}
-- **Difficulty**: {resource_diff}
-- **Why this resource**: {resource_desc}
-- **⚠️ Resource not verified - please research before using**
-"""
-
-        output += "\n**🛠️ Hands-on Projects:**\n"
-        for project in phase.get("projects", []):
-            output += f"""
-**{project.get('name', 'Project Name')}**
-- **Description**: {project.get('description', 'No description')}
-- **Skills practiced**: {', '.join(project.get('skills_practiced', []))}
-"""
-            if project.get("github_template"):
-                output += f"- **Template**: [GitHub Repository]({project.get('github_template')})\n"
-
-        output += "\n---\n"
-
-    output += f"""
-## ⏱️ Overall Timeline
-
-{analysis.get('timeline', 'Timeline not available')}
-
-## 📊 Success Metrics
-
-"""
-    for metric in analysis.get("success_metrics", []):
-        output += f"• {metric}\n"
-
-    output += f"""
-## 💼 Career Advice
-
-{analysis.get('career_advice', 'No career advice available')}
-
-## 🤝 Networking Tips
-
-"""
-    for tip in analysis.get("networking_tips", []):
-        output += f"• {tip}\n"
-
-    return output
-
-
 @log_function_call
 def process_learning_path_analysis(current_skills, dream_role):
-    """Main function to process learning path analysis with comprehensive error handling"""
+    """
+    Main function to process learning path analysis with comprehensive error handling
+
+    Returns the validated learning path dict, or a '## ❌' markdown error string.
+    """
     start_time = time.time()
     logger.info("Starting learning path analysis process")
     logger.debug(f"Current skills length: {len(current_skills) if current_skills else 0}")
@@ -0,0 +1,189 @@
+import difflib
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils import hash_text, get_cached_result, set_cached_result
+from logging_config import get_logger, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+LEARNING_PATH_CACHE_TTL = 3 * 24 * 60 * 60  # 3 days
+LEARNING_PATH_CACHE_VERSION = 1
+ROLE_MATCH_CUTOFF = 0.88  # difflib ratio required between role titles once seniority is set aside
+MAX_INDEXED_ROLES = 50  # role titles remembered per skill set for fuzzy matching
+
+# Abbreviations folded into their long form before keys are built
+ROLE_ALIASES = {
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "jnr": "junior",
+    "swe": "software engineer",
+    "sde": "software engineer",
+    "dev": "developer",
+    "eng": "engineer",
+    "engg": "engineer",
+    "mgr": "manager",
+    "pm": "product manager",
+    "ds": "data scientist",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "ui": "user interface",
+    "ux": "user experience",
+    "qa": "quality assurance",
+}
+
+# Level words in a role title; they must match exactly before the rest is fuzzy-matched,
+# since "junior software engineer" is one edit away from "senior software engineer"
+SENIORITY_TOKENS = frozenset({
+    "intern", "trainee", "graduate", "entry", "junior", "associate", "mid", "intermediate",
+    "senior", "staff", "principal", "lead", "head", "chief", "distinguished",
+    "i", "ii", "iii", "iv", "level",
+})
+
+SKILL_ALIASES = {
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "golang": "go",
+    "cpp": "c++",
+    "c sharp": "c#",
+    "csharp": "c#",
+    "reactjs": "react",
+    "react.js": "react",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+    "google cloud platform": "google cloud",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "nlp": "natural language processing",
+    "cv": "computer vision",
+    "sklearn": "scikit-learn",
+    "scikit learn": "scikit-learn",
+    "tf": "tensorflow",
+    "ms excel": "excel",
+    "microsoft excel": "excel",
+    "powerbi": "power bi",
+}
+
+_SKILL_SEPARATORS = re.compile(r"[,;\n/|•]+|\s+and\s+|\s+&\s+")
+_ROLE_NOISE = re.compile(r"[^a-z0-9+#.\s]")
+
+
+def canonicalize_role(dream_role: str) -> str:
+    """Lowercase a role title, strip punctuation and fold common abbreviations"""
+    if not dream_role:
+        return ""
+    words = [word.strip(".") for word in _ROLE_NOISE.sub(" ", dream_role.lower()).split()]
+    return " ".join(ROLE_ALIASES.get(word, word) for word in words if word)
+
+
+def split_seniority(canonical_role: str) -> Tuple[Tuple[str, ...], str]:
+    """Split a canonical role into its sorted seniority tokens and the rest of the title"""
+    words = canonical_role.split()
+    levels = tuple(sorted(word for word in words if word in SENIORITY_TOKENS))
+    return levels, " ".join(word for word in words if word not in SENIORITY_TOKENS)
+
+
+def match_role(canonical_role: str, candidates: Iterable[str], cutoff: float = ROLE_MATCH_CUTOFF) -> Optional[str]:
+    """
+    Closest candidate role at the same seniority.
+
+    Candidates whose seniority tokens differ are never matched; among the rest, the title
+    without seniority must be within `cutoff` of this one's.
+    """
+    levels, title = split_seniority(canonical_role)
+    same_level = {}
+    for candidate in candidates:
+        candidate_levels, candidate_title = split_seniority(candidate)
+        if candidate_levels == levels:
+            same_level.setdefault(candidate_title, candidate)
+    matches = difflib.get_close_matches(title, list(same_level), n=1, cutoff=cutoff)
+    return same_level[matches[0]] if matches else None
+
+
+def normalize_skills(current_skills: str) -> List[str]:
+    """Split free-form skills into a sorted, de-duplicated list with aliases folded"""
+    if not current_skills:
+        return []
+
+    skills = set()
+    for raw_skill in _SKILL_SEPARATORS.split(current_skills.lower()):
+        skill = " ".join(raw_skill.strip(" -*.:\t").split())
+        if skill:
+            skills.add(SKILL_ALIASES.get(skill, skill))
+    return sorted(skills)
+
+
+def _skills_hash(current_skills: str) -> str:
+    return hash_text(*normalize_skills(current_skills))
+
+
+def _result_key(skills_hash: str, canonical_role: str) -> str:
+    return f"learning_path:v{LEARNING_PATH_CACHE_VERSION}:{skills_hash}:{hash_text(canonical_role)}"
+
+
+def _role_index_key(skills_hash: str) -> str:
+    return f"learning_path_roles:v{LEARNING_PATH_CACHE_VERSION}:{skills_hash}"
+
+
+def get_cached_learning_path(current_skills: str, dream_role: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a previously generated learning path for the same skill set and role.
+
+    Tries the canonical role first, then the closest role title cached for the same skills.
+    """
+    start_time = time.time()
+    skills_hash = _skills_hash(current_skills)
+    canonical_role = canonicalize_role(dream_role)
+    if not canonical_role:
+        return None
+
+    result = get_cached_result(_result_key(skills_hash, canonical_role))
+    if result is not None:
+        logger.info(f"Learning path cache hit for role '{canonical_role}'")
+        log_performance("Learning path cache lookup", time.time() - start_time, "Exact hit")
+        return result
+
+    indexed_roles = get_cached_result(_role_index_key(skills_hash)) or []
+    match = match_role(canonical_role, indexed_roles)
+    if match:
+        result = get_cached_result(_result_key(skills_hash, match))
+        if result is not None:
+            logger.info(f"Learning path cache fuzzy hit: '{canonical_role}' matched '{match}'")
+            log_performance("Learning path cache lookup", time.time() - start_time, "Fuzzy hit")
+            return result
+
+    logger.info(f"Learning path cache miss for role '{canonical_role}'")
+    return None
+
+
+def cache_learning_path(current_skills: str, dream_role: str, result: Dict[str, Any]) -> None:
+    """Store a validated learning path and index its role title for fuzzy lookups"""
+    skills_hash = _skills_hash(current_skills)
+    canonical_role = canonicalize_role(dream_role)
+    if not canonical_role or not isinstance(result, dict):
+        return
+
+    set_cached_result(_result_key(skills_hash, canonical_role), result, LEARNING_PATH_CACHE_TTL)
+
+    # The role index is best-effort: a lost concurrent update only costs a fuzzy hit
+    index_key = _role_index_key(skills_hash)
+    indexed_roles = get_cached_result(index_key) or []
+    if canonical_role not in indexed_roles:
+        indexed_roles = (indexed_roles + [canonical_role])[-MAX_INDEXED_ROLES:]
+        set_cached_result(index_key, indexed_roles, LEARNING_PATH_CACHE_TTL)
+
+    logger.info(f"Cached learning path for role '{canonical_role}' ({len(normalize_skills(current_skills))} skills)")
@@ -0,0 +1,221 @@
+import copy
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils import (
+    extract_json_from_text,
+    make_api_call,
+    sanitize_input,
+    hash_text,
+    get_cached_result,
+    set_cached_result,
+)
+from learning_path_cache import canonicalize_role, match_role
+from logging_config import get_logger, log_function_call, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+LIBRARY_SIZE = 25  # number of most requested roles kept pre-generated
+LIBRARY_TTL = 14 * 24 * 60 * 60  # 14 days; an entry is never served longer than this after generation
+LIBRARY_REFRESH_AGE = 7 * 24 * 60 * 60  # the precompute job regenerates entries older than this, well before expiry
+LIBRARY_VERSION = 2  # v2: the index maps each role to when its path was generated
+LIBRARY_INDEX_KEY = f"learning_path_library_index:v{LIBRARY_VERSION}"
+
+# Skills profile used for the canonical (non-personalized) path of a role
+CANONICAL_SKILLS_PROFILE = "General computer literacy and problem-solving skills, no role-specific experience yet"
+
+
+def _library_key(canonical_role: str) -> str:
+    return f"learning_path_library:v{LIBRARY_VERSION}:{hash_text(canonical_role)}"
+
+
+def rank_popular_roles(dream_roles: Iterable[str], top_n: int = LIBRARY_SIZE) -> List[Tuple[str, str, int]]:
+    """
+    Rank requested dream roles by canonical form.
+
+    Returns (canonical_role, most common original title, request count) tuples, most requested first.
+    """
+    counts = Counter()
+    titles = {}
+    for dream_role in dream_roles:
+        canonical_role = canonicalize_role(dream_role)
+        if not canonical_role:
+            continue
+        counts[canonical_role] += 1
+        titles.setdefault(canonical_role, Counter())[dream_role.strip()] += 1
+
+    return [
+        (canonical_role, titles[canonical_role].most_common(1)[0][0], count)
+        for canonical_role, count in counts.most_common(top_n)
+    ]
+
+
+def get_library_path(dream_role: str) -> Optional[Dict[str, Any]]:
+    """Return the pre-generated canonical learning path for a role (exact or fuzzy title match)"""
+    canonical_role = canonicalize_role(dream_role)
+    if not canonical_role:
+        return None
+
+    library_roles = get_cached_result(LIBRARY_INDEX_KEY) or {}
+    if canonical_role not in library_roles:
+        match = match_role(canonical_role, library_roles)
+        if not match:
+            return None
+        logger.info(f"Library role '{canonical_role}' matched '{match}'")
+        canonical_role = match
+
+    return get_cached_result(_library_key(canonical_role))
+
+
+def store_library_index(generated_at: Dict[str, float]) -> None:
+    """Replace the library index with the given roles and their generation times"""
+    set_cached_result(LIBRARY_INDEX_KEY, generated_at, LIBRARY_TTL)
+    logger.info(f"Stored library index with {len(generated_at)} canonical learning paths")
+
+
+def _skill_matches(skill: str, covered: set) -> bool:
+    return str(skill).strip().lower() in covered
+
+
+def apply_learning_path_delta(base_path: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a personalization delta to a canonical learning path without mutating it"""
+    path = copy.deepcopy(base_path)
+    covered = {str(skill).strip().lower() for skill in delta.get("skills_already_covered", []) if skill}
+
+    skills_gap = [skill for skill in path.get("skills_gap", []) if not _skill_matches(skill, covered)]
+    for skill in delta.get("additional_skills_gap", []):
+        if skill and skill not in skills_gap:
+            skills_gap.append(skill)
+    # Never hand back an empty gap; the canonical gap is a better answer than nothing
+    path["skills_gap"] = skills_gap or path.get("skills_gap", [])
+
+    for phase in path.get("learning_path", []):
+        remaining = [skill for skill in phase.get("skills_to_learn", []) if not _skill_matches(skill, covered)]
+        if remaining:
+            phase["skills_to_learn"] = remaining
+
+    if delta.get("role_analysis_note"):
+        path["role_analysis"] = f"{path.get('role_analysis', '')}\n\n{delta['role_analysis_note']}".strip()
+    if delta.get("career_advice_note"):
+        path["career_advice"] = f"{path.get('career_advice', '')}\n\n{delta['career_advice_note']}".strip()
+    if delta.get("timeline"):
+        path["timeline"] = delta["timeline"]
+
+    return path
+
+
+@log_function_call
+def personalize_learning_path(base_path: Dict[str, Any], current_skills: str, dream_role: str) -> Optional[Dict[str, Any]]:
+    """
+    Adapt a canonical learning path to one user's current skills.
+
+    Only the skill delta is requested from the LLM, which is far shorter than a full path.
+    Returns None on failure so callers can fall back to full generation.
+    """
+    start_time = time.time()
+    logger.info("Personalizing canonical learning path")
+
+    current_skills = sanitize_input(current_skills)
+    dream_role = sanitize_input(dream_role)
+
+    phase_skills = []
+    for phase in base_path.get("learning_path", []):
+        phase_skills.extend(phase.get("skills_to_learn", []))
+
+    prompt = f"""
+You are an expert career coach. A standard learning path already exists for the role below. Adjust it for this user.
+
+**Dream Role:** {dream_role}
+
+**User's Current Skills:**
+{current_skills}
+
+**Standard Skills Gap:** {'; '.join(str(skill) for skill in base_path.get('skills_gap', []))}
+
+**Skills Taught By The Standard Path:** {'; '.join(str(skill) for skill in phase_skills)}
+
+**Standard Timeline:** {base_path.get('timeline', 'Not specified')}
+
+Return ONLY a JSON object with this exact structure:
+{{
+    "skills_already_covered": ["skills from the two lists above that the user already has, copied exactly"],
+    "additional_skills_gap": ["skills this user specifically still needs that are not listed above"],
+    "role_analysis_note": "1-2 sentences on how this user's background affects the transition",
+    "career_advice_note": "1-2 sentences of advice specific to this user",
+    "timeline": "Adjusted overall timeline"
+}}
+"""
+
+    try:
+        system_message = "You are an expert career coach. Return only valid JSON in the exact format requested."
+        messages = [{"role": "user", "content": prompt}]
+
+        delta_text = make_api_call(messages, system_message)
+        delta = extract_json_from_text(delta_text)
+        if not isinstance(delta, dict):
+            logger.warning("Personalization delta was not valid JSON")
+            return None
+
+        for field in ["skills_already_covered", "additional_skills_gap"]:
+            if not isinstance(delta.get(field, []), list):
+                logger.warning(f"Personalization delta field '{field}' must be a list")
+                return None
+
+        path = apply_learning_path_delta(base_path, delta)
+
+        duration = time.time() - start_time
+        log_performance("Learning path personalization", duration, f"Removed {len(delta.get('skills_already_covered', []))} covered skills, added {len(delta.get('additional_skills_gap', []))}")
+
+        return path
+
+    except Exception as e:
+        duration = time.time() - start_time
+        logger.error(f"Learning path personalization failed after {duration:.3f}s: {str(e)}", exc_info=True)
+        return None
+
+
+@log_function_call
+def build_learning_path_library(dream_roles: Iterable[str], top_n: int = LIBRARY_SIZE) -> int:
+    """
+    Pre-generate canonical learning paths for the most requested roles.
+
+    Paths generated less than LIBRARY_REFRESH_AGE ago are kept; older ones are regenerated.
+    Kept entries are not re-stored, so their TTL still runs from generation. If a refresh
+    fails, the old path is served until it expires. Returns the number of generated paths.
+    """
+    from learning_path_analyzer import analyze_learning_path
+
+    start_time = time.time()
+    popular_roles = rank_popular_roles(dream_roles, top_n)
+    logger.info(f"Building learning path library for {len(popular_roles)} roles")
+
+    previous_index = get_cached_result(LIBRARY_INDEX_KEY) or {}
+    index = {}
+    generated = 0
+    for canonical_role, title, count in popular_roles:
+        generated_at = previous_index.get(canonical_role)
+        stored = generated_at is not None and get_cached_result(_library_key(canonical_role)) is not None
+        if stored and time.time() - generated_at < LIBRARY_REFRESH_AGE:
+            index[canonical_role] = generated_at
+            continue
+
+        logger.info(f"Generating canonical learning path for '{title}' ({count} requests)")
+        result = analyze_learning_path(CANONICAL_SKILLS_PROFILE, title)
+        if isinstance(result, dict) and result.get("learning_path"):
+            set_cached_result(_library_key(canonical_role), result, LIBRARY_TTL)
+            index[canonical_role] = time.time()
+            generated += 1
+        elif stored:
+            logger.warning(f"Could not refresh canonical learning path for '{title}', keeping the current one")
+            index[canonical_role] = generated_at
+        else:
+            logger.warning(f"Could not generate canonical learning path for '{title}'")
+
+    store_library_index(index)
+
+    duration = time.time() - start_time
+    log_performance("Learning path library build", duration, f"{generated} generated, {len(index)} total")
+
+    return generated
@@ -1,23 +1,115 @@
+import errno
 import os
+import shutil
+import signal
+import socket
 import subprocess
 import tempfile
 import uuid
 import time
 from datetime import datetime
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils import get_cached_result, hash_text, set_cached_result
+from latex_lint import lint_latex
 from logging_config import get_logger, log_function_call, log_file_operation, log_performance
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Precompiled preamble formats: the fixed resume preamble is dumped once into a .fmt
+# and each resume compiles only its body with pdflatex -fmt
+LATEX_FORMAT_ENABLED = True
+LATEX_FORMAT_DIR = os.path.join("pdfs", "formats")
+LATEX_FORMAT_VERSION = 1  # bump to force every format to be rebuilt
+LATEX_FORMAT_BUILD_TIMEOUT = 60
+DOCUMENT_BEGIN_MARKER = "\\begin{document}"
+DOCUMENT_END_MARKER = "\\end{document}"
+
+# pdfTeX does not store glyph-to-unicode mappings in formats, so re-apply them per document
+LATEX_FORMAT_BODY_PRELUDE = "\\input{glyphtounicode}\n\\pdfgentounicode=1\n"
+
+# pdflatex output that means the format was built by a different TeX installation
+_STALE_FORMAT_MARKERS = ("Fatal format file error", "made by different executable version", "can't be used with")
+
+_format_build_lock = threading.Lock()
+_failed_formats = set()
+
+# Content-addressed cache of compiled PDFs; identical LaTeX is never compiled twice
+PDF_CACHE_ENABLED = True
+PDF_CACHE_DIR = os.path.join("pdfs", "cache")
+PDF_CACHE_VERSION = 1  # bump when compile options change the output for the same source
+PDF_CACHE_MAX_BYTES = 200 * 1024 * 1024  # least recently used PDFs are evicted beyond this
+
+# Batch compiles: documents sharing a preamble are typeset in one pdflatex run and split
+# at page marks written by BATCH_MARKS_SETUP
+MAX_BATCH_DOCUMENTS = 20
+BATCH_COMPILE_TIMEOUT_PER_DOCUMENT = 5  # seconds added to COMPILE_TIMEOUT per batched document
+BATCH_MARKS_SETUP = "\\newwrite\\hvbatchmarks\\immediate\\openout\\hvbatchmarks=\\jobname.marks\n"
+
+# Static LaTeX checks (latex_lint) before any pdflatex process is spawned
+LATEX_PREFLIGHT_ENABLED = True
+
+# Compiles run in a scratch directory on the same filesystem as pdfs/, so finished PDFs and
+# formats are renamed into place instead of being copied out of the system temp dir
+PDF_BUILD_DIR = os.path.join("pdfs", "build")
+
+# ReportLab styles for the LaTeX-parsing fallback, built on first use
+_alternative_styles = None
+
+
+
+def _django_setting(name: str, default: Any) -> Any:
+    """A Django setting when Django is configured (web and workers), else the default"""
+    try:
+        from django.conf import settings
+
+        value = getattr(settings, name, None)
+    except Exception:
+        value = None
+    return default if value is None else value
+
+
+# Compile pool: caps concurrent pdflatex processes per worker process so a burst of
+# builder jobs cannot fork dozens of TeX runs and starve the LLM-bound actors.
+# settings.MAX_CONCURRENT_COMPILES overrides the default of half the CPU cores.
+MAX_CONCURRENT_COMPILES = max(1, int(_django_setting("MAX_CONCURRENT_COMPILES", (os.cpu_count() or 2) // 2)))
+COMPILE_TIMEOUT = 30  # wall-clock seconds per pdflatex run
+COMPILE_QUEUE_TIMEOUT = 60  # seconds a compile may wait for a free slot
+COMPILE_MEMORY_LIMIT_BYTES = 1024 * 1024 * 1024  # address-space limit per pdflatex process
+COMPILE_CPU_LIMIT_SECONDS = 60  # CPU-time limit per pdflatex process
+
+_compile_slots = threading.BoundedSemaphore(MAX_CONCURRENT_COMPILES)
+_compile_stats_lock = threading.Lock()
+_compile_stats = {
+    "waiting": 0,
+    "running": 0,
+    "completed": 0,
+    "timed_out": 0,
+    "queue_timeouts": 0,
+    "total_wait_seconds": 0.0,
+    "max_wait_seconds": 0.0,
+}
+
+# Each worker process publishes its pool stats to the shared cache so the web process can
+# report queue depth across the compile pool; entries of dead workers expire
+COMPILE_STATS_KEY_PREFIX = "compile_pool_stats"
+COMPILE_STATS_INDEX_KEY = f"{COMPILE_STATS_KEY_PREFIX}:workers"
+COMPILE_STATS_TTL = 10 * 60
+
 
 @log_function_call
-def generate_pdf_from_latex(latex_content: str) -> Optional[str]:
+def generate_pdf_from_latex(latex_content: str, resume_data: Optional[Dict[str, Any]] = None, theme: Optional[str] = None) -> Optional[str]:
     """
     Generate a PDF file from LaTeX content using pdflatex
 
     Args:
         latex_content: The LaTeX code to compile
+        resume_data: Structured data the LaTeX was generated from; when given, the
+            fallback renders it directly instead of parsing the LaTeX
+        theme: Theme the LaTeX was generated with, for the fallback renderer
 
     Returns:
         Path to the generated PDF file, or None if generation failed
@@ -27,14 +119,35 @@ def generate_pdf_from_latex(latex_content: str) -> Optional[str]:
     logger.debug(f"LaTeX content length: {len(latex_content)} characters")
     
     try:
+        cache_key = None
+        if PDF_CACHE_ENABLED:
+            cache_key = get_pdf_cache_key(latex_content)
+            cached_path = get_cached_pdf(cache_key)
+            if cached_path:
+                logger.info(f"PDF cache hit: {cached_path}")
+                log_performance("PDF generation (cache hit)", time.time() - start_time, f"Key {cache_key[:12]}")
+                return cached_path
+
         # Create a unique filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         unique_id = str(uuid.uuid4())[:8]
         filename = f"resume_{timestamp}_{unique_id}"
         logger.debug(f"Generated filename: {filename}")
 
+        # Pre-flight: repair what can be repaired and skip pdflatex for documents that
+        # would fail anyway, instead of waiting on a doomed compile
+        if LATEX_PREFLIGHT_ENABLED:
+            lint = lint_latex(latex_content)
+            if lint.repairs:
+                logger.info(f"LaTeX pre-flight repairs: {'; '.join(lint.repairs)}")
+            if not lint.ok:
+                logger.warning(f"LaTeX pre-flight failed, skipping pdflatex: {'; '.join(lint.errors)}")
+                return generate_pdf_alternative(latex_content, filename, resume_data, theme)
+            latex_content = lint.latex
+
         # Create temporary directory for LaTeX compilation
-        with tempfile.TemporaryDirectory() as temp_dir:
+        os.makedirs(PDF_BUILD_DIR, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=os.path.abspath(PDF_BUILD_DIR)) as temp_dir:
             logger.debug(f"Created temporary directory: {temp_dir}")
             
             # Write LaTeX content to file
@@ -43,10 +156,16 @@ def generate_pdf_from_latex(latex_content: str) -> Optional[str]:
                 f.write(latex_content)
             logger.debug(f"LaTeX content written to: {tex_file_path}")
 
+            # Warm path: compile only the body against the precompiled preamble format
+            if LATEX_FORMAT_ENABLED:
+                warm_pdf_path = _compile_with_preamble_format(latex_content, filename, temp_dir)
+                if warm_pdf_path:
+                    return _store_compiled_pdf(warm_pdf_path, filename, start_time, "warm", cache_key)
+
             # Try to compile with pdflatex
             logger.info("Attempting to compile with pdflatex")
             try:
-                result = subprocess.run(
+                result = run_latex_process(
                     [
                         "pdflatex",
                         "-interaction=nonstopmode",
@@ -54,9 +173,6 @@ def generate_pdf_from_latex(latex_content: str) -> Optional[str]:
                         temp_dir,
                         tex_file_path,
                     ],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
                 )
 
                 logger.debug(f"pdflatex return code: {result.returncode}")
@@ -67,25 +183,7 @@ def generate_pdf_from_latex(latex_content: str) -> Optional[str]:
                     # PDF was generated successfully
                     pdf_path = os.path.join(temp_dir, f"{filename}.pdf")
                     if os.path.exists(pdf_path):
-                        # Copy to pdfs directory
-                        output_path = os.path.join("pdfs", f"{filename}.pdf")
-                        
-                        # Ensure pdfs directory exists
-                        os.makedirs("pdfs", exist_ok=True)
-                        
-                        with open(pdf_path, "rb") as src, open(
-                            output_path, "wb"
-                        ) as dst:
-                            dst.write(src.read())
-                        
-                        file_size = os.path.getsize(output_path)
-                        logger.info(f"PDF generated successfully: {output_path} ({file_size} bytes)")
-                        log_file_operation("PDF generation", output_path, success=True, file_size=file_size)
-                        
-                        duration = time.time() - start_time
-                        log_performance("PDF generation with pdflatex", duration, f"Generated {file_size} bytes")
-                        
-                        return output_path
+                        return _store_compiled_pdf(pdf_path, filename, start_time, "cold", cache_key)
                     else:
                         logger.warning("pdflatex succeeded but PDF file not found")
                 else:
@@ -93,14 +191,14 @@ def generate_pdf_from_latex(latex_content: str) -> Optional[str]:
 
                 # If pdflatex failed, try alternative method
                 logger.info("pdflatex failed, trying alternative method")
-                return generate_pdf_alternative(latex_content, filename)
+                return generate_pdf_alternative(latex_content, filename, resume_data, theme)
 
             except subprocess.TimeoutExpired:
                 logger.warning("pdflatex timed out, trying alternative method")
-                return generate_pdf_alternative(latex_content, filename)
+                return generate_pdf_alternative(latex_content, filename, resume_data, theme)
             except FileNotFoundError:
                 logger.warning("pdflatex not found, trying alternative method")
-                return generate_pdf_alternative(latex_content, filename)
+                return generate_pdf_alternative(latex_content, filename, resume_data, theme)
 
     except Exception as e:
         duration = time.time() - start_time
@@ -109,31 +207,586 @@ def generate_pdf_from_latex(latex_content: str) -> Optional[str]:
         return None
 
 
+def _store_compiled_pdf(pdf_path: str, filename: str, start_time: float, mode: str, cache_key: Optional[str] = None) -> str:
+    """
+    Move a compiled PDF from the build directory into storage and return its path.
+
+    With a cache key the PDF is stored as pdfs/cache/<key>.pdf, otherwise as pdfs/<filename>.pdf.
+    """
+    if cache_key:
+        output_dir = PDF_CACHE_DIR
+        output_path = _pdf_cache_path(cache_key)
+    else:
+        output_dir = "pdfs"
+        output_path = os.path.join("pdfs", f"{filename}.pdf")
+
+    # Ensure output directory exists
+    os.makedirs(output_dir, exist_ok=True)
+
+    move_into_storage(pdf_path, output_path)
+
+    if cache_key:
+        evict_pdf_cache()
+
+    file_size = os.path.getsize(output_path)
+    logger.info(f"PDF generated successfully ({mode} compile): {output_path} ({file_size} bytes)")
+    log_file_operation("PDF generation", output_path, success=True, file_size=file_size)
+
+    duration = time.time() - start_time
+    log_performance(f"PDF generation with pdflatex ({mode})", duration, f"Generated {file_size} bytes")
+
+    return output_path
+
+
+def move_into_storage(src_path: str, dst_path: str) -> str:
+    """
+    Atomically move a file to dst_path, replacing any existing file.
+
+    A plain rename when both paths share a filesystem; otherwise the file is copied beside
+    the destination and renamed, so readers never see a partial file either way.
+    """
+    try:
+        os.replace(src_path, dst_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        staged_path = f"{dst_path}.{uuid.uuid4().hex[:8]}.tmp"
+        shutil.copyfile(src_path, staged_path)
+        os.replace(staged_path, dst_path)
+        os.remove(src_path)
+    return dst_path
+
+
 @log_function_call
-def generate_pdf_alternative(latex_content: str, filename: str) -> Optional[str]:
+def publish_pdf(pdf_path: str, storage_path: str) -> str:
     """
-    Generate PDF using alternative method when pdflatex is not available
+    Place a generated PDF at storage_path (e.g. under MEDIA_ROOT) without rewriting it.
+
+    PDFs owned by the compile cache are hard-linked so the cache entry stays valid and later
+    eviction does not affect the published file; any other PDF is moved. Falls back to a
+    copy only when the two paths are on different filesystems.
     """
-    start_time = time.time()
-    logger.info("Starting alternative PDF generation using ReportLab")
-    
+    os.makedirs(os.path.dirname(storage_path) or ".", exist_ok=True)
+
+    cache_dir = os.path.abspath(PDF_CACHE_DIR)
+    if os.path.dirname(os.path.abspath(pdf_path)) != cache_dir:
+        move_into_storage(pdf_path, storage_path)
+    else:
+        staged_path = f"{storage_path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            os.link(pdf_path, staged_path)
+        except OSError:
+            shutil.copyfile(pdf_path, staged_path)
+        os.replace(staged_path, storage_path)
+
+    log_file_operation("PDF publish", storage_path, success=True, file_size=os.path.getsize(storage_path))
+    return storage_path
+
+
+def get_compile_pool_stats() -> Dict[str, Any]:
+    """Snapshot of the compile pool: queue depth, running compiles and wait times"""
+    with _compile_stats_lock:
+        stats = dict(_compile_stats)
+    stats["max_concurrent"] = MAX_CONCURRENT_COMPILES
+    started = stats["completed"] + stats["timed_out"] + stats["running"]
+    stats["avg_wait_seconds"] = stats["total_wait_seconds"] / started if started else 0.0
+    return stats
+
+
+def publish_compile_pool_stats() -> bool:
+    """Store this process's pool stats in the shared cache for collect_compile_pool_stats"""
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    stats = dict(get_compile_pool_stats(), worker=worker, published_at=time.time())
+    if not set_cached_result(f"{COMPILE_STATS_KEY_PREFIX}:{worker}", stats, COMPILE_STATS_TTL):
+        return False
+    # The index is read-modify-write; a worker lost to a concurrent update re-adds itself next time
+    workers = get_cached_result(COMPILE_STATS_INDEX_KEY) or []
+    if worker not in workers:
+        set_cached_result(COMPILE_STATS_INDEX_KEY, workers + [worker], COMPILE_STATS_TTL)
+    return True
+
+
+def collect_compile_pool_stats() -> Dict[str, Any]:
+    """Totals across every worker that published pool stats recently, plus the per-worker stats"""
+    workers = []
+    for worker in get_cached_result(COMPILE_STATS_INDEX_KEY) or []:
+        stats = get_cached_result(f"{COMPILE_STATS_KEY_PREFIX}:{worker}")
+        if stats:
+            workers.append(stats)
+
+    totals = {
+        key: sum(stats[key] for stats in workers)
+        for key in ("waiting", "running", "completed", "timed_out", "queue_timeouts", "max_concurrent")
+    }
+    totals["max_wait_seconds"] = max((stats["max_wait_seconds"] for stats in workers), default=0.0)
+    started = totals["completed"] + totals["timed_out"] + totals["running"]
+    total_wait = sum(stats["total_wait_seconds"] for stats in workers)
+    totals["avg_wait_seconds"] = total_wait / started if started else 0.0
+    return {"totals": totals, "workers": workers}
+
+
+def _with_compile_limits(args: List[str]) -> List[str]:
+    """
+    Wrap a command so the shell caps memory and CPU time before exec'ing it (POSIX only).
+
+    The limits are set in the exec'd shell rather than in a preexec_fn, which is unsafe in
+    threaded workers; limits the host does not allow are skipped. exec keeps the command's
+    pid, so the process group still belongs to it.
+    """
+    if os.name != "posix":
+        return args
+    script = (
+        f"ulimit -v {COMPILE_MEMORY_LIMIT_BYTES // 1024} 2>/dev/null; "
+        f"ulimit -t {COMPILE_CPU_LIMIT_SECONDS} 2>/dev/null; "
+        'exec "$@"'
+    )
+    return ["/bin/sh", "-c", script, "latex-limits"] + list(args)
+
+
+def _kill_process_group(process: subprocess.Popen) -> None:
+    """Kill pdflatex and anything it spawned (e.g. mktextfm) so nothing outlives the timeout"""
     try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def run_latex_process(
+    args: List[str],
+    timeout: float = COMPILE_TIMEOUT,
+    env: Optional[Dict[str, str]] = None,
+    cwd: Optional[str] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Run a TeX command inside the bounded compile pool.
+
+    Waits up to COMPILE_QUEUE_TIMEOUT for a slot, runs the process in its own session with
+    memory/CPU limits applied by a shell wrapper (POSIX only), and kills the whole process group on
+    timeout. Raises subprocess.TimeoutExpired for both queue and run timeouts, like
+    subprocess.run.
+    """
+    queued_at = time.time()
+    with _compile_stats_lock:
+        _compile_stats["waiting"] += 1
+        queue_depth = _compile_stats["waiting"]
+    if queue_depth > 1 or _compile_stats["running"] >= MAX_CONCURRENT_COMPILES:
+        logger.info(f"Compile queued: {queue_depth} waiting, {_compile_stats['running']}/{MAX_CONCURRENT_COMPILES} running")
+
+    acquired = _compile_slots.acquire(timeout=COMPILE_QUEUE_TIMEOUT)
+    wait_seconds = time.time() - queued_at
+    with _compile_stats_lock:
+        _compile_stats["waiting"] -= 1
+        if acquired:
+            _compile_stats["running"] += 1
+            _compile_stats["total_wait_seconds"] += wait_seconds
+            _compile_stats["max_wait_seconds"] = max(_compile_stats["max_wait_seconds"], wait_seconds)
+        else:
+            _compile_stats["queue_timeouts"] += 1
+    if not acquired:
+        logger.warning(f"No compile slot free after {wait_seconds:.1f}s")
+        raise subprocess.TimeoutExpired(args, COMPILE_QUEUE_TIMEOUT)
+
+    timed_out = False
+    try:
+        process = subprocess.Popen(
+            _with_compile_limits(args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env,
+            cwd=cwd,
+            start_new_session=True,
+        )
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            _kill_process_group(process)
+            stdout, stderr = process.communicate()
+            logger.warning(f"{args[0]} killed after {timeout}s timeout")
+            raise subprocess.TimeoutExpired(args, timeout, output=stdout, stderr=stderr)
+        return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+    finally:
+        _compile_slots.release()
+        with _compile_stats_lock:
+            _compile_stats["running"] -= 1
+            _compile_stats["timed_out" if timed_out else "completed"] += 1
+        log_performance("LaTeX compile slot", time.time() - queued_at, f"waited {wait_seconds:.3f}s")
+
+
+def get_pdf_cache_key(latex_content: str) -> str:
+    """Hash the LaTeX source together with everything else that affects the compiled output"""
+    return hash_text(f"pdf:v{PDF_CACHE_VERSION}", f"fmt:v{LATEX_FORMAT_VERSION}", latex_content)
+
+
+def _pdf_cache_path(cache_key: str) -> str:
+    return os.path.join(PDF_CACHE_DIR, f"{cache_key}.pdf")
+
+
+def get_cached_pdf(cache_key: str) -> Optional[str]:
+    """Return the cached PDF for a key, marking it as recently used; None on a miss"""
+    path = _pdf_cache_path(cache_key)
+    try:
+        # atime is the LRU timestamp. mtime is left alone: entries are hard-linked into
+        # MEDIA_ROOT by publish_pdf, and downloads derive ETag/Last-Modified from it
+        stat_result = os.stat(path)
+        os.utime(path, ns=(time.time_ns(), stat_result.st_mtime_ns))
+    except OSError:
+        return None
+    return path
+
+
+def evict_pdf_cache(max_bytes: Optional[int] = None) -> int:
+    """Delete least recently used cached PDFs until the cache fits in max_bytes; returns files removed"""
+    if max_bytes is None:
+        max_bytes = PDF_CACHE_MAX_BYTES
+    try:
+        entries = [
+            entry for entry in os.scandir(PDF_CACHE_DIR)
+            if entry.is_file() and entry.name.endswith(".pdf")
+        ]
+    except OSError:
+        return 0
+
+    stats = {}
+    for entry in entries:
+        try:
+            stats[entry.path] = entry.stat()
+        except OSError:
+            continue  # removed by another worker
+
+    total_bytes = sum(stat.st_size for stat in stats.values())
+    if total_bytes <= max_bytes:
+        return 0
+
+    removed = 0
+    for path, stat in sorted(stats.items(), key=lambda item: item[1].st_atime):
+        if total_bytes <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+        total_bytes -= stat.st_size
+
+    logger.info(f"Evicted {removed} PDFs from cache, {total_bytes} bytes remain")
+    return removed
+
+
+def split_preamble(latex_content: str) -> Optional[Tuple[str, str]]:
+    """Split LaTeX source into (preamble, body); the body starts at \\begin{document}"""
+    marker = latex_content.find(DOCUMENT_BEGIN_MARKER)
+    if marker <= 0:
+        return None
+    return latex_content[:marker], latex_content[marker:]
+
+
+def _format_name(preamble: str) -> str:
+    return f"resume_{hash_text(str(LATEX_FORMAT_VERSION), preamble)[:16]}"
+
+
+def get_preamble_format(preamble: str) -> Optional[str]:
+    """
+    Return the name of a precompiled pdflatex format for this preamble, building it if needed.
+
+    Formats are keyed by a hash of the preamble, so editing the template produces a new
+    format rather than reusing a stale one. Returns None when the format cannot be built.
+    """
+    fmt_name = _format_name(preamble)
+    fmt_path = os.path.join(LATEX_FORMAT_DIR, f"{fmt_name}.fmt")
+    if os.path.exists(fmt_path):
+        return fmt_name
+    if fmt_name in _failed_formats:
+        return None
+
+    with _format_build_lock:
+        if os.path.exists(fmt_path):
+            return fmt_name
+
+        start_time = time.time()
+        logger.info(f"Building pdflatex format {fmt_name}")
+        os.makedirs(LATEX_FORMAT_DIR, exist_ok=True)
+        try:
+            with tempfile.TemporaryDirectory(dir=os.path.abspath(LATEX_FORMAT_DIR)) as build_dir:
+                preamble_path = os.path.join(build_dir, f"{fmt_name}.tex")
+                with open(preamble_path, "w", encoding="utf-8") as f:
+                    f.write(preamble)
+                    f.write("\n\\dump\n")
+
+                result = run_latex_process(
+                    [
+                        "pdflatex",
+                        "-ini",
+                        "-interaction=nonstopmode",
+                        f"-jobname={fmt_name}",
+                        "-output-directory",
+                        build_dir,
+                        "&pdflatex",
+                        preamble_path,
+                    ],
+                    timeout=LATEX_FORMAT_BUILD_TIMEOUT,
+                    cwd=build_dir,
+                )
+                built_path = os.path.join(build_dir, f"{fmt_name}.fmt")
+                if result.returncode != 0 or not os.path.exists(built_path):
+                    logger.warning(f"pdflatex format build failed with return code {result.returncode}: {result.stdout[-500:]}")
+                    _failed_formats.add(fmt_name)
+                    return None
+
+                # Atomic rename so concurrent workers never load a half-written format
+                move_into_storage(built_path, fmt_path)
+
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+            logger.warning(f"Could not build pdflatex format {fmt_name}: {str(e)}")
+            _failed_formats.add(fmt_name)
+            return None
+
+        log_performance("pdflatex format build", time.time() - start_time, fmt_name)
+        return fmt_name
+
+
+def invalidate_preamble_format(fmt_name: str) -> None:
+    """Delete a format that pdflatex refused to load (e.g. after a TeX Live upgrade)"""
+    try:
+        os.remove(os.path.join(LATEX_FORMAT_DIR, f"{fmt_name}.fmt"))
+        logger.info(f"Removed stale pdflatex format {fmt_name}")
+    except OSError:
+        pass
+
+
+def warm_latex_format() -> Optional[str]:
+    """Build the format for the resume builder's current preamble; called once per worker at boot"""
+    from resume_builder import generate_latex_header
+
+    split = split_preamble(generate_latex_header())
+    if split is None:
+        return None
+    return get_preamble_format(split[0])
+
+
+def _compile_with_preamble_format(latex_content: str, filename: str, temp_dir: str) -> Optional[str]:
+    """
+    Compile the document body against its precompiled preamble format.
+
+    Returns the path of the PDF in temp_dir, or None so the caller falls back to a cold compile.
+    """
+    split = split_preamble(latex_content)
+    if split is None:
+        return None
+    fmt_name = get_preamble_format(split[0])
+    if fmt_name is None:
+        return None
+
+    body_path = os.path.join(temp_dir, f"{filename}_body.tex")
+    with open(body_path, "w", encoding="utf-8") as f:
+        f.write(LATEX_FORMAT_BODY_PRELUDE)
+        f.write(split[1])
+
+    env = dict(os.environ)
+    # Trailing separator keeps the default TeX Live search path after our directory
+    env["TEXFORMATS"] = os.path.abspath(LATEX_FORMAT_DIR) + os.pathsep
+
+    logger.info(f"Attempting warm compile with pdflatex format {fmt_name}")
+    try:
+        result = run_latex_process(
+            [
+                "pdflatex",
+                f"-fmt={fmt_name}",
+                "-interaction=nonstopmode",
+                f"-jobname={filename}",
+                "-output-directory",
+                temp_dir,
+                body_path,
+            ],
+            env=env,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        logger.warning(f"Warm pdflatex compile failed, falling back to cold compile: {str(e)}")
+        return None
+
+    pdf_path = os.path.join(temp_dir, f"{filename}.pdf")
+    if result.returncode == 0 and os.path.exists(pdf_path):
+        return pdf_path
+
+    if any(marker in result.stdout for marker in _STALE_FORMAT_MARKERS):
+        invalidate_preamble_format(fmt_name)
+    logger.warning(f"Warm pdflatex compile failed with return code {result.returncode}, falling back to cold compile")
+    # Drop partial output so the cold compile starts clean
+    if os.path.exists(pdf_path):
+        os.remove(pdf_path)
+    return None
+
+
+def _document_inner_body(body: str) -> str:
+    """The part of a body between \\begin{document} and \\end{document}"""
+    inner = body[len(DOCUMENT_BEGIN_MARKER):]
+    end = inner.rfind(DOCUMENT_END_MARKER)
+    return inner[:end] if end != -1 else inner
+
+
+def _compile_batch_group(preamble: str, bodies: List[str], filename: str, temp_dir: str) -> Optional[List[str]]:
+    """
+    Compile several bodies sharing one preamble in a single pdflatex run and split the result.
+
+    Each body starts on a fresh page inside its own group; its first page number is written
+    to <filename>.marks, and PyPDF2 cuts the combined PDF at those pages. Returns one PDF
+    path per body in input order, or None if the run or the split failed.
+    """
+    try:
+        from PyPDF2 import PdfReader, PdfWriter
+    except ImportError:
+        logger.warning("PyPDF2 not available, cannot split batch compile output")
+        return None
+
+    fmt_name = get_preamble_format(preamble) if LATEX_FORMAT_ENABLED else None
+    parts = [LATEX_FORMAT_BODY_PRELUDE if fmt_name else preamble, DOCUMENT_BEGIN_MARKER, "\n", BATCH_MARKS_SETUP]
+    for index, body in enumerate(bodies):
+        parts.append(f"\\clearpage\\immediate\\write\\hvbatchmarks{{{index} \\the\\value{{page}}}}\n\\begingroup\n")
+        parts.append(_document_inner_body(body))
+        parts.append("\n\\endgroup\n")
+    parts.append("\\clearpage\\immediate\\closeout\\hvbatchmarks\n" + DOCUMENT_END_MARKER + "\n")
+
+    tex_path = os.path.join(temp_dir, f"{filename}.tex")
+    with open(tex_path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
+
+    args = ["pdflatex", "-interaction=nonstopmode", f"-jobname={filename}", "-output-directory", temp_dir, tex_path]
+    env = None
+    if fmt_name:
+        args.insert(1, f"-fmt={fmt_name}")
+        env = dict(os.environ)
+        env["TEXFORMATS"] = os.path.abspath(LATEX_FORMAT_DIR) + os.pathsep
+
+    logger.info(f"Batch compiling {len(bodies)} documents ({'warm' if fmt_name else 'cold'})")
+    try:
+        result = run_latex_process(
+            args,
+            timeout=COMPILE_TIMEOUT + BATCH_COMPILE_TIMEOUT_PER_DOCUMENT * len(bodies),
+            env=env,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        logger.warning(f"Batch pdflatex compile failed: {str(e)}")
+        return None
+
+    pdf_path = os.path.join(temp_dir, f"{filename}.pdf")
+    marks_path = os.path.join(temp_dir, f"{filename}.marks")
+    if result.returncode != 0 or not os.path.exists(pdf_path) or not os.path.exists(marks_path):
+        if fmt_name and any(marker in result.stdout for marker in _STALE_FORMAT_MARKERS):
+            invalidate_preamble_format(fmt_name)
+        logger.warning(f"Batch pdflatex compile failed with return code {result.returncode}")
+        return None
+
+    with open(marks_path, encoding="utf-8") as f:
+        start_pages = [int(line.split()[1]) for line in f if line.strip()]
+    reader = PdfReader(pdf_path)
+    total_pages = len(reader.pages)
+    if len(start_pages) != len(bodies) or start_pages != sorted(start_pages) or start_pages[-1] > total_pages:
+        logger.warning(f"Batch page marks {start_pages} do not match {total_pages} pages for {len(bodies)} documents")
+        return None
+
+    outputs = []
+    for index, first_page in enumerate(start_pages):
+        last_page = start_pages[index + 1] - 1 if index + 1 < len(start_pages) else total_pages
+        writer = PdfWriter()
+        for page_number in range(first_page, last_page + 1):
+            writer.add_page(reader.pages[page_number - 1])
+        output_path = os.path.join(temp_dir, f"{filename}_{index}.pdf")
+        with open(output_path, "wb") as f:
+            writer.write(f)
+        outputs.append(output_path)
+    return outputs
+
+
+@log_function_call
+def generate_pdfs_from_latex_batch(latex_documents: List[str]) -> List[Optional[str]]:
+    """
+    Generate PDFs for many LaTeX documents, compiling those that share a preamble together.
+
+    Documents are grouped by preamble (i.e. by theme) and each group of up to
+    MAX_BATCH_DOCUMENTS compiles in one pdflatex run, so process and preamble start-up are
+    paid once per group instead of once per document. Cached documents are returned
+    directly and identical documents are compiled once; documents that fail the pre-flight,
+    and every document of a group whose batch run fails, go through generate_pdf_from_latex
+    one by one.
+
+    Returns one path (or None) per input document, in input order.
+    """
+    start_time = time.time()
+    results: List[Optional[str]] = [None] * len(latex_documents)
+    groups: Dict[str, List[Tuple[int, str, Optional[str]]]] = {}
+    individual: List[int] = []
+    duplicates: Dict[int, int] = {}
+    first_index: Dict[str, int] = {}
+
+    for index, latex_content in enumerate(latex_documents):
+        if latex_content in first_index:
+            duplicates[index] = first_index[latex_content]
+            continue
+        first_index[latex_content] = index
+
+        cache_key = get_pdf_cache_key(latex_content) if PDF_CACHE_ENABLED else None
+        cached_path = get_cached_pdf(cache_key) if cache_key else None
+        if cached_path:
+            results[index] = cached_path
+            continue
+
+        lint = lint_latex(latex_content) if LATEX_PREFLIGHT_ENABLED else None
+        split = split_preamble(lint.latex if lint else latex_content)
+        if (lint and not lint.ok) or split is None:
+            individual.append(index)
+            continue
+        groups.setdefault(split[0], []).append((index, split[1], cache_key))
+
+    batches = []
+    for preamble, members in groups.items():
+        for offset in range(0, len(members), MAX_BATCH_DOCUMENTS):
+            batches.append((preamble, members[offset:offset + MAX_BATCH_DOCUMENTS]))
+
+    def compile_batch(preamble: str, members: List[Tuple[int, str, Optional[str]]]) -> None:
+        if len(members) == 1:
+            individual.append(members[0][0])
+            return
+        batch_start = time.time()
+        filename = f"batch_{uuid.uuid4().hex[:12]}"
+        os.makedirs(PDF_BUILD_DIR, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=os.path.abspath(PDF_BUILD_DIR)) as temp_dir:
+            outputs = _compile_batch_group(preamble, [body for _, body, _ in members], filename, temp_dir)
+            if outputs is None:
+                # Compile one by one so a single bad document cannot fail its neighbours
+                individual.extend(index for index, _, _ in members)
+                return
+            for (index, _, cache_key), pdf_path in zip(members, outputs):
+                results[index] = _store_compiled_pdf(pdf_path, f"{filename}_{index}", batch_start, "batch", cache_key)
+
+    # Groups with different preambles run side by side, still bounded by the compile pool
+    if batches:
+        with ThreadPoolExecutor(max_workers=min(len(batches), MAX_CONCURRENT_COMPILES)) as executor:
+            for future in [executor.submit(compile_batch, preamble, members) for preamble, members in batches]:
+                future.result()
+
+    for index in sorted(individual):
+        results[index] = generate_pdf_from_latex(latex_documents[index])
+    for index, original in duplicates.items():
+        results[index] = results[original]
+
+    duration = time.time() - start_time
+    generated = sum(1 for path in results if path)
+    log_performance("Batch PDF generation", duration, f"{generated}/{len(latex_documents)} PDFs, {len(batches)} batches, {len(individual)} individual")
+    return results
+
+
+def _get_alternative_styles():
+    """Title, section and body styles for the LaTeX-parsing fallback, built once per process"""
+    global _alternative_styles
+    if _alternative_styles is None:
         from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT
+        from reportlab.lib.enums import TA_CENTER
 
-        # Create PDF using ReportLab
-        output_path = os.path.join("pdfs", f"{filename}.pdf")
-        
-        # Ensure pdfs directory exists
-        os.makedirs("pdfs", exist_ok=True)
-        
-        doc = SimpleDocTemplate(output_path, pagesize=letter)
         styles = getSampleStyleSheet()
-
-        # Create custom styles
         title_style = ParagraphStyle(
             "CustomTitle",
             parent=styles["Heading1"],
@@ -159,6 +812,41 @@ def generate_pdf_alternative(latex_content: str, filename: str) -> Optional[str]
             spaceAfter=6,
             fontName="Helvetica",
         )
+        _alternative_styles = (title_style, section_style, normal_style)
+    return _alternative_styles
+
+
+@log_function_call
+def generate_pdf_alternative(latex_content: str, filename: str, resume_data: Optional[Dict[str, Any]] = None, theme: Optional[str] = None) -> Optional[str]:
+    """
+    Generate PDF using alternative method when pdflatex is not available
+
+    Renders resume_data directly when available; parsing the LaTeX is the last resort.
+    """
+    start_time = time.time()
+    logger.info("Starting alternative PDF generation using ReportLab")
+
+    if resume_data:
+        from resume_pdf_renderer import render_resume_pdf
+
+        output_path = render_resume_pdf(resume_data, theme, output_path=os.path.join("pdfs", f"{filename}.pdf"))
+        if output_path:
+            log_performance("Alternative PDF generation (structured)", time.time() - start_time, output_path)
+            return output_path
+        logger.warning("Structured rendering failed, parsing LaTeX instead")
+    
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+        # Create PDF using ReportLab
+        output_path = os.path.join("pdfs", f"{filename}.pdf")
+        
+        # Ensure pdfs directory exists
+        os.makedirs("pdfs", exist_ok=True)
+        
+        doc = SimpleDocTemplate(output_path, pagesize=letter)
+        title_style, section_style, normal_style = _get_alternative_styles()
 
         # Parse LaTeX content and create PDF elements
         story = []
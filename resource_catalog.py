@@ -0,0 +1,157 @@
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from logging_config import get_logger, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+RESOURCE_CATALOG_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "resource_catalog.json"
+)
+MAX_RESOURCES_PER_PHASE = 3
+
+_DIFFICULTY_ORDER = {"beginner": 0, "intermediate": 1, "advanced": 2}
+
+# Aliases too ambiguous to match inside free text ("go beyond", "the rest of"); still valid as explicit ids
+_FREE_TEXT_EXCLUDED_ALIASES = {"go", "ts", "dl", "rest", "security"}
+
+# Built lazily on first use and shared by every request in the process
+_index = None
+_index_lock = threading.Lock()
+
+
+class _CatalogIndex:
+    """In-memory view of the catalog: skill id -> entry, plus a single alias regex for free-text lookups"""
+
+    def __init__(self, skills: Dict[str, Dict[str, Any]]):
+        self.skills = skills
+        self.alias_to_skill = {}
+        for skill_id, entry in skills.items():
+            names = [skill_id, skill_id.replace("_", " "), entry.get("name", "")] + list(entry.get("aliases", []))
+            for name in names:
+                alias = " ".join(str(name).lower().split())
+                if alias:
+                    self.alias_to_skill.setdefault(alias, skill_id)
+
+        # Longest aliases first so the regex prefers "node.js" over "node" at the same position
+        aliases = sorted(
+            (alias for alias in self.alias_to_skill if alias not in _FREE_TEXT_EXCLUDED_ALIASES),
+            key=len,
+            reverse=True,
+        )
+        self.alias_pattern = re.compile(
+            r"(?<![a-z0-9])(" + "|".join(re.escape(alias) for alias in aliases) + r")(?![a-z0-9+#])"
+        ) if aliases else None
+
+
+def load_catalog(path: str = RESOURCE_CATALOG_PATH) -> Optional[_CatalogIndex]:
+    """Load and index the resource catalog once per process; returns None if it is unavailable"""
+    global _index
+
+    if _index is not None:
+        return _index or None
+
+    with _index_lock:
+        if _index is not None:
+            return _index or None
+
+        start_time = time.time()
+        try:
+            with open(path, "r", encoding="utf-8") as catalog_file:
+                skills = json.load(catalog_file).get("skills", {})
+            _index = _CatalogIndex(skills)
+            log_performance("Resource catalog load", time.time() - start_time, f"{len(skills)} skills, {len(_index.alias_to_skill)} aliases")
+        except Exception as e:
+            logger.error(f"Could not load resource catalog from {path}: {str(e)}")
+            _index = False
+
+    return _index or None
+
+
+def get_catalog_skill_ids() -> List[str]:
+    """Return the skill identifiers the LLM may reference"""
+    index = load_catalog()
+    return sorted(index.skills) if index else []
+
+
+def match_catalog_skills(texts: Iterable[str]) -> List[str]:
+    """Map free-text skill names (e.g. 'Advanced Python programming') to catalog skill ids, in order"""
+    index = load_catalog()
+    if not index or not index.alias_pattern:
+        return []
+
+    matched = []
+    for text in texts:
+        normalized = " ".join(str(text).lower().replace("_", " ").split())
+        for match in index.alias_pattern.finditer(normalized):
+            skill_id = index.alias_to_skill[match.group(1)]
+            if skill_id not in matched:
+                matched.append(skill_id)
+    return matched
+
+
+def resolve_phase_resources(
+    skill_ids: Iterable[str],
+    skills_to_learn: Iterable[str] = (),
+    max_resources: int = MAX_RESOURCES_PER_PHASE,
+) -> List[Dict[str, Any]]:
+    """
+    Resolve catalog resources for one learning path phase.
+
+    Skill ids chosen by the LLM come first, then any catalog skills named in the
+    phase's free-text skills. Every skill gets its best entry before any skill gets a second.
+    """
+    index = load_catalog()
+    if not index:
+        return []
+
+    requested = [str(skill_id).strip().lower() for skill_id in skill_ids or [] if skill_id]
+    requested = [index.alias_to_skill.get(skill_id, skill_id) for skill_id in requested]
+    ordered_ids = []
+    for skill_id in requested + match_catalog_skills(requested) + match_catalog_skills(skills_to_learn or []):
+        if skill_id in index.skills and skill_id not in ordered_ids:
+            ordered_ids.append(skill_id)
+
+    first_picks = []
+    extra_picks = []
+    for skill_id in ordered_ids:
+        # Courses and docs before project lists, easiest first
+        entries = sorted(
+            index.skills[skill_id].get("resources", []),
+            key=lambda entry: (entry.get("type") == "project", _DIFFICULTY_ORDER.get(entry.get("difficulty"), 1)),
+        )
+        first_picks.extend((skill_id, entry) for entry in entries[:1])
+        extra_picks.extend((skill_id, entry) for entry in entries[1:])
+
+    resources = []
+    seen_urls = set()
+    for skill_id, entry in first_picks + extra_picks:
+        if len(resources) >= max_resources:
+            break
+        if entry.get("url") in seen_urls:
+            continue
+        seen_urls.add(entry.get("url"))
+        resources.append(dict(entry, verified=True, catalog_skill=skill_id))
+    return resources
+
+
+def attach_catalog_resources(learning_path: List[Dict[str, Any]]) -> None:
+    """Replace each phase's 'resource_skills' (catalog ids picked by the LLM) with resolved 'resources', in place"""
+    start_time = time.time()
+    resolved_count = 0
+    for phase in learning_path or []:
+        if not isinstance(phase, dict):
+            continue
+        skill_ids = phase.pop("resource_skills", None)
+        if not isinstance(skill_ids, list):
+            skill_ids = []
+
+        phase["resources"] = resolve_phase_resources(skill_ids, phase.get("skills_to_learn", []))
+        resolved_count += len(phase["resources"])
+
+    log_performance("Catalog resource resolution", time.time() - start_time, f"{resolved_count} resources across {len(learning_path or [])} phases")
@@ -0,0 +1,226 @@
+import copy
+import ipaddress
+import socket
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+from utils import hash_text, get_cached_result, set_cached_result
+from logging_config import get_logger, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+URL_VERIFIED_TTL = 24 * 60 * 60  # live links are re-checked daily
+URL_DEAD_TTL = 60 * 60  # dead links are re-checked sooner in case of transient outages
+URL_CHECK_TIMEOUT = 5  # seconds per request
+MAX_VERIFIER_CONNECTIONS = 8  # concurrent outbound checks per verification run
+VERIFIER_USER_AGENT = "HireVision-LinkChecker/1.0"
+
+# Some sites reject HEAD; retry these statuses with a 1-byte ranged GET
+_HEAD_REJECTED_STATUSES = {403, 405, 501}
+
+
+class BlockedURLError(urllib.error.URLError):
+    """A URL (or a redirect target) the verifier must not fetch"""
+
+
+def is_public_address(address: str) -> bool:
+    """Whether an IP address is globally routable (not loopback, private, link-local or multicast)"""
+    try:
+        ip = ipaddress.ip_address(address.split("%")[0])
+    except ValueError:
+        return False
+    return ip.is_global and not ip.is_multicast
+
+
+def is_public_url(url: str) -> bool:
+    """
+    Whether a URL is http(s) and its host resolves only to public addresses.
+
+    The URLs come from the LLM; without this a worker could be pointed at loopback,
+    private network or link-local (cloud metadata) services. The lookup here is only a
+    pre-check: DNS may answer differently when the request connects, so the connection
+    itself is vetted again by its peer address.
+    """
+    try:
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme.lower() not in ("http", "https") or not parsed.hostname:
+            return False
+        addresses = socket.getaddrinfo(parsed.hostname, parsed.port or 80, proto=socket.IPPROTO_TCP)
+    except (ValueError, OSError):
+        return False
+    return bool(addresses) and all(is_public_address(sockaddr[0]) for _, _, _, _, sockaddr in addresses)
+
+
+class _GuardedRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Applies the URL check to every redirect hop, not only the first request"""
+
+    def __init__(self, allow_url: Callable[[str], bool]):
+        super().__init__()
+        self.allow_url = allow_url
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        if not self.allow_url(newurl):
+            raise BlockedURLError(f"redirect to disallowed URL {newurl}")
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+def _guarded_connection_class(connection_class, allow_address: Callable[[str], bool]):
+    """
+    An http.client connection class that refuses sockets connected to disallowed addresses.
+
+    The check runs on the connected socket before anything (including a TLS handshake) is
+    sent, so it holds whatever the host resolved to at connect time; Host and SNI still
+    use the original host name.
+    """
+
+    def create_connection(address, *args, **kwargs):
+        sock = socket.create_connection(address, *args, **kwargs)
+        peer = sock.getpeername()[0]
+        if not allow_address(peer):
+            sock.close()
+            raise BlockedURLError(f"{address[0]} connected to disallowed address {peer}")
+        return sock
+
+    class GuardedConnection(connection_class):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._create_connection = create_connection
+
+    return GuardedConnection
+
+
+class _GuardedHTTPHandler(urllib.request.HTTPHandler):
+    def __init__(self, allow_address: Callable[[str], bool]):
+        super().__init__()
+        self.allow_address = allow_address
+
+    def do_open(self, http_class, req, **http_conn_args):
+        return super().do_open(_guarded_connection_class(http_class, self.allow_address), req, **http_conn_args)
+
+
+class _GuardedHTTPSHandler(urllib.request.HTTPSHandler):
+    def __init__(self, allow_address: Callable[[str], bool]):
+        super().__init__()
+        self.allow_address = allow_address
+
+    def do_open(self, http_class, req, **http_conn_args):
+        return super().do_open(_guarded_connection_class(http_class, self.allow_address), req, **http_conn_args)
+
+
+def _request_status(
+    url: str,
+    method: str,
+    timeout: float,
+    allow_url: Callable[[str], bool],
+    allow_address: Callable[[str], bool],
+) -> int:
+    headers = {"User-Agent": VERIFIER_USER_AGENT}
+    if method == "GET":
+        headers["Range"] = "bytes=0-0"
+    request = urllib.request.Request(url, method=method, headers=headers)
+    opener = urllib.request.build_opener(
+        _GuardedRedirectHandler(allow_url), _GuardedHTTPHandler(allow_address), _GuardedHTTPSHandler(allow_address),
+    )
+    try:
+        with opener.open(request, timeout=timeout) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def check_url(
+    url: str,
+    timeout: float = URL_CHECK_TIMEOUT,
+    allow_url: Callable[[str], bool] = is_public_url,
+    allow_address: Callable[[str], bool] = is_public_address,
+) -> bool:
+    """
+    Return True when the URL answers with a non-error HTTP status.
+
+    `allow_url` vets the URL and each redirect target before it is fetched, and
+    `allow_address` vets the peer address of every connection the check opens.
+    """
+    if not url or not allow_url(url):
+        logger.debug(f"URL check {url}: not allowed")
+        return False
+
+    try:
+        status = _request_status(url, "HEAD", timeout, allow_url, allow_address)
+        if status in _HEAD_REJECTED_STATUSES:
+            status = _request_status(url, "GET", timeout, allow_url, allow_address)
+        logger.debug(f"URL check {url}: HTTP {status}")
+        return status < 400
+    except Exception as e:
+        logger.debug(f"URL check {url} failed: {str(e)}")
+        return False
+
+
+def verify_url(url: str, timeout: float = URL_CHECK_TIMEOUT) -> bool:
+    """Check a URL, sharing verdicts across workers through the cache"""
+    cache_key = f"url_verified:{hash_text(url)}"
+    cached_verdict = get_cached_result(cache_key)
+    if cached_verdict is not None:
+        return cached_verdict
+
+    is_live = check_url(url, timeout)
+    set_cached_result(cache_key, is_live, URL_VERIFIED_TTL if is_live else URL_DEAD_TTL)
+    return is_live
+
+
+def collect_resource_urls(learning_path_data: List[Dict[str, Any]]) -> List[str]:
+    """Collect the unique resource and project-template URLs of a learning path"""
+    urls = []
+    for phase in learning_path_data or []:
+        if not isinstance(phase, dict):
+            continue
+        for resource in phase.get("resources", []) or []:
+            if isinstance(resource, dict) and resource.get("url"):
+                urls.append(resource["url"])
+        for project in phase.get("projects", []) or []:
+            if isinstance(project, dict) and project.get("github_template"):
+                urls.append(project["github_template"])
+    return list(dict.fromkeys(urls))
+
+
+def verify_learning_path_resources(
+    learning_path_data: List[Dict[str, Any]],
+    max_connections: int = MAX_VERIFIER_CONNECTIONS,
+    timeout: float = URL_CHECK_TIMEOUT,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    HEAD-check every resource URL of a learning path with bounded concurrency.
+
+    Returns a copy of the data with resource 'verified' flags set from the checks and
+    dead project templates removed, plus {'checked', 'live', 'dead'} counts.
+    """
+    start_time = time.time()
+    urls = collect_resource_urls(learning_path_data)
+    if not urls:
+        return learning_path_data, {"checked": 0, "live": 0, "dead": 0}
+
+    with ThreadPoolExecutor(max_workers=min(max_connections, len(urls))) as executor:
+        verdicts = dict(zip(urls, executor.map(lambda url: verify_url(url, timeout), urls)))
+
+    updated = copy.deepcopy(learning_path_data)
+    for phase in updated:
+        if not isinstance(phase, dict):
+            continue
+        for resource in phase.get("resources", []) or []:
+            if isinstance(resource, dict) and resource.get("url"):
+                resource["verified"] = verdicts.get(resource["url"], False)
+        for project in phase.get("projects", []) or []:
+            if isinstance(project, dict) and project.get("github_template") and not verdicts.get(project["github_template"], False):
+                project["github_template"] = None
+
+    live = sum(1 for is_live in verdicts.values() if is_live)
+    stats = {"checked": len(verdicts), "live": live, "dead": len(verdicts) - live}
+
+    duration = time.time() - start_time
+    log_performance("Learning path resource verification", duration, f"{stats['checked']} URLs, {stats['dead']} dead")
+
+    return updated, stats
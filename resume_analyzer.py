@@ -1,7 +1,9 @@
 import PyPDF2
 import os
+import re
 import time
 import io
+from contextlib import nullcontext
 from openai import OpenAI
 from config import (
     OPENROUTER_API_KEY,
@@ -24,12 +26,20 @@ from utils import (
     validate_file_content,
     sanitize_input,
     make_api_call,
+    hash_text,
+    get_cached_result,
+    set_cached_result,
 )
+from document_classifier import classify_document, CLASSIFIER_CONFIDENCE_THRESHOLD, CLASSIFIER_REJECT_THRESHOLD
 from logging_config import get_logger, log_function_call, log_api_call, log_file_operation, log_performance
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Extracted job requirements are shared by every resume scored against the same posting
+JD_REQUIREMENTS_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+JD_REQUIREMENTS_CACHE_VERSION = 1
+
 
 @log_function_call
 def validate_pdf_file(file):
@@ -263,6 +273,165 @@ def validate_document_type_with_llm(text):
         return True, f"Validation failed ({str(e)}), proceeding with analysis"
 
 
+@log_function_call
+def validate_document_type(text):
+    """
+    Loop 1: decide whether the uploaded document is a resume/CV.
+
+    The local classifier answers confident cases without a network call (a rejection needs
+    the higher CLASSIFIER_REJECT_THRESHOLD); low-confidence documents (or a missing
+    classifier) escalate to the LLM check.
+    Returns (is_resume: bool, message: str)
+    """
+    prediction = classify_document(text)
+    if prediction is None:
+        logger.info("Local document classifier unavailable, escalating to LLM validation")
+        return validate_document_type_with_llm(text)
+
+    document_type, confidence = prediction
+    threshold = CLASSIFIER_CONFIDENCE_THRESHOLD if document_type == "resume" else CLASSIFIER_REJECT_THRESHOLD
+    if confidence < threshold:
+        logger.info(f"Local classifier not confident ({document_type}, {confidence:.3f}), escalating to LLM validation")
+        return validate_document_type_with_llm(text)
+
+    if document_type == "resume":
+        logger.info(f"Document validated as resume by local classifier (confidence: {confidence:.3f})")
+        return True, f"Document validated as resume/CV ({confidence:.0%} confidence)"
+
+    readable_type = document_type.replace("_", " ")
+    logger.warning(f"Document classified as non-resume by local classifier: {document_type} ({confidence:.3f})")
+    return False, f"This appears to be a {readable_type} document, not a resume/CV."
+
+
+def normalize_job_description(job_description: str) -> str:
+    """Normalize a job description so trivially different pastes share one cache entry"""
+    if not job_description:
+        return ""
+    # Collapse whitespace and case; pasted postings differ mostly in line breaks and spacing
+    return re.sub(r"\s+", " ", job_description).strip().lower()
+
+
+def get_job_description_hash(job_description: str) -> str:
+    """Return the cache hash for a job description"""
+    return hash_text(normalize_job_description(job_description))
+
+
+def _validate_job_requirements(requirements: dict) -> bool:
+    """Check that extracted job requirements have the structure the scoring prompt expects"""
+    if not isinstance(requirements, dict):
+        logger.warning("Job requirements are not a dictionary")
+        return False
+
+    must_have = requirements.get("must_have_skills")
+    if not isinstance(must_have, list) or len(must_have) == 0:
+        logger.warning("Job requirements missing must-have skills")
+        return False
+
+    for field in ["nice_to_have_skills", "responsibilities", "keywords"]:
+        if not isinstance(requirements.get(field, []), list):
+            logger.warning(f"Job requirements field '{field}' must be a list")
+            return False
+
+    return True
+
+
+@log_function_call
+def extract_job_requirements(job_description):
+    """
+    Stage 1 of resume scoring: extract the structured requirements of a job description.
+
+    The result only depends on the job description, so it is cached by the hash of the
+    normalized text and reused for every resume scored against the same posting.
+    Returns None when extraction fails so callers can fall back to the full job description.
+    """
+    start_time = time.time()
+    logger.info("Extracting job requirements")
+
+    if not job_description:
+        logger.warning("No job description provided for requirement extraction")
+        return None
+
+    jd_hash = get_job_description_hash(job_description)
+    cache_key = f"jd_requirements:v{JD_REQUIREMENTS_CACHE_VERSION}:{jd_hash}"
+
+    cached_requirements = get_cached_result(cache_key)
+    if cached_requirements is not None:
+        logger.info(f"Using cached job requirements for JD hash: {jd_hash[:12]}")
+        return cached_requirements
+
+    extraction_prompt = f"""
+    You are an expert technical recruiter. Extract the hiring requirements from the job description below.
+
+    **JOB DESCRIPTION:**
+    {job_description}
+
+    **RESPONSE FORMAT:**
+    Return ONLY a JSON object with this exact structure:
+    {{
+        "job_title": "<job title>",
+        "seniority": "<intern/junior/mid/senior/lead/principal/unspecified>",
+        "min_years_experience": <number or null>,
+        "education": "<required education or null>",
+        "must_have_skills": ["<skill1>", "<skill2>", ...],
+        "nice_to_have_skills": ["<skill1>", "<skill2>", ...],
+        "responsibilities": ["<short responsibility1>", "<responsibility2>", ...],
+        "keywords": ["<ATS keyword1>", "<keyword2>", ...]
+    }}
+
+    Keep every list item short (a few words). Do not invent requirements that are not in the description.
+    """
+
+    try:
+        logger.info("Making API call for job requirement extraction")
+        system_message = "You are an expert technical recruiter. Extract job requirements and return only valid JSON with the specified structure."
+        messages = [{"role": "user", "content": extraction_prompt}]
+
+        requirements_text = make_api_call(messages, system_message)
+        requirements = extract_json_from_text(requirements_text)
+
+        if requirements is None or not _validate_job_requirements(requirements):
+            logger.warning("Job requirement extraction returned unusable data, falling back to full job description")
+            return None
+
+        set_cached_result(cache_key, requirements, JD_REQUIREMENTS_CACHE_TTL)
+
+        duration = time.time() - start_time
+        log_performance("Job requirement extraction", duration, f"Extracted {len(requirements.get('must_have_skills', []))} must-have skills for JD hash {jd_hash[:12]}")
+
+        return requirements
+
+    except Exception as e:
+        duration = time.time() - start_time
+        logger.error(f"Job requirement extraction failed after {duration:.3f}s: {str(e)}", exc_info=True)
+        return None
+
+
+def format_job_requirements(requirements: dict) -> str:
+    """Render extracted job requirements as a compact block for the scoring prompt"""
+    lines = [
+        f"- Job title: {requirements.get('job_title') or 'Not specified'}",
+        f"- Seniority: {requirements.get('seniority') or 'unspecified'}",
+    ]
+
+    if requirements.get("min_years_experience") is not None:
+        lines.append(f"- Minimum experience: {requirements.get('min_years_experience')} years")
+    if requirements.get("education"):
+        lines.append(f"- Education: {requirements.get('education')}")
+
+    list_fields = [
+        ("Must-have skills", "must_have_skills"),
+        ("Nice-to-have skills", "nice_to_have_skills"),
+        ("Responsibilities", "responsibilities"),
+        ("Keywords", "keywords"),
+    ]
+    for label, field in list_fields:
+        values = requirements.get(field) or []
+        if values:
+            lines.append(f"- {label}: {'; '.join(str(value) for value in values)}")
+
+    return "\n".join(lines)
+
+
 @log_function_call
 def analyze_resume(resume_text, job_description):
     """Analyze resume against job description using OpenAI with enhanced error handling"""
@@ -332,7 +501,18 @@ python demo.py
 This will show you the interface without requiring an API key.
 """
 
-    # Create the enhanced analysis prompt for top 1% HR manager
+    # Stage 1: reuse (or extract once) the structured requirements of this job description
+    requirements = extract_job_requirements(job_description)
+    if requirements:
+        logger.info("Scoring resume against extracted job requirements")
+        job_section_title = "JOB REQUIREMENTS (extracted from the job description):"
+        job_context = format_job_requirements(requirements)
+    else:
+        logger.info("Scoring resume against the full job description")
+        job_section_title = "JOB DESCRIPTION:"
+        job_context = job_description
+
+    # Stage 2: create the enhanced analysis prompt for top 1% HR manager
     prompt = f"""
     You are a top 1% HR manager in the world with 20+ years of experience at Fortune 500 companies. 
     You have hired thousands of candidates and have an exceptional eye for talent evaluation.
@@ -376,8 +556,8 @@ This will show you the interface without requiring an API key.
     **RESUME TO ANALYZE:**
     {resume_text}
     
-    **JOB DESCRIPTION:**
-    {job_description}
+    **{job_section_title}**
+    {job_context}
     
     **ANALYSIS INSTRUCTIONS:**
     - Be STRICT and DISCRIMINATING in your assessment - differentiate clearly between candidates
@@ -449,53 +629,83 @@ This will show you the interface without requiring an API key.
         return create_error_analysis(error_message)
 
 
+def extract_resume_stage(pdf_file, job_description):
+    """
+    Validate the inputs and extract the resume text.
+
+    Returns (resume_text, None), or (None, error markdown) when the upload cannot be
+    analyzed. Shared by process_resume_analysis and the extract pipeline stage.
+    """
+    # Validate inputs
+    logger.info("Validating inputs")
+    is_valid, error_message = validate_inputs(pdf_file, job_description)
+    if not is_valid:
+        logger.error(f"Input validation failed: {error_message}")
+        return None, f"## ❌ Input Validation Error\n\n{error_message}"
+
+    logger.info("Input validation successful")
+
+    # Extract text from PDF
+    logger.info("Extracting text from PDF")
+    resume_text = extract_text_from_pdf(pdf_file)
+
+    if resume_text.startswith("Error"):
+        logger.error(f"PDF processing failed: {resume_text}")
+        return None, f"## ❌ PDF Processing Error\n\n{resume_text}"
+
+    # Check if extracted text is meaningful
+    text_length = len(resume_text.strip())
+    logger.info(f"Extracted text length: {text_length} characters")
+    
+    if text_length < 50:
+        logger.warning(f"Extracted text too short: {text_length} characters")
+        return None, "## ❌ Insufficient Content\n\nThe PDF appears to contain very little text. Please ensure you've uploaded a text-based PDF (not scanned images)."
+
+    return resume_text, None
+
+
+def classify_resume_stage(resume_text):
+    """Loop 1: check the document is a resume (local classifier, LLM fallback); returns error markdown or None"""
+    logger.info("Loop 1: Validating document type")
+    is_resume, validation_message = validate_document_type(resume_text)
+    if not is_resume:
+        logger.warning(f"Uploaded file is not a resume: {validation_message}")
+        return f"## ❌ Invalid Document Type\n\n{validation_message}\n\n**Please upload a proper resume/CV document.**"
+    return None
+
+
 @log_function_call
-def process_resume_analysis(pdf_file, job_description):
-    """Main function to process resume analysis with comprehensive error handling"""
+def process_resume_analysis(pdf_file, job_description, stage=None):
+    """
+    Main function to process resume analysis with comprehensive error handling
+
+    `stage` is an optional context-manager factory (TaskProgress.stage) wrapped around
+    the extract, classify and analyze steps for progress reporting.
+    """
     start_time = time.time()
+    stage = stage or (lambda name: nullcontext())
     logger.info(f"Starting resume analysis process for file: {pdf_file}")
     logger.debug(f"Job description length: {len(job_description) if job_description else 0}")
     
     try:
-        # Validate inputs
-        logger.info("Validating inputs")
-        is_valid, error_message = validate_inputs(pdf_file, job_description)
-        if not is_valid:
-            logger.error(f"Input validation failed: {error_message}")
-            return f"## ❌ Input Validation Error\n\n{error_message}"
-
-        logger.info("Input validation successful")
-
-        # Extract text from PDF
-        logger.info("Extracting text from PDF")
-        resume_text = extract_text_from_pdf(pdf_file)
-
-        if resume_text.startswith("Error"):
-            logger.error(f"PDF processing failed: {resume_text}")
-            return f"## ❌ PDF Processing Error\n\n{resume_text}"
-
-        # Check if extracted text is meaningful
-        text_length = len(resume_text.strip())
-        logger.info(f"Extracted text length: {text_length} characters")
-        
-        if text_length < 50:
-            logger.warning(f"Extracted text too short: {text_length} characters")
-            return "## ❌ Insufficient Content\n\nThe PDF appears to contain very little text. Please ensure you've uploaded a text-based PDF (not scanned images)."
+        with stage("extract"):
+            resume_text, error = extract_resume_stage(pdf_file, job_description)
+        if error:
+            return error
 
-        # Loop 1: Check if the uploaded document is actually a resume using LLM
-        logger.info("Loop 1: Validating document type using LLM")
-        is_resume, validation_message = validate_document_type_with_llm(resume_text)
-        if not is_resume:
-            logger.warning(f"Uploaded file is not a resume: {validation_message}")
-            return f"## ❌ Invalid Document Type\n\n{validation_message}\n\n**Please upload a proper resume/CV document.**"
+        with stage("classify"):
+            error = classify_resume_stage(resume_text)
+        if error:
+            return error
 
         # Loop 2: Analyze resume
-        logger.info("Loop 2: Starting resume analysis")
-        analysis = analyze_resume(resume_text, job_description)
+        with stage("analyze"):
+            logger.info("Loop 2: Starting resume analysis")
+            analysis = analyze_resume(resume_text, job_description)
         
         duration = time.time() - start_time
         logger.info(f"Resume analysis process completed successfully in {duration:.3f}s")
-        log_performance("Complete resume analysis process", duration, f"Processed {text_length} characters of resume text")
+        log_performance("Complete resume analysis process", duration, f"Processed {len(resume_text.strip())} characters of resume text")
         
         return analysis
 
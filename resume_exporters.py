@@ -0,0 +1,377 @@
+import io
+import time
+import zipfile
+from html import escape as html_escape
+from typing import Callable, Dict, List, NamedTuple, Optional
+from xml.sax.saxutils import escape as xml_escape
+
+from utils import get_cached_result, set_cached_result
+from resume_ir import ResumeIR
+from latex_templates import DEFAULT_THEME, THEME_SETTINGS, render_latex_document
+from logging_config import get_logger, log_function_call, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+EXPORT_CACHE_VERSION = 1
+EXPORT_CACHE_TTL = 24 * 60 * 60  # outputs are keyed by content, so they only expire to free memory
+
+# Accent color per theme for the HTML export, matching the LaTeX section color
+HTML_THEME_ACCENTS = {
+    "classic": "#000000",
+    "compact": "#000000",
+    "modern": "#000080",
+}
+
+
+class ExportFormat(NamedTuple):
+    name: str
+    content_type: str
+    extension: str
+    themed: bool  # whether the output depends on the LaTeX theme
+    cached: bool  # whether export_resume keeps the output in the shared cache
+    render: Callable[[ResumeIR, str], bytes]
+
+
+EXPORT_FORMATS: Dict[str, ExportFormat] = {}
+
+
+def register_export_format(name: str, content_type: str, extension: str, themed: bool = False, cached: bool = True):
+    """Decorator registering fn(ir, theme) -> bytes as the renderer for an export format"""
+    def decorator(render: Callable[[ResumeIR, str], bytes]):
+        EXPORT_FORMATS[name] = ExportFormat(name, content_type, extension, themed, cached, render)
+        return render
+    return decorator
+
+
+def _contact_items(ir: ResumeIR) -> List[str]:
+    return [value for value in (ir.phone, ir.email, ir.linkedin, ir.github) if value]
+
+
+def _joined(*parts: str) -> str:
+    return " | ".join(part for part in parts if part)
+
+
+@register_export_format("tex", "application/x-tex", "tex", themed=True)
+def render_tex(ir: ResumeIR, theme: str) -> bytes:
+    return render_latex_document(ir.to_template_data(), theme).encode("utf-8")
+
+
+# Not export-cached: compiled PDFs already live in the content-addressed compile cache, and a
+# ReportLab fallback render must not be served as the themed PDF once pdflatex recovers
+@register_export_format("pdf", "application/pdf", "pdf", themed=True, cached=False)
+def render_pdf(ir: ResumeIR, theme: str) -> bytes:
+    """
+    Compile the themed LaTeX (the compile cache and ReportLab fallback apply as usual).
+
+    This runs pdflatex, so it belongs in a worker; views serve ResumeBuilder.pdf_file instead.
+    """
+    from pdf_generator import generate_pdf_from_latex
+
+    data = ir.to_template_data()
+    pdf_path = generate_pdf_from_latex(render_latex_document(data, theme), resume_data=data, theme=theme)
+    if not pdf_path:
+        raise RuntimeError("PDF generation failed")
+    with open(pdf_path, "rb") as f:
+        return f.read()
+
+
+@register_export_format("html", "text/html; charset=utf-8", "html", themed=True)
+def render_html(ir: ResumeIR, theme: str) -> bytes:
+    """Standalone HTML page with inline styles"""
+    accent = HTML_THEME_ACCENTS.get(theme, HTML_THEME_ACCENTS[DEFAULT_THEME])
+    font = "Helvetica, Arial, sans-serif" if theme == "modern" else "Georgia, 'Times New Roman', serif"
+    out: List[str] = [
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n",
+        f"<title>{html_escape(ir.name)} - Resume</title>\n",
+        "<style>\n",
+        f"body{{font-family:{font};max-width:800px;margin:2rem auto;padding:0 1rem;color:#111;line-height:1.35}}\n",
+        "h1{text-align:center;margin:0 0 .25rem;font-size:2rem}\n",
+        ".contact{text-align:center;margin:0 0 1rem}\n",
+        f"h2{{color:{accent};border-bottom:1px solid {accent};font-size:1.1rem;margin:1.2rem 0 .4rem;font-variant:small-caps}}\n",
+        ".row{display:flex;justify-content:space-between;gap:1rem}\n",
+        ".sub{font-style:italic;font-size:.92rem}\n",
+        "ul{margin:.2rem 0 .5rem;padding-left:1.4rem}\n",
+        "</style>\n</head>\n<body>\n",
+        f"<h1>{html_escape(ir.name)}</h1>\n",
+    ]
+
+    contact = [html_escape(ir.phone)] if ir.phone else []
+    if ir.email:
+        contact.append(f"<a href=\"mailto:{html_escape(ir.email)}\">{html_escape(ir.email)}</a>")
+    for url in (ir.linkedin, ir.github):
+        if url.startswith(("http://", "https://")):
+            contact.append(f"<a href=\"{html_escape(url)}\">{html_escape(url)}</a>")
+        elif url:
+            contact.append(html_escape(url))
+    if contact:
+        out.append(f"<p class=\"contact\">{' | '.join(contact)}</p>\n")
+
+    def row(left: str, right: str, css: str = "row") -> None:
+        tag = "strong" if css == "row" else "span"
+        out.append(f"<div class=\"{css}\"><{tag}>{html_escape(left)}</{tag}><span>{html_escape(right)}</span></div>\n")
+
+    def bullets(items) -> None:
+        if items:
+            out.append("<ul>\n")
+            out.extend(f"<li>{html_escape(item)}</li>\n" for item in items)
+            out.append("</ul>\n")
+
+    if ir.education:
+        out.append("<section>\n<h2>Education</h2>\n")
+        for edu in ir.education:
+            row(edu.institution, edu.location)
+            row(edu.degree, edu.duration, "row sub")
+        out.append("</section>\n")
+    if ir.experience:
+        out.append("<section>\n<h2>Experience</h2>\n")
+        for exp in ir.experience:
+            row(exp.title, exp.duration)
+            row(exp.company, exp.location, "row sub")
+            bullets(exp.bullets)
+            for position in exp.positions:
+                row(position.title, position.duration, "row sub")
+                bullets(position.bullets)
+        out.append("</section>\n")
+    if ir.projects:
+        out.append("<section>\n<h2>Projects</h2>\n")
+        for project in ir.projects:
+            tech = f" | <em>{html_escape(project.tech_stack)}</em>" if project.tech_stack else ""
+            out.append(f"<div class=\"row\"><span><strong>{html_escape(project.name)}</strong>{tech}</span></div>\n")
+            bullets(project.bullets)
+        out.append("</section>\n")
+    if ir.skills:
+        out.append("<section>\n<h2>Technical Skills</h2>\n")
+        for group in ir.skills:
+            out.append(f"<p><strong>{html_escape(group.category)}</strong>: {html_escape(', '.join(group.skills))}</p>\n")
+        out.append("</section>\n")
+    if ir.research_papers:
+        out.append("<section>\n<h2>Research Papers</h2>\n")
+        for paper in ir.research_papers:
+            row(paper.title, paper.year)
+            row(paper.authors, paper.journal, "row sub")
+        out.append("</section>\n")
+    for title, items in (("Achievements", ir.achievements), ("Others", ir.others)):
+        if items:
+            out.append(f"<section>\n<h2>{title}</h2>\n")
+            bullets(items)
+            out.append("</section>\n")
+
+    out.append("</body>\n</html>\n")
+    return "".join(out).encode("utf-8")
+
+
+@register_export_format("txt", "text/plain; charset=utf-8", "txt")
+def render_plain_text(ir: ResumeIR, theme: str) -> bytes:
+    """
+    ATS-friendly plain text: one fact per line, upper-case section headings and '-'
+    bullets, with no columns or tables for applicant tracking systems to misread.
+    """
+    lines: List[str] = [ir.name.upper()]
+    contact = _joined(*_contact_items(ir))
+    if contact:
+        lines.append(contact)
+
+    def section(title: str) -> None:
+        lines.extend(["", title.upper()])
+
+    def bullets(items) -> None:
+        lines.extend(f"- {item}" for item in items)
+
+    if ir.education:
+        section("Education")
+        for edu in ir.education:
+            lines.append(_joined(edu.degree, edu.institution, edu.location, edu.duration))
+    if ir.experience:
+        section("Experience")
+        for exp in ir.experience:
+            lines.append(_joined(exp.title, exp.company, exp.location, exp.duration))
+            bullets(exp.bullets)
+            for position in exp.positions:
+                lines.append(_joined(position.title, exp.company, position.duration))
+                bullets(position.bullets)
+    if ir.projects:
+        section("Projects")
+        for project in ir.projects:
+            lines.append(_joined(project.name, project.tech_stack))
+            bullets(project.bullets)
+    if ir.skills:
+        section("Skills")
+        lines.extend(f"{group.category}: {', '.join(group.skills)}" for group in ir.skills)
+    if ir.research_papers:
+        section("Research Papers")
+        for paper in ir.research_papers:
+            lines.append(_joined(paper.title, paper.authors, paper.journal, paper.year))
+    if ir.achievements:
+        section("Achievements")
+        bullets(ir.achievements)
+    if ir.others:
+        section("Others")
+        bullets(ir.others)
+
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+# Minimal WordprocessingML package, written with zipfile so no extra dependency is needed
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+_DOCX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+_DOCX_DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+_DOCX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri" w:cs="Calibri"/>'
+    '<w:sz w:val="21"/></w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="0" w:line="252" w:lineRule="auto"/></w:pPr></w:pPrDefault></w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Title"><w:name w:val="Title"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:jc w:val="center"/></w:pPr><w:rPr><w:b/><w:sz w:val="40"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Contact"><w:name w:val="Contact"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:jc w:val="center"/><w:spacing w:after="120"/></w:pPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:keepNext/><w:spacing w:before="200" w:after="60"/>'
+    '<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="auto"/></w:pBdr><w:outlineLvl w:val="0"/></w:pPr>'
+    '<w:rPr><w:b/><w:caps/><w:sz w:val="24"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="ListBullet"><w:name w:val="List Bullet"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:ind w:left="360" w:hanging="180"/></w:pPr></w:style>'
+    '</w:styles>'
+)
+_DOCX_TEXT_WIDTH = 10800  # twips: letter width minus two 0.5in margins; right-aligned tab stop
+_DOCX_ZIP_DATE = (1980, 1, 1, 0, 0, 0)  # fixed timestamps keep identical resumes byte-identical
+
+
+def _docx_run(text: str, bold: bool = False, italic: bool = False) -> str:
+    props = ("<w:b/>" if bold else "") + ("<w:i/>" if italic else "")
+    run_props = f"<w:rPr>{props}</w:rPr>" if props else ""
+    return f'<w:r>{run_props}<w:t xml:space="preserve">{xml_escape(text)}</w:t></w:r>'
+
+
+def _docx_paragraph(runs: str, style: Optional[str] = None, right_tab: bool = False) -> str:
+    props = f'<w:pStyle w:val="{style}"/>' if style else ""
+    if right_tab:
+        props += f'<w:tabs><w:tab w:val="right" w:pos="{_DOCX_TEXT_WIDTH}"/></w:tabs>'
+    return f"<w:p><w:pPr>{props}</w:pPr>{runs}</w:p>" if props else f"<w:p>{runs}</w:p>"
+
+
+@register_export_format(
+    "docx",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "docx",
+)
+def render_docx(ir: ResumeIR, theme: str) -> bytes:
+    """Word document with real heading and list styles so it stays editable"""
+    body: List[str] = [_docx_paragraph(_docx_run(ir.name), "Title")]
+    contact = _joined(*_contact_items(ir))
+    if contact:
+        body.append(_docx_paragraph(_docx_run(contact), "Contact"))
+
+    def heading(title: str) -> None:
+        body.append(_docx_paragraph(_docx_run(title), "Heading1"))
+
+    def row(left: str, right: str, sub: bool = False) -> None:
+        runs = _docx_run(left, bold=not sub, italic=sub)
+        if right:
+            runs += "<w:r><w:tab/></w:r>" + _docx_run(right, italic=sub)
+        body.append(_docx_paragraph(runs, right_tab=True))
+
+    def bullets(items) -> None:
+        body.extend(_docx_paragraph(_docx_run(f"• {item}"), "ListBullet") for item in items)
+
+    if ir.education:
+        heading("Education")
+        for edu in ir.education:
+            row(edu.institution, edu.location)
+            row(edu.degree, edu.duration, sub=True)
+    if ir.experience:
+        heading("Experience")
+        for exp in ir.experience:
+            row(exp.title, exp.duration)
+            row(exp.company, exp.location, sub=True)
+            bullets(exp.bullets)
+            for position in exp.positions:
+                row(position.title, position.duration, sub=True)
+                bullets(position.bullets)
+    if ir.projects:
+        heading("Projects")
+        for project in ir.projects:
+            runs = _docx_run(project.name, bold=True)
+            if project.tech_stack:
+                runs += _docx_run(" | ") + _docx_run(project.tech_stack, italic=True)
+            body.append(_docx_paragraph(runs))
+            bullets(project.bullets)
+    if ir.skills:
+        heading("Technical Skills")
+        for group in ir.skills:
+            body.append(_docx_paragraph(_docx_run(f"{group.category}: ", bold=True) + _docx_run(", ".join(group.skills))))
+    if ir.research_papers:
+        heading("Research Papers")
+        for paper in ir.research_papers:
+            row(paper.title, paper.year)
+            row(paper.authors, paper.journal, sub=True)
+    for title, items in (("Achievements", ir.achievements), ("Others", ir.others)):
+        if items:
+            heading(title)
+            bullets(items)
+
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+        + "".join(body)
+        + '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+        '<w:pgMar w:top="720" w:right="720" w:bottom="720" w:left="720" w:header="0" w:footer="0" w:gutter="0"/>'
+        '</w:sectPr></w:body></w:document>'
+    )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as docx:
+        for part_name, content in (
+            ("[Content_Types].xml", _DOCX_CONTENT_TYPES),
+            ("_rels/.rels", _DOCX_ROOT_RELS),
+            ("word/_rels/document.xml.rels", _DOCX_DOCUMENT_RELS),
+            ("word/styles.xml", _DOCX_STYLES),
+            ("word/document.xml", document),
+        ):
+            docx.writestr(zipfile.ZipInfo(part_name, _DOCX_ZIP_DATE), content, zipfile.ZIP_DEFLATED)
+    return buffer.getvalue()
+
+
+@log_function_call
+def export_resume(ir: ResumeIR, fmt: str, theme: Optional[str] = None) -> bytes:
+    """
+    Render a resume in one of EXPORT_FORMATS, reusing a cached output for the same content.
+
+    Raises KeyError for an unknown format; renderer errors propagate to the caller.
+    """
+    export_format = EXPORT_FORMATS[fmt]
+    theme = theme if theme in THEME_SETTINGS else DEFAULT_THEME
+    cache_theme = theme if export_format.themed else ""
+    cache_key = f"resume_export:v{EXPORT_CACHE_VERSION}:{fmt}:{cache_theme}:{ir.content_hash}"
+
+    start_time = time.time()
+    output = get_cached_result(cache_key) if export_format.cached else None
+    if output is not None:
+        log_performance(f"Resume export {fmt} (cache hit)", time.time() - start_time, f"{len(output)} bytes")
+        return output
+
+    output = export_format.render(ir, theme)
+    if export_format.cached:
+        set_cached_result(cache_key, output, EXPORT_CACHE_TTL)
+    log_performance(f"Resume export {fmt}", time.time() - start_time, f"{len(output)} bytes")
+    return output
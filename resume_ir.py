@@ -0,0 +1,261 @@
+import json
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Tuple
+
+from utils import hash_text
+from latex_templates import description_items
+from logging_config import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+RESUME_IR_VERSION = 1  # bump when the IR shape changes so cached exports are not reused
+
+
+def _text(value: Any) -> str:
+    """Collapse a field to a single clean line; missing values become ''"""
+    return " ".join(str(value).split()) if value else ""
+
+
+@dataclass(frozen=True)
+class Education:
+    institution: str
+    degree: str
+    location: str = ""
+    duration: str = ""
+
+
+@dataclass(frozen=True)
+class Position:
+    """A further role at the same company, listed under the first one"""
+    title: str
+    duration: str = ""
+    bullets: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Experience:
+    title: str
+    company: str
+    location: str = ""
+    duration: str = ""
+    bullets: Tuple[str, ...] = ()
+    positions: Tuple[Position, ...] = ()
+
+
+@dataclass(frozen=True)
+class Project:
+    name: str
+    tech_stack: str = ""
+    bullets: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class SkillGroup:
+    category: str
+    skills: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ResearchPaper:
+    title: str
+    authors: str = ""
+    journal: str = ""
+    year: str = ""
+
+
+@dataclass(frozen=True)
+class ResumeIR:
+    """
+    Format-independent resume: every exporter (LaTeX/PDF, HTML, DOCX, plain text) reads
+    this instead of the raw JSON fields, so entries are normalized exactly once.
+    """
+    name: str
+    email: str = ""
+    phone: str = ""
+    linkedin: str = ""
+    github: str = ""
+    education: Tuple[Education, ...] = ()
+    experience: Tuple[Experience, ...] = ()
+    projects: Tuple[Project, ...] = ()
+    skills: Tuple[SkillGroup, ...] = ()
+    research_papers: Tuple[ResearchPaper, ...] = ()
+    achievements: Tuple[str, ...] = ()
+    others: Tuple[str, ...] = ()
+
+    @cached_property
+    def content_hash(self) -> str:
+        """Stable hash of the content; the cache key for every rendered format"""
+        payload = json.dumps(asdict(self), sort_keys=True)
+        return hash_text(f"resume_ir:v{RESUME_IR_VERSION}", payload)
+
+    def to_template_data(self) -> Dict[str, Any]:
+        """The dict shape latex_templates and resume_pdf_renderer consume"""
+        return {
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "linkedin": self.linkedin,
+            "github": self.github,
+            "education": [asdict(edu) for edu in self.education],
+            "experience": [
+                {
+                    "title": exp.title,
+                    "company": exp.company,
+                    "location": exp.location,
+                    "duration": exp.duration,
+                    "description": list(exp.bullets),
+                    "positions": [
+                        {"title": pos.title, "duration": pos.duration, "description": list(pos.bullets)}
+                        for pos in exp.positions
+                    ],
+                }
+                for exp in self.experience
+            ],
+            "projects": [
+                {"name": project.name, "tech_stack": project.tech_stack, "description": list(project.bullets)}
+                for project in self.projects
+            ],
+            "skills": {group.category: list(group.skills) for group in self.skills},
+            "research_papers": [asdict(paper) for paper in self.research_papers],
+            "achievements": list(self.achievements),
+            "others": list(self.others),
+        }
+
+
+def _dict_entries(entries: Any, section: str) -> Iterable[Dict[str, Any]]:
+    if not isinstance(entries, list):
+        return []
+    valid = [entry for entry in entries if isinstance(entry, dict)]
+    if len(valid) != len(entries):
+        logger.warning(f"Skipped {len(entries) - len(valid)} malformed {section} entries")
+    return valid
+
+
+def _build_skills(skills: Any) -> Tuple[SkillGroup, ...]:
+    if not isinstance(skills, dict):
+        return ()
+    groups: List[SkillGroup] = []
+    for category, skill_list in skills.items():
+        if isinstance(skill_list, str):
+            skill_list = [skill_list]
+        cleaned = tuple(_text(skill) for skill in skill_list or [] if _text(skill))
+        if _text(category) and cleaned:
+            groups.append(SkillGroup(category=_text(category), skills=cleaned))
+    return tuple(groups)
+
+
+def build_resume_ir(data: Dict[str, Any]) -> ResumeIR:
+    """
+    Build the IR from resume data in the builder's JSON shape.
+
+    Applies the same rules the LaTeX templates always did: education needs an institution
+    and degree, experience a title and company, projects a name and papers a title;
+    descriptions are split into bullets with their markers stripped.
+    """
+    education = tuple(
+        Education(
+            institution=_text(edu.get("institution")),
+            degree=_text(edu.get("degree")),
+            location=_text(edu.get("location")),
+            duration=_text(edu.get("duration")),
+        )
+        for edu in _dict_entries(data.get("education"), "education")
+        if edu.get("institution") and edu.get("degree")
+    )
+
+    experience = tuple(
+        Experience(
+            title=_text(exp.get("title")),
+            company=_text(exp.get("company")),
+            location=_text(exp.get("location")),
+            duration=_text(exp.get("duration")),
+            bullets=tuple(description_items(exp.get("description"))),
+            positions=tuple(
+                Position(
+                    title=_text(pos.get("title")),
+                    duration=_text(pos.get("duration")),
+                    bullets=tuple(description_items(pos.get("description"))),
+                )
+                for pos in _dict_entries(exp.get("positions") or [], "position")
+                if pos.get("title")
+            ),
+        )
+        for exp in _dict_entries(data.get("experience"), "experience")
+        if exp.get("title") and exp.get("company")
+    )
+
+    projects = tuple(
+        Project(
+            name=_text(project.get("name")),
+            tech_stack=_text(project.get("tech_stack")),
+            bullets=tuple(description_items(project.get("description"))),
+        )
+        for project in _dict_entries(data.get("projects"), "project")
+        if project.get("name")
+    )
+
+    research_papers = tuple(
+        ResearchPaper(
+            title=_text(paper.get("title")),
+            authors=_text(paper.get("authors")),
+            journal=_text(paper.get("journal")),
+            year=_text(paper.get("year")),
+        )
+        for paper in _dict_entries(data.get("research_papers"), "research paper")
+        if paper.get("title")
+    )
+
+    def _items(value: Any) -> Tuple[str, ...]:
+        return tuple(description_items(list(value))) if isinstance(value, list) else ()
+
+    return ResumeIR(
+        name=_text(data.get("name")),
+        email=_text(data.get("email")),
+        phone=_text(data.get("phone")),
+        linkedin=_text(data.get("linkedin")),
+        github=_text(data.get("github")),
+        education=education,
+        experience=experience,
+        projects=projects,
+        skills=_build_skills(data.get("skills")),
+        research_papers=research_papers,
+        achievements=_items(data.get("achievements")),
+        others=_items(data.get("others")),
+    )
+
+
+def resume_ir_from_model(resume) -> ResumeIR:
+    """Build the IR from a ResumeBuilder record's fields"""
+    return build_resume_ir({
+        "name": resume.name,
+        "email": resume.email,
+        "phone": resume.phone,
+        "linkedin": resume.linkedin,
+        "github": resume.github,
+        "education": resume.education,
+        "experience": resume.experience,
+        "projects": resume.projects,
+        "skills": resume.skills,
+        "research_papers": resume.research_papers,
+        "achievements": resume.achievements,
+        "others": resume.others,
+    })
+
+
+def validate_resume_ir(resume_ir: ResumeIR) -> List[Tuple[str, str]]:
+    """
+    Check that a resume has what every format needs.
+
+    Returns (field, message) pairs, empty when the resume is valid, so forms can attach
+    each error to its field.
+    """
+    errors: List[Tuple[str, str]] = []
+    if len(resume_ir.name) < 2:
+        errors.append(("name", "Name must be at least 2 characters long"))
+    if not resume_ir.education:
+        errors.append(("education", "Please provide at least one education entry with an institution and degree"))
+    if not resume_ir.skills:
+        errors.append(("skills", "Please provide your skills"))
+    return errors
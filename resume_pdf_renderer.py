@@ -0,0 +1,238 @@
+import io
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from latex_templates import DEFAULT_THEME, SECTION_RENDERERS, description_items
+from logging_config import get_logger, log_function_call, log_file_operation, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# A section renders to plain "blocks" - (kind, text, ...) tuples of ReportLab markup - which are
+# cheap to cache and pickle; flowables are rebuilt from them for every document
+Block = Tuple[str, ...]
+
+SECTION_ORDER = ["heading"] + [section for section, _ in SECTION_RENDERERS]
+SECTION_TITLES = {
+    "education": "Education",
+    "experience": "Experience",
+    "projects": "Projects",
+    "skills": "Technical Skills",
+    "research_papers": "Research Papers",
+    "achievements": "Achievements",
+    "others": "Others",
+}
+
+# Accent color per LaTeX theme so previews look like the final PDF
+THEME_ACCENTS = {
+    "classic": "#000000",
+    "compact": "#000000",
+    "modern": "#000080",
+}
+PAGE_MARGIN_INCHES = 0.5
+
+# Styles are built once per theme and shared by every render in the process
+_styles_cache: Dict[str, Dict[str, Any]] = {}
+_styles_lock = threading.Lock()
+
+
+def _markup(text: Any) -> str:
+    """Escape text for ReportLab paragraph markup"""
+    return escape(" ".join(str(text).split())) if text else ""
+
+
+def _get_styles(theme: str) -> Dict[str, Any]:
+    styles = _styles_cache.get(theme)
+    if styles is not None:
+        return styles
+
+    with _styles_lock:
+        styles = _styles_cache.get(theme)
+        if styles is not None:
+            return styles
+
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+        from reportlab.lib.styles import ParagraphStyle
+
+        accent = colors.HexColor(THEME_ACCENTS.get(theme, THEME_ACCENTS[DEFAULT_THEME]))
+        base_size = 9.5 if theme == "compact" else 10
+        font = "Helvetica" if theme == "modern" else "Times-Roman"
+        bold_font = "Helvetica-Bold" if theme == "modern" else "Times-Bold"
+        italic_font = "Helvetica-Oblique" if theme == "modern" else "Times-Italic"
+
+        styles = {
+            "name": ParagraphStyle("ResumeName", fontName=bold_font, fontSize=base_size + 14, leading=base_size + 18, alignment=TA_CENTER),
+            "contact": ParagraphStyle("ResumeContact", fontName=font, fontSize=base_size - 0.5, leading=base_size + 3, alignment=TA_CENTER, spaceAfter=4),
+            "section": ParagraphStyle("ResumeSection", fontName=bold_font, fontSize=base_size + 2, leading=base_size + 5, textColor=accent, spaceBefore=8, spaceAfter=1),
+            "row_left": ParagraphStyle("ResumeRowLeft", fontName=bold_font, fontSize=base_size, leading=base_size + 2),
+            "row_right": ParagraphStyle("ResumeRowRight", fontName=font, fontSize=base_size, leading=base_size + 2, alignment=TA_RIGHT),
+            "sub_left": ParagraphStyle("ResumeSubLeft", fontName=italic_font, fontSize=base_size - 1, leading=base_size + 1),
+            "sub_right": ParagraphStyle("ResumeSubRight", fontName=italic_font, fontSize=base_size - 1, leading=base_size + 1, alignment=TA_RIGHT),
+            "bullet": ParagraphStyle("ResumeBullet", fontName=font, fontSize=base_size - 0.5, leading=base_size + 1.5, leftIndent=14, bulletIndent=4),
+            "line": ParagraphStyle("ResumeLine", fontName=font, fontSize=base_size - 0.5, leading=base_size + 2, leftIndent=4),
+            "accent": accent,
+        }
+        _styles_cache[theme] = styles
+        return styles
+
+
+def _description_blocks(description: Any) -> List[Block]:
+    return [("bullet", _markup(item)) for item in description_items(description)]
+
+
+def build_section_blocks(section: str, data: Dict[str, Any]) -> List[Block]:
+    """
+    Turn one section of resume data (the dict generate_latex_resume consumes) into blocks.
+
+    Depends only on that section's data, so callers can cache the result per section.
+    """
+    if section == "heading":
+        blocks: List[Block] = [("name", _markup(data.get("name")))]
+        contact = [_markup(data.get(field)) for field in ["phone", "email", "linkedin", "github"] if data.get(field)]
+        if contact:
+            blocks.append(("contact", " | ".join(contact)))
+        return blocks
+
+    entries = data.get(section)
+    if not entries:
+        return []
+
+    blocks = [("section", _markup(SECTION_TITLES[section]))]
+    if section == "education":
+        for edu in entries:
+            if isinstance(edu, dict) and edu.get("institution") and edu.get("degree"):
+                blocks.append(("row", _markup(edu.get("institution")), _markup(edu.get("location"))))
+                blocks.append(("subrow", _markup(edu.get("degree")), _markup(edu.get("duration"))))
+    elif section == "experience":
+        for exp in entries:
+            if not isinstance(exp, dict) or not exp.get("title") or not exp.get("company"):
+                continue
+            blocks.append(("row", _markup(exp.get("title")), _markup(exp.get("duration"))))
+            blocks.append(("subrow", _markup(exp.get("company")), _markup(exp.get("location"))))
+            blocks.extend(_description_blocks(exp.get("description")))
+            for position in exp.get("positions") or []:
+                if isinstance(position, dict) and position.get("title"):
+                    blocks.append(("subrow", _markup(position.get("title")), _markup(position.get("duration"))))
+                    blocks.extend(_description_blocks(position.get("description")))
+    elif section == "projects":
+        for project in entries:
+            if not isinstance(project, dict) or not project.get("name"):
+                continue
+            tech_stack = f" | <i>{_markup(project['tech_stack'])}</i>" if project.get("tech_stack") else ""
+            blocks.append(("row", f"{_markup(project['name'])}{tech_stack}", ""))
+            blocks.extend(_description_blocks(project.get("description")))
+    elif section == "skills":
+        for category, skill_list in entries.items():
+            if isinstance(skill_list, str):
+                skill_list = [skill_list]
+            skill_list = [str(skill).strip() for skill in skill_list or [] if str(skill).strip()]
+            if skill_list:
+                blocks.append(("line", f"<b>{_markup(category)}</b>: {_markup(', '.join(skill_list))}"))
+    elif section == "research_papers":
+        for paper in entries:
+            if isinstance(paper, dict) and paper.get("title"):
+                blocks.append(("row", _markup(paper.get("title")), _markup(paper.get("year"))))
+                blocks.append(("subrow", _markup(paper.get("authors")), _markup(paper.get("journal"))))
+    else:
+        blocks.extend(("line", _markup(item)) for item in description_items(list(entries)))
+
+    return blocks if len(blocks) > 1 else []
+
+
+def build_resume_blocks(data: Dict[str, Any]) -> List[List[Block]]:
+    """Blocks for every section, in document order"""
+    return [build_section_blocks(section, data) for section in SECTION_ORDER]
+
+
+def _blocks_to_flowables(section_blocks: List[List[Block]], styles: Dict[str, Any], content_width: float) -> list:
+    from reportlab.platypus import HRFlowable, Paragraph, Table, TableStyle
+
+    row_table_style = TableStyle([
+        ("LEFTPADDING", (0, 0), (-1, -1), 0),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+        ("TOPPADDING", (0, 0), (-1, -1), 0),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ])
+    column_widths = [content_width * 0.7, content_width * 0.3]
+
+    story = []
+    for blocks in section_blocks:
+        for block in blocks:
+            kind = block[0]
+            if kind in ("row", "subrow"):
+                prefix = "row" if kind == "row" else "sub"
+                table = Table(
+                    [[Paragraph(block[1], styles[f"{prefix}_left"]), Paragraph(block[2], styles[f"{prefix}_right"])]],
+                    colWidths=column_widths,
+                )
+                table.setStyle(row_table_style)
+                story.append(table)
+            elif kind == "bullet":
+                story.append(Paragraph(block[1], styles["bullet"], bulletText="•"))
+            elif kind == "section":
+                story.append(Paragraph(block[1], styles["section"]))
+                story.append(HRFlowable(width="100%", thickness=0.6, color=styles["accent"], spaceBefore=0, spaceAfter=3))
+            else:
+                story.append(Paragraph(block[1], styles[kind]))
+    return story
+
+
+def render_blocks_to_pdf(section_blocks: List[List[Block]], theme: Optional[str] = None) -> bytes:
+    """Lay out pre-built section blocks as a letter-size PDF and return its bytes"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate
+
+    theme = theme if theme in THEME_ACCENTS else DEFAULT_THEME
+    styles = _get_styles(theme)
+    margin = PAGE_MARGIN_INCHES * inch
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        leftMargin=margin,
+        rightMargin=margin,
+        topMargin=margin,
+        bottomMargin=margin,
+        title="Resume",
+        author="HireVision",
+    )
+    doc.build(_blocks_to_flowables(section_blocks, styles, letter[0] - 2 * margin))
+    return buffer.getvalue()
+
+
+@log_function_call
+def render_resume_pdf(data: Dict[str, Any], theme: Optional[str] = None, output_path: Optional[str] = None):
+    """
+    Render resume data straight to PDF with ReportLab, without LaTeX.
+
+    Returns the PDF bytes, or output_path after writing them there. Returns None if
+    ReportLab is unavailable or rendering fails.
+    """
+    start_time = time.time()
+    try:
+        pdf_bytes = render_blocks_to_pdf(build_resume_blocks(data), theme)
+    except ImportError:
+        logger.error("ReportLab not available for fast PDF rendering")
+        return None
+    except Exception as e:
+        logger.error(f"Fast PDF rendering failed after {time.time() - start_time:.3f}s: {str(e)}", exc_info=True)
+        return None
+
+    duration = time.time() - start_time
+    log_performance("Fast PDF render", duration, f"Generated {len(pdf_bytes)} bytes")
+
+    if output_path is None:
+        return pdf_bytes
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "wb") as f:
+        f.write(pdf_bytes)
+    log_file_operation("Fast PDF render", output_path, success=True, file_size=len(pdf_bytes))
+    return output_path
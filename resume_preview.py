@@ -0,0 +1,80 @@
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from utils import hash_text, get_cached_result, set_cached_result
+from resume_pdf_renderer import SECTION_ORDER, build_section_blocks, render_blocks_to_pdf
+from logging_config import get_logger, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+PREVIEW_CACHE_VERSION = 1
+PREVIEW_SECTION_CACHE_TTL = 60 * 60  # an editing session; blocks are cheap to rebuild afterwards
+PREVIEW_PDF_CACHE_TTL = 10 * 60
+PREVIEW_MIN_INTERVAL = 0.75  # seconds between previews per client; faster edits get 429
+PREVIEW_MAX_BYTES = 64 * 1024  # request body limit for preview data
+
+# Fields that make up the heading section
+_HEADING_FIELDS = ["name", "email", "phone", "linkedin", "github"]
+
+
+def _section_input(section: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    if section == "heading":
+        return {field: data.get(field) for field in _HEADING_FIELDS}
+    return {section: data.get(section)}
+
+
+def _section_key(section: str, section_input: Dict[str, Any]) -> str:
+    payload = json.dumps(section_input, sort_keys=True, default=str)
+    return f"resume_preview_section:v{PREVIEW_CACHE_VERSION}:{section}:{hash_text(payload)}"
+
+
+def check_preview_debounce(client_key: str) -> float:
+    """
+    Record a preview request for a client.
+
+    Returns 0 when the preview may proceed, otherwise the seconds to wait before retrying.
+    Best-effort: two requests racing within the same instant may both pass.
+    """
+    debounce_key = f"resume_preview_last:{hash_text(client_key)}"
+    now = time.time()
+    last_request = get_cached_result(debounce_key)
+    if last_request is not None and now - last_request < PREVIEW_MIN_INTERVAL:
+        return PREVIEW_MIN_INTERVAL - (now - last_request)
+    set_cached_result(debounce_key, now, 60)
+    return 0
+
+
+def render_resume_preview(data: Dict[str, Any], theme: Optional[str] = None) -> Tuple[bytes, Dict[str, int]]:
+    """
+    Render a preview PDF for partial resume data.
+
+    Only sections whose data changed since the last preview are rebuilt; the rest come
+    from the section cache. Returns (pdf_bytes, {'rendered': n, 'cached': n}).
+    """
+    start_time = time.time()
+    stats = {"rendered": 0, "cached": 0}
+
+    section_blocks = []
+    for section in SECTION_ORDER:
+        key = _section_key(section, _section_input(section, data))
+        blocks = get_cached_result(key)
+        if blocks is None:
+            blocks = build_section_blocks(section, data)
+            set_cached_result(key, blocks, PREVIEW_SECTION_CACHE_TTL)
+            stats["rendered"] += 1
+        else:
+            stats["cached"] += 1
+        section_blocks.append(blocks)
+
+    # Unchanged content (e.g. switching back and forth between steps) skips layout entirely
+    pdf_key = f"resume_preview_pdf:v{PREVIEW_CACHE_VERSION}:{hash_text(str(theme), json.dumps(section_blocks))}"
+    pdf_bytes = get_cached_result(pdf_key)
+    if pdf_bytes is None:
+        pdf_bytes = render_blocks_to_pdf(section_blocks, theme)
+        set_cached_result(pdf_key, pdf_bytes, PREVIEW_PDF_CACHE_TTL)
+
+    duration = time.time() - start_time
+    log_performance("Resume preview", duration, f"{stats['rendered']} sections rendered, {stats['cached']} cached, {len(pdf_bytes)} bytes")
+    return pdf_bytes, stats
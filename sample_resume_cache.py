@@ -0,0 +1,70 @@
+import hashlib
+import os
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from logging_config import get_logger, log_performance
+
+# Initialize logger
+logger = get_logger(__name__)
+
+SAMPLE_RESUME_MAX_AGE = 24 * 60 * 60  # the sample only changes on deploy, which restarts every process
+
+
+class SampleResume(NamedTuple):
+    content: bytes
+    etag: str  # strong validator derived from the bytes
+    last_modified: float
+    path: str
+
+
+_sample: Optional[SampleResume] = None
+_sample_lock = threading.Lock()
+
+
+def load_sample_resume() -> Optional[SampleResume]:
+    """
+    Read the sample resume PDF into memory.
+
+    Called on the first sample request in each web process; workers never load it. The PDF
+    is shipped in pdfs/ and regenerated on deploy by the compile_resumes command, so nothing
+    is compiled here. Returns None if no sample is available.
+    """
+    global _sample
+    from pdf_generator import get_sample_pdf_path
+
+    start_time = time.time()
+    with _sample_lock:
+        if _sample is not None:
+            return _sample
+
+        sample_path = get_sample_pdf_path()
+        if not sample_path:
+            logger.warning("Sample resume unavailable")
+            return None
+
+        try:
+            with open(sample_path, "rb") as f:
+                content = f.read()
+            last_modified = os.path.getmtime(sample_path)
+        except OSError as e:
+            logger.error(f"Could not load sample resume {sample_path}: {str(e)}")
+            return None
+
+        _sample = SampleResume(
+            content=content,
+            etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+            last_modified=last_modified,
+            path=sample_path,
+        )
+
+    log_performance("Sample resume load", time.time() - start_time, f"{len(content)} bytes from {sample_path}")
+    return _sample
+
+
+def get_sample_resume() -> Optional[SampleResume]:
+    """The in-memory sample resume, loaded on first use"""
+    if _sample is not None:
+        return _sample
+    return load_sample_resume()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Script to start one Dramatiq worker pool per queue class (LLM, compile, maintenance)
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+
+from hirevision.queues import WORKER_POOLS
+
+
+def build_command(pool):
+    """dramatiq command line for one pool"""
+    return [
+        sys.executable, "-m", "dramatiq", "hirevision.tasks",
+        "--queues", *pool["queues"],
+        "--processes", str(pool["processes"]),
+        "--threads", str(pool["threads"]),
+    ]
+
+
+def stop_all(workers, sig=signal.SIGTERM):
+    """Ask every running pool to shut down and wait for it"""
+    for process in workers.values():
+        if process.poll() is None:
+            process.send_signal(sig)
+    for process in workers.values():
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Start HireVision Dramatiq worker pools")
+    parser.add_argument("--pools", nargs="+", choices=sorted(WORKER_POOLS), default=sorted(WORKER_POOLS),
+                        help="pools to start (default: all)")
+    parser.add_argument("--dry-run", action="store_true", help="print the worker commands without running them")
+    args = parser.parse_args()
+
+    print("🚀 Starting HireVision worker pools")
+    print("=" * 50)
+    for name in args.pools:
+        pool = WORKER_POOLS[name]
+        print(f"⚙️  {name}: queues={','.join(pool['queues'])} processes={pool['processes']} threads={pool['threads']}")
+    print("=" * 50)
+
+    if args.dry_run:
+        for name in args.pools:
+            print(" ".join(build_command(WORKER_POOLS[name])))
+        return 0
+
+    workers = {name: subprocess.Popen(build_command(WORKER_POOLS[name])) for name in args.pools}
+
+    def forward(signum, frame):
+        print(f"\n🛑 Stopping worker pools (signal {signum})")
+        stop_all(workers, signum)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, forward)
+    if os.name != "nt":
+        signal.signal(signal.SIGHUP, forward)
+
+    # A pool that dies takes the others down so a supervisor restarts the whole set
+    try:
+        while True:
+            for name, process in workers.items():
+                code = process.poll()
+                if code is not None:
+                    print(f"\n❌ Worker pool '{name}' exited with code {code}, stopping the others")
+                    stop_all(workers)
+                    return code or 1
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n\n🛑 Worker pools stopped by user")
+        stop_all(workers, signal.SIGINT)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ import json
 import re
 import time
 import os
+import hashlib
 from typing import Dict, Any, Optional, Tuple
 from openai import OpenAI
 from config import (
@@ -159,6 +160,11 @@ def create_error_analysis(error_message: str) -> Dict[str, Any]:
     }
 
 
+def is_error_analysis(analysis: Any) -> bool:
+    """Whether an analysis result is the placeholder built by create_error_analysis"""
+    return isinstance(analysis, dict) and analysis.get("ats_score") == "Error"
+
+
 def truncate_text(text: str, max_length: int = 500) -> str:
     """Truncate text to a maximum length with ellipsis"""
     if not text:
@@ -482,3 +488,47 @@ def make_api_call(messages, system_message=None):
         api_duration = time.time() - start_time
         logger.error(f"API call failed after {api_duration:.3f}s: {str(e)}", exc_info=True)
         raise e
+
+
+def hash_text(*parts: str) -> str:
+    """Build a stable SHA-256 hex digest from one or more text parts"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def get_cached_result(key: str) -> Optional[Any]:
+    """
+    Read a value from the shared Django cache.
+
+    Caching is an optimization only, so any backend error is logged and
+    treated as a cache miss.
+    """
+    try:
+        from django.core.cache import cache
+
+        value = cache.get(key)
+        logger.debug(f"Cache {'hit' if value is not None else 'miss'} for key: {key}")
+        return value
+    except Exception as e:
+        logger.warning(f"Cache read failed for key {key}: {str(e)}")
+        return None
+
+
+def set_cached_result(key: str, value: Any, timeout: Optional[int] = None) -> bool:
+    """
+    Store a value in the shared Django cache.
+
+    Returns False instead of raising when the cache backend is unavailable.
+    """
+    try:
+        from django.core.cache import cache
+
+        cache.set(key, value, timeout)
+        logger.debug(f"Cached value for key: {key} (timeout: {timeout})")
+        return True
+    except Exception as e:
+        logger.warning(f"Cache write failed for key {key}: {str(e)}")
+        return False